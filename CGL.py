@@ -12,13 +12,44 @@ Here is the description of the game from Wikipedia (https://en.wikipedia.org/wik
     One interacts with the Game of Life by creating an initial configuration and observing how it evolves.
     It is Turing complete and can simulate a universal constructor or any other Turing machine.
 """
-import tkinter
-from tkinter import filedialog
+import argparse
 import random
 import time
 from timeit import default_timer as timer
 from datetime import datetime
+from collections import deque, namedtuple
+from array import array
 import pathlib
+import os
+import multiprocessing
+import threading
+import queue
+import mmap
+import itertools
+import hashlib
+import json
+import re
+import signal
+import sqlite3
+import tempfile
+import socketserver
+import sys
+import struct
+import zlib
+from multiprocessing import shared_memory
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Only needed for the graphical user interface, the headless mode runs without it
+try:
+    import tkinter
+    from tkinter import filedialog
+except ImportError:
+    tkinter = None
+    filedialog = None
 
 VERBOSE = False
 PRINT_INTRO = False
@@ -27,11 +58,80 @@ DEFAULT_CANVAS_WIDTH = DEFAULT_CANVAS_HEIGHT
 DEFAULT_MAX_FRAMERATE = 30
 DEFAULT_MIN_SEED_PERCENT = 5
 DEFAULT_MAX_SEED_PERCENT = 20
+SIMULATION_ENGINE = "python"
+BOUNDARY_MODES = ("dead", "torus", "klein", "legacy")
+DEFAULT_BOUNDARY_MODE = "dead"
+DEFAULT_RULE = "B3/S23"
+DEFAULT_HASHLIFE_MAX_NODES = 1000000
+DEFAULT_PARALLEL_WORKERS = os.cpu_count() or 1
+PARALLEL_COMMAND_STEP = 0
+PARALLEL_COMMAND_STOP = 1
+CYCLE_DETECTION_WINDOW = 64
+RENDERER = "bitmap"
+BITMAP_TAG = "bitmap"
+CELL_TAG = "cell"
+LIVING_CELL_PIXEL = bytes((0, 128, 0))
+DEAD_CELL_PIXEL = bytes((0, 0, 0))
+BITMAP_REDRAW_FRACTION = 64
+FRAME_QUEUE_SIZE = 8
+MAX_VIEWPORT_HEIGHT = 600
+MAX_VIEWPORT_WIDTH = 800
+MIN_ZOOM = -5
+MAX_ZOOM = 5
+SEED_TAG = "seed"
+RENDER_MODES = ("cells", "age", "activity")
+DEFAULT_RENDER_MODE = "cells"
+HISTORY_LIMIT = 127
+REWIND_KEYFRAME_INTERVAL = 64
+REWIND_MEMORY_BUDGET = 64 * 1024 * 1024
+HISTORY_REFRESH_INTERVAL = 64
+ACTIVITY_DECAY = 32
+AGE_COLOURS = ((0, (255, 255, 128)), (8, (0, 192, 0)), (32, (0, 128, 128)), (HISTORY_LIMIT, (48, 48, 160)))
+HOT_LIVING_CELL_PIXEL = bytes((255, 255, 0))
+HOT_DEAD_CELL_PIXEL = bytes((255, 64, 0))
+LIVING_KEY_TABLE = bytes((0, 128)) + bytes(254)
+BRUSH_SIZES = (1, 3, 5, 9)
+STAMPS = {
+    "Glider": ((0, 1), (1, 2), (2, 0), (2, 1), (2, 2)),
+    "Lightweight spaceship": ((0, 1), (0, 4), (1, 0), (2, 0), (2, 4), (3, 0), (3, 1), (3, 2), (3, 3)),
+    "R-pentomino": ((0, 1), (0, 2), (1, 0), (1, 1), (2, 1)),
+    "Acorn": ((0, 1), (1, 3), (2, 0), (2, 1), (2, 4), (2, 5), (2, 6)),
+    "Gosper glider gun": ((0, 24), (1, 22), (1, 24), (2, 12), (2, 13), (2, 20), (2, 21), (2, 34), (2, 35), (3, 11),
+                          (3, 15), (3, 20), (3, 21), (3, 34), (3, 35), (4, 0), (4, 1), (4, 10), (4, 16), (4, 20),
+                          (4, 21), (5, 0), (5, 1), (5, 10), (5, 14), (5, 16), (5, 17), (5, 22), (5, 24), (6, 10),
+                          (6, 16), (6, 24), (7, 11), (7, 15), (8, 12), (8, 13))
+}
+EXPORT_COMPRESSION_LEVEL = 6
+GIF_MINIMUM_CODE_SIZE = 2
+DEFAULT_STREAM_HOST = "127.0.0.1"
+STREAM_QUEUE_SIZE = 64
+STREAM_SEND_TIMEOUT = 5
+STREAM_KEYFRAME = b"K"
+STREAM_DELTA = b"D"
+STREAM_END = b"E"
+BINARY_SEED_EXTENSION = ".bseed"
+BINARY_SEED_MAGIC = b"CGLBSEED"
+BINARY_SEED_HEADER = struct.Struct("<8sB3xIIQ16s32s4x")
+BINARY_SEED_CELLS = 0
+BINARY_SEED_BITS = 1
+CHECKPOINT_EXTENSION = ".checkpoint"
+CHECKPOINT_MAGIC = b"CGLCHECK"
+CHECKPOINT_HEADER = struct.Struct("<QI")
+CHECKPOINT_COMPRESSION_LEVEL = 6
+CHECKPOINT_POLL_GENERATIONS = 64
+SEED_CATALOG_PATH = "seeds/catalog.sqlite3"
+SEED_EXTENSIONS = (".seed", BINARY_SEED_EXTENSION)
+PATTERN_FORMATS = {".rle": "rle", ".lif": "life106", ".life": "life106", ".cells": "plaintext"}
+PATTERN_CHUNK_SIZE = 1 << 16
+RLE_LINE_LENGTH = 70
+RLE_TOKEN = re.compile(r"(\d*)([^\d\s]?)")
+PLAINTEXT_LIVING_RUN = re.compile(r"[O*]+")
 
 
 def main():
     """
-    Initializes. Then starts the game loop, from within another game loop can be called.
+    Initializes. Then starts the first simulation and hands over to the tkinter main loop,
+    from within which the game loop is called again to start other simulations.
     :return: None
     """
     # Intro message
@@ -41,18 +141,13 @@ def main():
     # Initialization
     if VERBOSE:
         print("Starting initialization")
-    drawn_cells, pause_signal, canvas, restart_button, pause_button, current_seed, canvas_height_input,\
-        canvas_width_input, next_frame_signal, next_frame_button, max_framerate, min_auto_seed_percent,\
-        max_auto_seed_percent, draw_seed_or_not, grid, button_apply_drawn_seed,\
-        is_button_apply_drawn_seed_pressed, generation_counter, shutting_down, window = initialize()
+    controls = initialize()
     if VERBOSE:
         print("Initialization done")
 
     # Game loop
-    game_loop(min_auto_seed_percent, max_auto_seed_percent, drawn_cells, canvas, max_framerate, pause_signal,
-              pause_button, "new", current_seed, canvas_height_input, canvas_width_input, next_frame_signal,
-              next_frame_button, draw_seed_or_not, grid, button_apply_drawn_seed, is_button_apply_drawn_seed_pressed,
-              generation_counter, shutting_down, window)
+    game_loop(controls, "new")
+    controls.window.mainloop()
 
 
 def print_intro():
@@ -85,105 +180,140 @@ def print_intro():
     print("To disable this intro message, change the global variable PRINT_INTRO to False")
 
 
-def initialize():
+class SimulationControls(namedtuple("SimulationControls", (
+        "window", "canvas", "drawn_cells", "grid", "current_seed", "canvas_height_input", "canvas_width_input",
+        "min_auto_seed_percent", "max_auto_seed_percent", "max_framerate", "boundary_mode", "rule", "pause_signal",
+        "pause_button", "next_frame_signal", "next_frame_button", "jump_target", "pause_when_stable",
+        "draw_seed_or_not", "button_apply_drawn_seed", "is_button_apply_drawn_seed_pressed", "generation_counter",
+        "stability_counter", "shutting_down", "simulation_number", "turbo", "speed_counter",
+        "viewport", "brush", "render_mode", "seed_grid", "checkpoint_signal", "seed_generation",
+        "rewind_target", "timeline"))):
     """
-    Instantiates a couple of variables which will be used later
-    :return: drawn_cells (dict), pause_signal (Signal), canvas (tkinter.Canvas),
-    button_new_sim (tkinter.Button), button_pause_sim (tkinter.Button), current_seed (list),
-    canvas_height_input (tkinter.Entry), canvas_width_input (tkinter.Entry), next_frame_signal (Signal),
-    next_frame_button (tkinter.Button), max_framerate (tkinter.IntVar), min_auto_seed_percent (tkinter.IntVar),
-    max_auto_seed_percent (tkinter.IntVar), draw_seed_or_not (tkinter.BooleanVar), grid (list of lists),
-    button_apply_drawn_seed (tkinter.Button), is_button_apply_drawn_seed_pressed (tkinter.BooleanVar),
-    generation_counter (tkinter.Label), shutting_down (tkinter.BooleanVar), window (tkinter.Tk)
-    """
-    drawn_cells = {}
-    current_seed = []
-    grid = []
-
-    # Creates the graphical window
-    canvas, button_new_sim, button_pause_sim, canvas_height_input,\
-        canvas_width_input, next_frame_button, min_auto_seed_percent,\
-        max_auto_seed_percent, max_framerate, pause_signal, next_frame_signal,\
-        draw_seed_or_not, button_apply_drawn_seed,\
-        is_button_apply_drawn_seed_pressed,\
-        generation_counter, shutting_down,\
-        window = create_gui("Conway's Game of Life", drawn_cells, current_seed, grid)
-
-    return drawn_cells, pause_signal, canvas, button_new_sim, button_pause_sim, current_seed,\
-        canvas_height_input, canvas_width_input, next_frame_signal, next_frame_button, max_framerate,\
-        min_auto_seed_percent, max_auto_seed_percent, draw_seed_or_not, grid, button_apply_drawn_seed,\
-           is_button_apply_drawn_seed_pressed, generation_counter, shutting_down, window
-
-
-def game_loop(min_auto_seed_percent, max_auto_seed_percent, drawn_cells, canvas, max_framerate, pause_signal,
-              pause_button, mode, current_seed, canvas_height_input, canvas_width_input, next_frame_signal,
-              next_frame_button, draw_seed_or_not, grid, button_apply_drawn_seed, is_button_apply_drawn_seed_pressed,
-              generation_counter, shutting_down, window):
-    """
-    Creates and runs a simulation
-    :param min_auto_seed_percent: The minimum percentage of the grid which will be alive initially
-    :type min_auto_seed_percent: tkinter.IntVar
-    :param max_auto_seed_percent: The maximum percentage of the grid which will be alive initially
-    :type max_auto_seed_percent: tkinter.IntVar
-    :param drawn_cells: The dictionary of already rendered pixels
-    :type drawn_cells: dict
+    The widgets and tkinter variables of the GUI that the simulations are created, run and controlled through,
+    handed around as one instead of as separate arguments.
+    :param window: The GUI
+    :type window: tkinter.Tk
     :param canvas: The instance of a tkinter canvas that visualizes the game
     :type canvas: tkinter.Canvas
-    :param max_framerate: The maximum amount of times per second the program will run this loop
-    :type max_framerate: tkinter.IntVar
-    :param pause_signal: The signal which controls whether or not to pause the loop
-    :type pause_signal: tkinter.BooleanVar
-    :param pause_button: The button which changes the pause_signal
-    :type pause_button: tkinter.Button
-    :param mode: Whether or not to create a new simulation, load existing one or simply replay the current one
-    :type mode: str
+    :param drawn_cells: The canvas item ids of the drawn cells by y * canvas_width + x, 0 where not drawn
+    :type drawn_cells: array.array
+    :param grid: The 2D list of cells
+    :type grid: list of lists
     :param current_seed: The seed that determines which cells start as alive or not
     :type current_seed: list of lists
     :param canvas_height_input: The GUI input box for changing the canvas height
     :type canvas_height_input: tkinter.Entry
     :param canvas_width_input: The GUI input box for changing the canvas width
     :type canvas_width_input: tkinter.Entry
+    :param min_auto_seed_percent: The minimum percentage of the grid which will be alive initially
+    :type min_auto_seed_percent: tkinter.IntVar
+    :param max_auto_seed_percent: The maximum percentage of the grid which will be alive initially
+    :type max_auto_seed_percent: tkinter.IntVar
+    :param max_framerate: The maximum amount of times per second a frame is shown
+    :type max_framerate: tkinter.IntVar
+    :param boundary_mode: What lies beyond the edges of the grid, one of BOUNDARY_MODES
+    :type boundary_mode: tkinter.StringVar
+    :param rule: The rule in B/S notation
+    :type rule: tkinter.StringVar
+    :param pause_signal: The signal which controls whether or not to pause the simulation
+    :type pause_signal: tkinter.BooleanVar
+    :param pause_button: The button which changes the pause_signal
+    :type pause_button: tkinter.Button
     :param next_frame_signal: The signal which controls whether or not to move to the next frame
     while the simulation is paused
     :type next_frame_signal: tkinter.BooleanVar
     :param next_frame_button: The button which changes the next_frame_signal
     :type next_frame_button: tkinter.Button
+    :param jump_target: The generation number to jump straight to
+    :type jump_target: tkinter.IntVar
+    :param pause_when_stable: Whether or not to pause the simulation once the board has become periodic
+    :type pause_when_stable: tkinter.BooleanVar
     :param draw_seed_or_not: Whether or not to draw new seed manually using mouse
     :type draw_seed_or_not: tkinter.BooleanVar
-    :param grid: The list of cells
-    :type grid: list of lists
     :param button_apply_drawn_seed: The button for saving and applying manually drawn seed
     :type button_apply_drawn_seed: tkinter.Button
     :param is_button_apply_drawn_seed_pressed: Whether or not the button_apply_drawn_seed has been pressed
     :type is_button_apply_drawn_seed_pressed: tkinter.BooleanVar
     :param generation_counter: Keeps track of and displays the current generations number
     :type generation_counter: tkinter.Label
+    :param stability_counter: Displays the period of the board once it has become periodic
+    :type stability_counter: tkinter.Label
     :param shutting_down: Whether or not the program is shutting down
     :type shutting_down: tkinter.BooleanVar
-    :param window: The GUI
-    :type window: tkinter.TK
-    :return: None
+    :param simulation_number: Counts the simulations started, the running one stops when it changes
+    :type simulation_number: tkinter.IntVar
+    :param turbo: Whether or not to simulate as fast as possible, only drawing the latest generation
+    :type turbo: tkinter.BooleanVar
+    :param speed_counter: Displays the generations simulated and the frames drawn per second
+    :type speed_counter: tkinter.Label
+    :param viewport: The part of the board shown on the canvas
+    :type viewport: Viewport
+    :param brush: The brush or stamp a seed is drawn with, the name of one of BRUSH_SIZES or of STAMPS
+    :type brush: tkinter.StringVar
+    :param render_mode: What the cells are coloured by, one of RENDER_MODES
+    :type render_mode: tkinter.StringVar
+    :param seed_grid: The 2D list of cells a binary seed, a checkpoint or a pattern was loaded into, seeded from
+    instead of current_seed while it is not empty
+    :type seed_grid: list of lists
+    :param checkpoint_signal: The signal which asks for a checkpoint of the generation shown
+    :type checkpoint_signal: tkinter.BooleanVar
+    :param seed_generation: The generation number of the seed, other than 0 when resuming from a checkpoint
+    :type seed_generation: tkinter.IntVar
+    :param rewind_target: The generation number to go back to, -1 when not going back
+    :type rewind_target: tkinter.IntVar
+    :param timeline: The slider over the generations that can be gone back to
+    :type timeline: tkinter.Scale
     """
-    while not shutting_down.get():
-        # Create new simulation
-        create_simulation(min_auto_seed_percent, max_auto_seed_percent, drawn_cells, canvas, mode, current_seed,
-                          canvas_height_input, canvas_width_input, draw_seed_or_not, grid, button_apply_drawn_seed,
-                          is_button_apply_drawn_seed_pressed, generation_counter)
+    __slots__ = ()
 
-        # Run simulation
-        run_simulation(max_framerate, drawn_cells, pause_signal, canvas, pause_button, grid, next_frame_signal,
-                       next_frame_button, generation_counter, shutting_down)
 
-    # Shutdown program
-    window.destroy()
+def initialize():
+    """
+    Instantiates a couple of variables which will be used later
+    :return: controls (SimulationControls)
+    """
+    drawn_cells = array("L")
+    current_seed = []
+    grid = []
+
+    # Creates the graphical window
+    return create_gui("Conway's Game of Life", drawn_cells, current_seed, grid)
+
+
+def game_loop(controls, mode):
+    """
+    Stops the running simulation, then creates and starts a new one
+    :param controls: The widgets and tkinter variables of the GUI
+    :type controls: SimulationControls
+    :param mode: Whether or not to create a new simulation, load existing one or simply replay the current one
+    :type mode: str
+    :return: None
+    """
+    # Stop the running simulation
+    controls.simulation_number.set(controls.simulation_number.get() + 1)
+
+    # Create new simulation, and run it once it has been created
+    create_simulation(controls, mode, lambda: run_simulation(controls))
 
 
-def load_seed_from_file(current_seed):
+def load_seed_from_file(current_seed, seed_grid, canvas_height, canvas_width, boundary_mode, rule):
     """
     Have the user choose a file to use as seed and then load it into memory.
+    A pattern file has no canvas size or boundary mode of its own, so it is centred on the current canvas.
     :param current_seed: The seed that determines which cells start as alive or not
     :type current_seed: list of lists
-    :return: current_seed (list of lists), canvas_height (int), canvas_width (int)
+    :param seed_grid: The 2D list of cells a binary seed or a pattern is loaded into, emptied for text seeds
+    :type seed_grid: list of lists
+    :param canvas_height: The height of the current canvas in pixels
+    :type canvas_height: int
+    :param canvas_width: The width of the current canvas in pixels
+    :type canvas_width: int
+    :param boundary_mode: The current boundary mode
+    :type boundary_mode: str
+    :param rule: The current rule, kept when a pattern file does not have one
+    :type rule: str
+    :return: canvas_height (int), canvas_width (int), boundary_mode (str), rule (str), and generation_number (int),
+    which is 0 unless a checkpoint was chosen
     """
     # Create a new instance of tkinter
     root = tkinter.Tk()
@@ -194,14 +324,61 @@ def load_seed_from_file(current_seed):
     # Then bring up the file dialog for the user to chose file to use as seed
     root.update()
     root.filename = filedialog.askopenfilename(initialdir="seeds/", title="Select file",
-                                               filetypes=(("seed files", "*.seed"), ("all files", "*.*")))
+                                               filetypes=(("seed files", "*.seed *" + BINARY_SEED_EXTENSION),
+                                                          ("checkpoint files", "*" + CHECKPOINT_EXTENSION),
+                                                          ("pattern files", " ".join("*" + extension for extension
+                                                                                     in PATTERN_FORMATS)),
+                                                          ("all files", "*.*")))
+
+    if get_pattern_format(root.filename) is not None:
+        # The pattern is placed a row of cells at a time, like a binary seed without a list per living cell
+        current_seed.clear()
+        seed_grid.clear()
+        seed_grid.extend([0] * canvas_width for _ in range(canvas_height))
+        return canvas_height, canvas_width, boundary_mode, place_pattern(seed_grid, root.filename) or rule, 0
+
+    if is_checkpoint_file(root.filename):
+        binary_seed, generation_number = read_checkpoint_file(root.filename)
+        current_seed.clear()
+        seed_grid.clear()
+        with binary_seed:
+            seed_grid.extend(binary_seed.to_grid())
+
+        return binary_seed.canvas_height, binary_seed.canvas_width, binary_seed.boundary_mode, binary_seed.rule,\
+            generation_number
+
+    return read_seed_file(root.filename, current_seed, seed_grid) + (0,)
+
+
+def read_seed_file(file_path, current_seed, seed_grid=None):
+    """
+    Loads a seed file into memory, either a text one or a binary one as write_binary_seed_file makes them.
+    :param file_path: The path of the seed file
+    :type file_path: str or pathlib.Path
+    :param current_seed: The seed that determines which cells start as alive or not
+    :type current_seed: list of lists
+    :param seed_grid: If given, a binary seed is unpacked into this 2D list of cells instead of into current_seed,
+    without a list per living cell, and it is emptied for text seeds
+    :type seed_grid: list of lists
+    :return: canvas_height (int), canvas_width (int), boundary_mode (str), rule (str)
+    """
+    current_seed.clear()
+    if seed_grid is not None:
+        seed_grid.clear()
+    if is_binary_seed_file(file_path):
+        with BinarySeed(file_path) as binary_seed:
+            if seed_grid is not None:
+                seed_grid.extend(binary_seed.to_grid())
+            else:
+                current_seed.extend(binary_seed.to_seed())
+
+        return binary_seed.canvas_height, binary_seed.canvas_width, binary_seed.boundary_mode, binary_seed.rule
 
     # Loads seed from file
     if VERBOSE:
         print("Parsing file")
 
-    current_seed.clear()
-    with open(root.filename, "r") as file:
+    with open(file_path, "r") as file:
         for line_number, line in enumerate(file):
             # Remove string characters
             cell = line.replace("'", "")
@@ -215,10 +392,13 @@ def load_seed_from_file(current_seed):
             y = int(cell[0])
             x = int(cell[1])
 
-            # The first line tells us the canvas size used for the saved seed
+            # The first line tells us the canvas size, boundary mode and rule used for the saved seed,
+            # seeds saved before there were boundary modes used the legacy one
             if line_number == 0:
                 canvas_height = y
                 canvas_width = x
+                boundary_mode = cell[2] if len(cell) > 2 else "legacy"
+                rule = cell[3] if len(cell) > 3 else DEFAULT_RULE
 
             # Add the cell to the current seed
             else:
@@ -228,7 +408,7 @@ def load_seed_from_file(current_seed):
     if VERBOSE:
         print("Parsing complete")
 
-    return canvas_height, canvas_width
+    return canvas_height, canvas_width, boundary_mode, rule
 
 
 def create_gui(title, drawn_cells, current_seed, grid):
@@ -236,18 +416,13 @@ def create_gui(title, drawn_cells, current_seed, grid):
     Uses tkinter to create a graphical user interface for visualizing the simulation and controlling the program.
     :param title: The window title
     :type title: string
-    :param drawn_cells: The dictionary of already rendered pixels
-    :type drawn_cells: dict
+    :param drawn_cells: The canvas item ids of the drawn cells by y * canvas_width + x, 0 where not drawn
+    :type drawn_cells: array.array
     :param current_seed: The seed that determines which cells start as alive or note
     :type current_seed: list of lists
     :param grid: The list of cells
     :type grid: List of lists
-    :return: canvas (tkinter.Canvas), button_new_sim (tkinter.Button),
-    button_pause_sim (tkinter.Button), canvas_height_input (tkinter.Entry), canvas_width_input (tkinter.Entry),
-    min_seed_percent (tkinter.IntVar), max_seed_percent (tkinter.IntVar), max_framerate (tkinter.IntVar),
-    pause_signal (tkinter.BooleanVar), next_frame_signal (tkinter.BooleanVar), draw_seed_or_not (tkinter.BooleanVar),
-    button_apply_drawn_seed (tkinter.Button), is_button_apply_drawn_seed_pressed (tkinter.BooleanVar),
-    generation_counter (tkinter.Label), shutting_down (tkinter.BooleanVar), window (tkinter.Tk)
+    :return: controls (SimulationControls)
     """
     if VERBOSE:
         print("Creating canvas")
@@ -269,6 +444,8 @@ def create_gui(title, drawn_cells, current_seed, grid):
     window.title(title)
     shutting_down = tkinter.BooleanVar(window, False, "shutting_down")
     window.protocol("WM_DELETE_WINDOW", lambda: shutting_down.set(True))
+    simulation_number = tkinter.IntVar(window, 0, "simulation_number")
+    seed_generation = tkinter.IntVar(window, 0, "seed_generation")
 
     # Creating the settings frame
     settings_frame = tkinter.Frame(window)
@@ -278,8 +455,12 @@ def create_gui(title, drawn_cells, current_seed, grid):
     canvas_frame = tkinter.Frame(window)
     canvas_frame.grid(row=0, column=1, padx=10, pady=10)
 
-    # The canvas that the cells are drawn onto
+    # The canvas that the cells are drawn onto, and the part of the board it shows
     canvas = tkinter.Canvas(canvas_frame, height=canvas_height, width=canvas_width, bg="black")
+    viewport = Viewport(canvas, canvas_height, canvas_width)
+
+    # Zoom buttons, and zooming and panning the view with the mouse
+    button_zoom_out, button_zoom_in = create_viewport_controls(canvas_frame, canvas, viewport)
 
     # Seed_percent inputs
     min_seed_percent, max_seed_percent, min_seed_percent_label, max_seed_percent_label,\
@@ -294,15 +475,22 @@ def create_gui(title, drawn_cells, current_seed, grid):
     max_framerate_label, max_framerate_input, max_framerate,\
         max_framerate_input_status = create_max_framerate_inputs(settings_frame)
 
+    # Boundary mode input
+    boundary_mode_label, boundary_mode_input, boundary_mode = create_boundary_mode_inputs(settings_frame)
+
+    # Rule inputs
+    rule_label, rule_input, rule, rule_input_status = create_rule_inputs(settings_frame)
+
     # Load defaults button
     button_load_defaults = tkinter.Button(settings_frame, text="Load defaults",
                                           command=lambda: load_defaults(min_seed_percent_input, max_seed_percent_input,
                                                                         canvas_height_input, canvas_width_input,
-                                                                        max_framerate_input))
+                                                                        max_framerate_input, boundary_mode,
+                                                                        rule_input))
 
     # Apply settings button
     button_apply_settings = tkinter.Button(settings_frame, text="Apply settings",
-                                           command=lambda: apply_settings(canvas, canvas_height_input,
+                                           command=lambda: apply_settings(viewport, canvas_height_input,
                                                                           canvas_width_input, min_seed_percent_input,
                                                                           max_seed_percent_input, min_seed_percent,
                                                                           max_seed_percent,
@@ -311,7 +499,8 @@ def create_gui(title, drawn_cells, current_seed, grid):
                                                                           canvas_height_input_status,
                                                                           canvas_width_input_status,
                                                                           max_framerate_input, max_framerate,
-                                                                          max_framerate_input_status))
+                                                                          max_framerate_input_status, rule_input,
+                                                                          rule, rule_input_status))
 
     # Button for pausing the simulation
     pause_signal = tkinter.BooleanVar(canvas_frame, False, "pause_signal")
@@ -324,43 +513,69 @@ def create_gui(title, drawn_cells, current_seed, grid):
                                        command=lambda: next_frame_signal.set(get_opposite_boolean(
                                            next_frame_signal.get())))
 
+    # Input and button for jumping straight to a later generation
+    jump_target = tkinter.IntVar(canvas_frame, 0, "jump_target")
+    jump_input = tkinter.Entry(canvas_frame, width=10)
+    button_jump = tkinter.Button(canvas_frame, text="Jump to generation",
+                                 command=lambda: request_jump(jump_input, jump_target))
+
+    # Button for saving a checkpoint of the generation shown, to resume the simulation from later
+    checkpoint_signal = tkinter.BooleanVar(canvas_frame, False, "checkpoint_signal")
+    button_checkpoint = tkinter.Button(canvas_frame, text="Save checkpoint",
+                                       command=lambda: checkpoint_signal.set(True))
+
+    # Slider and button for going back to the generations shown before, without calculating them again
+    rewind_target = tkinter.IntVar(canvas_frame, -1, "rewind_target")
+    timeline = tkinter.Scale(canvas_frame, orient=tkinter.HORIZONTAL, from_=0, to=0, showvalue=False, length=200)
+    timeline.bind("<B1-Motion>", lambda event: request_rewind(timeline, rewind_target))
+    timeline.bind("<ButtonRelease-1>", lambda event: request_rewind(timeline, rewind_target))
+    button_step_back = tkinter.Button(canvas_frame, text="Step back",
+                                      command=lambda: rewind_target.set(max(timeline.get() - 1, 0)))
+
     # Checkbox for whether or not to draw new seed using mouse
     draw_seed_or_not = tkinter.BooleanVar(canvas_frame, False, "draw_seed_or_not")
     draw_seed_or_not_checkbox = tkinter.Checkbutton(canvas_frame, text=" Draw new seed using mouse?",
                                                     variable=draw_seed_or_not, onvalue=True, offvalue=False)
 
+    # The brush or stamp to draw the new seed with
+    brush, brush_input = create_brush_input(canvas_frame)
+
+    # What the cells are coloured by
+    render_mode_label, render_mode_input, render_mode = create_render_mode_inputs(canvas_frame)
+
     # Live generation counter
     generation_counter = tkinter.Label(canvas_frame, text="Generation number: 0")
 
+    # Shows when the board has become periodic, and checkbox for whether or not to pause when it does
+    stability_counter = tkinter.Label(canvas_frame, text="")
+    pause_when_stable = tkinter.BooleanVar(canvas_frame, False, "pause_when_stable")
+    pause_when_stable_checkbox = tkinter.Checkbutton(canvas_frame, text=" Pause when stable?",
+                                                     variable=pause_when_stable, onvalue=True, offvalue=False)
+
     # Button for saving and using manually drawn seed
     is_button_apply_drawn_seed_pressed = tkinter.BooleanVar(canvas_frame, False,
                                                             name="is_button_apply_drawn_seed_pressed")
     button_apply_drawn_seed = tkinter.Button(canvas_frame, text="Apply drawn seed",
                                              command=lambda: is_button_apply_drawn_seed_pressed.set(True))
 
-    # Button for replaying the current simulation
-    button_replay_sim = create_sim_mode_buttons(min_seed_percent, max_seed_percent, drawn_cells,
-                                                canvas_frame, canvas, max_framerate, pause_signal, button_pause_sim,
-                                                "Replay", current_seed, canvas_height_input, canvas_width_input,
-                                                next_frame_signal, next_frame_button, draw_seed_or_not, grid,
-                                                button_apply_drawn_seed, is_button_apply_drawn_seed_pressed,
-                                                generation_counter, shutting_down, window)
-
-    # Button for creating a new simulation
-    button_new_sim = create_sim_mode_buttons(min_seed_percent, max_seed_percent, drawn_cells, canvas_frame,
-                                             canvas, max_framerate, pause_signal, button_pause_sim, "New",
-                                             current_seed, canvas_height_input, canvas_width_input, next_frame_signal,
-                                             next_frame_button, draw_seed_or_not, grid, button_apply_drawn_seed,
-                                             is_button_apply_drawn_seed_pressed, generation_counter, shutting_down,
-                                             window)
-
-    # Button for loading an existing simulation
-    button_load_sim = create_sim_mode_buttons(min_seed_percent, max_seed_percent, drawn_cells, canvas_frame,
-                                              canvas, max_framerate, pause_signal, button_pause_sim, "Load",
-                                              current_seed, canvas_height_input, canvas_width_input, next_frame_signal,
-                                              next_frame_button, draw_seed_or_not, grid, button_apply_drawn_seed,
-                                              is_button_apply_drawn_seed_pressed, generation_counter, shutting_down,
-                                              window)
+    # Checkbox for simulating as fast as possible, and the speed it runs and draws at
+    turbo = tkinter.BooleanVar(canvas_frame, False, "turbo")
+    turbo_checkbox = tkinter.Checkbutton(canvas_frame, text=" Turbo?", variable=turbo, onvalue=True, offvalue=False)
+    speed_counter = tkinter.Label(canvas_frame, text="")
+
+    controls = SimulationControls(window, canvas, drawn_cells, grid, current_seed, canvas_height_input,
+                                  canvas_width_input, min_seed_percent, max_seed_percent, max_framerate, boundary_mode,
+                                  rule, pause_signal, button_pause_sim, next_frame_signal, next_frame_button,
+                                  jump_target, pause_when_stable, draw_seed_or_not, button_apply_drawn_seed,
+                                  is_button_apply_drawn_seed_pressed, generation_counter, stability_counter,
+                                  shutting_down, simulation_number, turbo, speed_counter, viewport,
+                                  brush, render_mode, [], checkpoint_signal, seed_generation, rewind_target,
+                                  timeline)
+
+    # Buttons for replaying the current simulation, creating a new one and loading an existing one
+    button_replay_sim = create_sim_mode_buttons(canvas_frame, "Replay", controls)
+    button_new_sim = create_sim_mode_buttons(canvas_frame, "New", controls)
+    button_load_sim = create_sim_mode_buttons(canvas_frame, "Load", controls)
 
     # Arrange the widgets on screen
     # Settings frame
@@ -380,25 +595,69 @@ def create_gui(title, drawn_cells, current_seed, grid):
     max_framerate_label.grid(row=5, column=0)
     max_framerate_input.grid(row=5, column=1)
     max_framerate_input_status.grid(row=5, column=2)
-    button_apply_settings.grid(row=6, column=1)
+    boundary_mode_label.grid(row=6, column=0)
+    boundary_mode_input.grid(row=6, column=1)
+    rule_label.grid(row=7, column=0)
+    rule_input.grid(row=7, column=1)
+    rule_input_status.grid(row=7, column=2)
+    button_apply_settings.grid(row=8, column=1)
 
     # Canvas frame
     generation_counter.grid(row=0, column=1)
+    stability_counter.grid(row=0, column=2)
     canvas.grid(row=1, column=1)
     button_pause_sim.grid(row=2, column=1)
+    jump_input.grid(row=2, column=2)
+    button_jump.grid(row=2, column=3)
     button_new_sim.grid(row=3, column=0)
     button_replay_sim.grid(row=3, column=1)
     button_load_sim.grid(row=3, column=2)
+    button_checkpoint.grid(row=3, column=3)
     draw_seed_or_not_checkbox.grid(row=4, column=0)
+    pause_when_stable_checkbox.grid(row=4, column=1)
+    turbo_checkbox.grid(row=4, column=2)
+    brush_input.grid(row=4, column=3)
+    button_zoom_out.grid(row=5, column=0)
+    speed_counter.grid(row=5, column=1)
+    button_zoom_in.grid(row=5, column=2)
+    render_mode_label.grid(row=6, column=2)
+    render_mode_input.grid(row=6, column=3)
+    button_step_back.grid(row=7, column=0)
+    timeline.grid(row=7, column=1, columnspan=3, sticky="we")
 
     canvas.update()
 
     if VERBOSE:
         print("Canvas created")
 
-    return canvas, button_new_sim, button_pause_sim, canvas_height_input, canvas_width_input, next_frame_button,\
-        min_seed_percent, max_seed_percent, max_framerate, pause_signal, next_frame_signal, draw_seed_or_not,\
-           button_apply_drawn_seed, is_button_apply_drawn_seed_pressed, generation_counter, shutting_down, window
+    return controls
+
+
+def request_jump(jump_input, jump_target):
+    """
+    Requests a jump to the generation number written in the jump input.
+    :param jump_input: The input field for the generation number to jump to
+    :type jump_input: tkinter.Entry
+    :param jump_target: The generation number to jump straight to
+    :type jump_target: tkinter.IntVar
+    :return: None
+    """
+    try:
+        jump_target.set(int(jump_input.get()))
+    except ValueError:
+        pass
+
+
+def request_rewind(timeline, rewind_target):
+    """
+    Requests going back to the generation the timeline has been moved to, once the move has been handled.
+    :param timeline: The slider over the generations that can be gone back to
+    :type timeline: tkinter.Scale
+    :param rewind_target: The generation number to go back to
+    :type rewind_target: tkinter.IntVar
+    :return: None
+    """
+    timeline.after_idle(lambda: rewind_target.set(timeline.get()))
 
 
 def get_opposite_boolean(boolean):
@@ -408,6 +667,73 @@ def get_opposite_boolean(boolean):
         return True
 
 
+def create_brush_input(canvas_frame):
+    """
+    Instantiates the menu for choosing the size of the brush a seed is drawn with, or a pattern to stamp instead
+    :param canvas_frame: The frame in which this widget will be drawn
+    :type canvas_frame: tkinter.Frame
+    :return: brush (tkinter.StringVar), brush_input (tkinter.OptionMenu)
+    """
+    brushes = [get_brush_name(brush_size) for brush_size in BRUSH_SIZES] + list(STAMPS)
+    brush = tkinter.StringVar(canvas_frame, brushes[0], "brush")
+    brush_input = tkinter.OptionMenu(canvas_frame, brush, *brushes)
+
+    return brush, brush_input
+
+
+def get_brush_name(brush_size):
+    """
+    :param brush_size: The width and height of the brush, in cells
+    :type brush_size: int
+    :return: brush_name (str)
+    """
+    return str(brush_size) + "x" + str(brush_size) + " brush"
+
+
+def create_viewport_controls(canvas_frame, canvas, viewport):
+    """
+    Creates the zoom buttons, and lets the mouse wheel zoom in and out around the cursor
+    and dragging with the right or middle mouse button pan the view.
+    :param canvas_frame: The frame in which these widgets will be drawn
+    :type canvas_frame: tkinter.Frame
+    :param canvas: The canvas where the cells will be drawn
+    :type canvas: tkinter.Canvas
+    :param viewport: The part of the board shown on the canvas
+    :type viewport: Viewport
+    :return: button_zoom_out (tkinter.Button), button_zoom_in (tkinter.Button)
+    """
+    button_zoom_out = tkinter.Button(canvas_frame, text="Zoom out",
+                                     command=lambda: viewport.set_zoom(viewport.zoom - 1))
+    button_zoom_in = tkinter.Button(canvas_frame, text="Zoom in",
+                                    command=lambda: viewport.set_zoom(viewport.zoom + 1))
+
+    # Windows and macOS report the wheel as a delta, X11 as buttons 4 and 5
+    def zoom_with_wheel(event):
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            viewport.set_zoom(viewport.zoom + 1, event.y, event.x)
+        elif event.num == 5 or getattr(event, "delta", 0) < 0:
+            viewport.set_zoom(viewport.zoom - 1, event.y, event.x)
+
+    # Where the mouse was when the view was last moved
+    drag_origin = [0, 0]
+
+    def start_drag(event):
+        drag_origin[:] = [event.y, event.x]
+
+    def drag(event):
+        moved_down, moved_right = viewport.pan(drag_origin[0] - event.y, drag_origin[1] - event.x)
+        drag_origin[0] -= moved_down
+        drag_origin[1] -= moved_right
+
+    for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+        canvas.bind(sequence, zoom_with_wheel)
+    for button in (2, 3):
+        canvas.bind("<ButtonPress-" + str(button) + ">", start_drag)
+        canvas.bind("<B" + str(button) + "-Motion>", drag)
+
+    return button_zoom_out, button_zoom_in
+
+
 def create_max_framerate_inputs(settings_frame):
     """
     Instantiates the labels, inputs and variables for controlling the max framerate
@@ -425,14 +751,61 @@ def create_max_framerate_inputs(settings_frame):
     return max_framerate_label, max_framerate_input, max_framerate, max_framerate_input_status
 
 
-def apply_settings(canvas, canvas_height_input, canvas_width_input, min_seed_percent_input, max_seed_percent_input,
+def create_boundary_mode_inputs(settings_frame):
+    """
+    Instantiates the label, input and variable for choosing what lies beyond the edges of the grid
+    :param settings_frame: The frame in which these widgets will be drawn
+    :type settings_frame: tkinter.Frame
+    :return: boundary_mode_label (tkinter.Label), boundary_mode_input (tkinter.OptionMenu),
+    boundary_mode (tkinter.StringVar)
+    """
+    boundary_mode = tkinter.StringVar(settings_frame, DEFAULT_BOUNDARY_MODE)
+    boundary_mode_label = tkinter.Label(settings_frame, text="Boundary: ")
+    boundary_mode_input = tkinter.OptionMenu(settings_frame, boundary_mode, *BOUNDARY_MODES)
+
+    return boundary_mode_label, boundary_mode_input, boundary_mode
+
+
+def create_render_mode_inputs(canvas_frame):
+    """
+    Instantiates the label, input and variable for choosing what the cells are coloured by
+    :param canvas_frame: The frame in which these widgets will be drawn
+    :type canvas_frame: tkinter.Frame
+    :return: render_mode_label (tkinter.Label), render_mode_input (tkinter.OptionMenu),
+    render_mode (tkinter.StringVar)
+    """
+    render_mode = tkinter.StringVar(canvas_frame, DEFAULT_RENDER_MODE, "render_mode")
+    render_mode_label = tkinter.Label(canvas_frame, text="Colour by: ")
+    render_mode_input = tkinter.OptionMenu(canvas_frame, render_mode, *RENDER_MODES)
+
+    return render_mode_label, render_mode_input, render_mode
+
+
+def create_rule_inputs(settings_frame):
+    """
+    Instantiates the label, input and variables for choosing the rule, written in B/S notation
+    :param settings_frame: The frame in which these widgets will be drawn
+    :type settings_frame: tkinter.Frame
+    :return: rule_label (tkinter.Label), rule_input (tkinter.Entry), rule (tkinter.StringVar),
+    rule_input_status (tkinter.Label)
+    """
+    rule = tkinter.StringVar(settings_frame, DEFAULT_RULE)
+    rule_label = tkinter.Label(settings_frame, text="Rule: ")
+    rule_input = tkinter.Entry(settings_frame)
+    rule_input.insert(0, rule.get())
+    rule_input_status = tkinter.Label(settings_frame, text="Default value")
+
+    return rule_label, rule_input, rule, rule_input_status
+
+
+def apply_settings(viewport, canvas_height_input, canvas_width_input, min_seed_percent_input, max_seed_percent_input,
                    min_seed_percent, max_seed_percent, min_seed_percent_input_status, max_seed_percent_input_status,
                    canvas_height_input_status, canvas_width_input_status, max_framerate_input, max_framerate,
-                   max_framerate_input_status):
+                   max_framerate_input_status, rule_input, rule, rule_input_status):
     """
-    Applies the settings in the settings frame
-    :param canvas: The canvas that the cells are drawn onto
-    :type canvas: tkinter.Canvas
+    Applies the settings in the settings frame, the canvas size is used from the next simulation on
+    :param viewport: The part of the board shown on the canvas, which holds the canvas size of new simulations
+    :type viewport: Viewport
     :param canvas_height_input: The input field for the canvas height
     :type canvas_height_input: tkinter.Entry
     :param canvas_width_input:  The input field for the canvas width
@@ -459,6 +832,12 @@ def apply_settings(canvas, canvas_height_input, canvas_width_input, min_seed_per
     :type max_framerate: tkinter.IntVar
     :param max_framerate_input_status: Outputs to the user the status of the input
     :type max_framerate_input_status: tkinter.Label
+    :param rule_input: The input field for the rule
+    :type rule_input: tkinter.Entry
+    :param rule: The variable for the rule
+    :type rule: tkinter.StringVar
+    :param rule_input_status: Outputs to the user the status of the input
+    :type rule_input_status: tkinter.Label
     :return: None
     """
     # Apply canvas size settings
@@ -471,9 +850,9 @@ def apply_settings(canvas, canvas_height_input, canvas_width_input, min_seed_per
             canvas_height_input_status.config(text="OK")
         except ValueError:
             canvas_height_input_status.config(text="ERROR: Not an integer!")
-            new_height = canvas.winfo_height() - 2
+            new_height = viewport.canvas_height
 
-        canvas.config(height=new_height)
+        viewport.canvas_height = new_height
 
     else:
         canvas_height_input_status.config(text="ERROR: No input!")
@@ -484,9 +863,9 @@ def apply_settings(canvas, canvas_height_input, canvas_width_input, min_seed_per
             canvas_width_input_status.config(text="OK")
         except ValueError:
             canvas_width_input_status.config(text="ERROR: Not an integer!")
-            new_width = canvas.winfo_width() - 2
+            new_width = viewport.canvas_width
 
-        canvas.config(width=new_width)
+        viewport.canvas_width = new_width
 
     else:
         canvas_width_input_status.config(text="ERROR: No input!")
@@ -537,9 +916,25 @@ def apply_settings(canvas, canvas_height_input, canvas_width_input, min_seed_per
     else:
         max_framerate_input_status.config(text="ERROR: No input!")
 
+    # Apply rule settings
+    new_rule = rule_input.get()
+
+    if new_rule != "":
+        try:
+            new_rule = format_rule(compile_rule(new_rule))
+            rule_input_status.config(text="OK")
+        except ValueError:
+            rule_input_status.config(text="ERROR: Not a rule like B3/S23!")
+            new_rule = rule.get()
+
+        rule.set(new_rule)
+
+    else:
+        rule_input_status.config(text="ERROR: No input!")
+
 
 def load_defaults(min_seed_percent_input, max_seed_percent_input, canvas_height_input, canvas_width_input,
-                  max_framerate_input):
+                  max_framerate_input, boundary_mode, rule_input):
     """
     Sets all the input fields and their corresponding status label to the defaults
     :param min_seed_percent_input: The input field for the minimum seed percentage
@@ -552,6 +947,10 @@ def load_defaults(min_seed_percent_input, max_seed_percent_input, canvas_height_
     :type canvas_width_input: tkinter.Entry
     :param max_framerate_input: The input field for the max framerate
     :type max_framerate_input: tkinter.Entry
+    :param boundary_mode: What lies beyond the edges of the grid
+    :type boundary_mode: tkinter.StringVar
+    :param rule_input: The input field for the rule
+    :type rule_input: tkinter.Entry
     :return:
     """
     # Seed percent inputs
@@ -572,6 +971,13 @@ def load_defaults(min_seed_percent_input, max_seed_percent_input, canvas_height_
     max_framerate_input.delete(0, tkinter.END)
     max_framerate_input.insert(0, DEFAULT_MAX_FRAMERATE)
 
+    # Boundary mode input
+    boundary_mode.set(DEFAULT_BOUNDARY_MODE)
+
+    # Rule input
+    rule_input.delete(0, tkinter.END)
+    rule_input.insert(0, DEFAULT_RULE)
+
 
 def create_seed_percent_inputs(settings_frame):
     """
@@ -598,70 +1004,21 @@ def create_seed_percent_inputs(settings_frame):
         min_seed_percent_input, max_seed_percent_input, min_seed_percent_input_status, max_seed_percent_input_status
 
 
-def create_sim_mode_buttons(min_seed_percent, max_seed_percent, drawn_cells, canvas_frame, canvas,
-                            max_framerate, pause_signal, button_pause_sim, mode, current_seed, canvas_height_input,
-                            canvas_width_input, next_frame_signal, next_frame_button, draw_seed_or_not, grid,
-                            button_apply_drawn_seed, is_button_apply_drawn_seed_pressed, generation_counter,
-                            shutting_down, window):
+def create_sim_mode_buttons(canvas_frame, mode, controls):
     """
     Creates a button that will call the game loop function with a mode determined by the 'mode' parameter
-    :param min_seed_percent: The minimum percentage of the grid which will be alive initially
-    :type min_seed_percent: tkinter.IntVar
-    :param max_seed_percent: The maximum percentage of the grid which will be alive initially
-    :type max_seed_percent: tkinter.IntVar
-    :param drawn_cells: The dictionary of already rendered pixels
-    :type drawn_cells: dict
     :param canvas_frame: The parent window
     :type canvas_frame: tkinter.Frame
-    :param canvas: The canvas where the cells will be drawn
-    :type canvas: tkinter.Canvas
-    :param max_framerate: The maximum amount of times per second the program will run this loop
-    :type max_framerate: tkinter.IntVar
-    :param pause_signal: The signal which controls whether or not to pause the loop
-    :type pause_signal: tkinter.BooleanVar
-    :param button_pause_sim: The button which controls the pause signal
-    :type button_pause_sim: tkinter.Button
     :param mode: Which mode the new simulation will be (replay of the current one, create a new one
     or load an existing one)
     :type mode: str
-    :param current_seed: The seed that determines which cells start as alive or note
-    :type current_seed: list of lists
-    :param canvas_height_input: The GUI input box for changing the canvas height
-    :type canvas_height_input: tkinter.Entry
-    :param canvas_width_input: The GUI input box for changing the canvas width
-    :type canvas_width_input: tkinter.Entry
-    :param next_frame_signal: The signal which controls whether or not to move to the next frame
-    while the simulation is paused
-    :type next_frame_signal: tkinter.BooleanVar
-    :param next_frame_button: The button which changes the next_frame_signal
-    :type next_frame_button: tkinter.Button
-    :param draw_seed_or_not: Whether or not to draw new seed manually using mouse
-    :type draw_seed_or_not: tkinter.BooleanVar
-    :param grid: The list of cells
-    :type grid: list of lists
-    :param button_apply_drawn_seed: The button for saving and applying manually drawn seed
-    :type button_apply_drawn_seed: tkinter.Button
-    :param is_button_apply_drawn_seed_pressed: Whether or not the button_apply_drawn_seed has been pressed
-    :type is_button_apply_drawn_seed_pressed: tkinter.BooleanVar
-    :param generation_counter: Keeps track of and displays the current generations number
-    :type generation_counter: tkinter.Label
-    :param shutting_down: Whether or not the program is shutting down
-    :type shutting_down: tkinter.BooleanVar
-    :param window: The GUI
-    :type window: tkinter.Tk
+    :param controls: The widgets and tkinter variables of the GUI
+    :type controls: SimulationControls
     :return: vars()[button_name] (tkinter.Button)
     """
     mode_lowercase = mode.lower()
     button_name = "button_" + mode_lowercase + "_sim"
-    vars()[button_name] = tkinter.Button(canvas_frame, text=mode,
-                                         command=lambda: game_loop(min_seed_percent, max_seed_percent,
-                                                                   drawn_cells, canvas, max_framerate, pause_signal,
-                                                                   button_pause_sim, mode_lowercase, current_seed,
-                                                                   canvas_height_input, canvas_width_input,
-                                                                   next_frame_signal, next_frame_button,
-                                                                   draw_seed_or_not, grid, button_apply_drawn_seed,
-                                                                   is_button_apply_drawn_seed_pressed,
-                                                                   generation_counter, shutting_down, window))
+    vars()[button_name] = tkinter.Button(canvas_frame, text=mode, command=lambda: game_loop(controls, mode_lowercase))
 
     return vars()[button_name]
 
@@ -690,95 +1047,106 @@ def create_canvas_size_inputs(settings_frame):
         canvas_height_input_status, canvas_width_input_status
 
 
-def create_simulation(min_auto_seed_percent, max_auto_seed_percent, drawn_cells, canvas, mode, current_seed,
-                      canvas_height_input, canvas_width_input, draw_seed_or_not, grid, button_apply_drawn_seed,
-                      is_button_apply_drawn_seed_pressed, generation_counter):
+def create_simulation(controls, mode, start_simulation):
     """
-    Resets necessary variables and generates new values for next simulation.
-    :param min_auto_seed_percent: The minimum percentage of the grid which will be alive initially
-    :type min_auto_seed_percent: tkinter.IntVar
-    :param max_auto_seed_percent: The maximum percentage of the grid which will be alive initially
-    :type max_auto_seed_percent: tkinter.IntVar
-    :param drawn_cells: The dictionary of already rendered pixels
-    :type drawn_cells: dict
-    :param canvas: The instance of a tkinter canvas that visualizes the game
-    :type canvas: tkinter.Canvas
+    Resets necessary variables and generates new values for next simulation, then starts it.
+    A seed drawn with the mouse is only ready once it is applied, so then the simulation starts from there.
+    :param controls: The widgets and tkinter variables of the GUI
+    :type controls: SimulationControls
     :param mode: Whether or not to create a new simulation, load an existing one or simply replay the current one
     :type mode: str
-    :param current_seed: The seed that determines which cells start as alive or not
-    :type current_seed: list of lists
-    :param canvas_height_input: The GUI input box for changing the canvas height
-    :type canvas_height_input: tkinter.Entry
-    :param canvas_width_input: The GUI input box for changing the canvas width
-    :type canvas_width_input: tkinter.Entry
-    :param draw_seed_or_not: Whether or not to draw new seed manually using mouse
-    :type draw_seed_or_not: tkinter.BooleanVar
-    :param grid: The list of cells
-    :type grid: list of lists
-    :param button_apply_drawn_seed: The button for saving and applying manually drawn seed
-    :type button_apply_drawn_seed: tkinter.Button
-    :param is_button_apply_drawn_seed_pressed: Whether or not the button_apply_drawn_seed has been pressed
-    :type is_button_apply_drawn_seed_pressed: tkinter.BooleanVar
-    :param generation_counter: Keeps track of and displays the current generations number
-    :type generation_counter: tkinter.Label
+    :param start_simulation: Starts the simulation once the grid has been seeded
+    :type start_simulation: function
     :return: None
     """
+    canvas, drawn_cells, grid, current_seed = controls.canvas, controls.drawn_cells, controls.grid,\
+        controls.current_seed
+    boundary_mode, rule, viewport = controls.boundary_mode, controls.rule, controls.viewport
+
     # Reset
     if VERBOSE:
         print("Resetting variables")
 
-    generation_counter.config(text="Generation number: 0")
+    controls.generation_counter.config(text="Generation number: 0")
     grid.clear()
-    for rectangle_name in drawn_cells:
-        canvas.delete(drawn_cells[rectangle_name])
-    drawn_cells.clear()
+    clear_drawn_cells(canvas, drawn_cells)
+    canvas.delete(BITMAP_TAG)
     canvas_height = 0
     canvas_width = 0
     if not mode == "load":
-        canvas_height = canvas.winfo_height() - 2
-        canvas_width = canvas.winfo_width() - 2
+        canvas_height = viewport.canvas_height
+        canvas_width = viewport.canvas_width
 
     if VERBOSE:
         print("Variables reset")
 
+    def seed_simulation():
+        """
+        Sizes the canvas to the seed, seeds the grid and starts the simulation.
+        :return: None
+        """
+        # Resize canvas
+        if VERBOSE:
+            print("Resizing canvas")
+
+        viewport.show_board(canvas_height, canvas_width)
+
+        if VERBOSE:
+            print("Canvas resized")
+
+        # Seed, the rows of a loaded binary seed are copied as the grid is stepped in place
+        if controls.seed_grid:
+            grid.extend(row[:] for row in controls.seed_grid)
+        else:
+            apply_seed(grid, current_seed, canvas_height, canvas_width)
+        start_simulation()
+
     # If creating new seed
     if mode == "new":
-        # If drawing new seed manually using mouse
-        if draw_seed_or_not.get():
-            draw_seed(canvas, current_seed, button_apply_drawn_seed, is_button_apply_drawn_seed_pressed, canvas_height,
-                      canvas_width)
+        controls.seed_generation.set(0)
+        controls.seed_grid.clear()
+        # If drawing new seed manually using mouse, the simulation is seeded once the drawn seed is applied
+        if controls.draw_seed_or_not.get():
+            viewport.show_board(canvas_height, canvas_width)
+            draw_seed(canvas, current_seed, controls.button_apply_drawn_seed,
+                      controls.is_button_apply_drawn_seed_pressed, canvas_height, canvas_width, boundary_mode.get(),
+                      rule.get(), viewport, controls.brush, controls.window, controls.shutting_down,
+                      controls.simulation_number, seed_simulation)
+            return
 
         # If generating new seed automatically
         else:
-            generate_seed(canvas_height, canvas_width, min_auto_seed_percent, max_auto_seed_percent, current_seed)
+            generate_seed(canvas_height, canvas_width, controls.min_auto_seed_percent,
+                          controls.max_auto_seed_percent, current_seed, boundary_mode.get(), rule.get())
 
     # If loading seed from file
     elif mode == "load":
-        canvas_height, canvas_width = load_seed_from_file(current_seed)
+        canvas_height, canvas_width, loaded_boundary_mode, loaded_rule, loaded_generation = load_seed_from_file(
+            current_seed, controls.seed_grid, viewport.canvas_height, viewport.canvas_width, boundary_mode.get(),
+            rule.get())
+        controls.seed_generation.set(loaded_generation)
+        boundary_mode.set(loaded_boundary_mode)
+        rule.set(loaded_rule)
+        viewport.canvas_height = canvas_height
+        viewport.canvas_width = canvas_width
 
         # Set the entry boxes for changing canvas sizes to the newly loaded sizes
-        canvas_height_input.delete(0, tkinter.END)
-        canvas_height_input.insert(0, canvas_height)
-        canvas_width_input.delete(0, tkinter.END)
-        canvas_width_input.insert(0, canvas_width)
-
-    # Resize canvas
-    if VERBOSE:
-        print("Resizing canvas")
-
-    canvas.config(height=canvas_height, width=canvas_width)
+        controls.canvas_height_input.delete(0, tkinter.END)
+        controls.canvas_height_input.insert(0, canvas_height)
+        controls.canvas_width_input.delete(0, tkinter.END)
+        controls.canvas_width_input.insert(0, canvas_width)
 
-    if VERBOSE:
-        print("Canvas resized")
-
-    # Seed
-    apply_seed(grid, current_seed, canvas_height, canvas_width)
+    seed_simulation()
 
 
 def draw_seed(canvas, current_seed, button_apply_drawn_seed, is_button_apply_drawn_seed_pressed, canvas_height,
-              canvas_width):
+              canvas_width, boundary_mode, rule, viewport, brush, window, shutting_down, simulation_number,
+              seed_drawn):
     """
-    Generates seed based on mouse input
+    Generates seed based on mouse input. Returns right away, the seed is drawn as the mouse events come in
+    and saved once button_apply_drawn_seed is pressed, after which seed_drawn is called.
+    Strokes are filled in between the cells the mouse moved over, and pressing with a stamp chosen places its pattern.
+    Drawing stops without calling seed_drawn if another simulation is started or the program shuts down.
     :param canvas: The instance of a tkinter canvas that visualizes the game
     :type canvas: tkinter.Canvas
     :param current_seed: The seed that determines which cells start as alive or not
@@ -791,39 +1159,183 @@ def draw_seed(canvas, current_seed, button_apply_drawn_seed, is_button_apply_dra
     :type canvas_height: int
     :param canvas_width: The width of the canvas in pixels
     :type canvas_width: int
-    :return:
+    :param boundary_mode: What lies beyond the edges of the grid, saved along with the seed
+    :type boundary_mode: str
+    :param rule: The rule in B/S notation, saved along with the seed
+    :type rule: str
+    :param viewport: The part of the board shown on the canvas
+    :type viewport: Viewport
+    :param brush: The brush or stamp a seed is drawn with, the name of one of BRUSH_SIZES or of STAMPS
+    :type brush: tkinter.StringVar
+    :param window: The GUI
+    :type window: tkinter.Tk
+    :param shutting_down: Whether or not the program is shutting down
+    :type shutting_down: tkinter.BooleanVar
+    :param simulation_number: Counts the simulations started, drawing stops when it changes
+    :type simulation_number: tkinter.IntVar
+    :param seed_drawn: Called once the drawn seed has been applied
+    :type seed_drawn: function
+    :return: None
     """
     current_seed.clear()
-
     button_apply_drawn_seed.grid(row=6, column=0)
 
-    def paint_seed_cell(event):
-        y = event.y
-        x = event.x
-        current_seed.append([y, x])
-        canvas.create_rectangle(x, y, x, y, fill="red", outline="")
+    # Every cell is only painted once, and strokes go on from the last cell painted
+    painted_cells = set()
+    stroke_end = None
+
+    def draw_seed_cell(y, x):
+        x1, y1, x2, y2 = get_cell_rectangle(y, x, viewport)
+        canvas.create_rectangle(x1, y1, x2, y2, fill="red", outline="", tags=SEED_TAG)
+
+    def paint_seed_cell(y, x):
+        if 0 <= y < canvas_height and 0 <= x < canvas_width and (y, x) not in painted_cells:
+            painted_cells.add((y, x))
+            current_seed.append([y, x])
+            draw_seed_cell(y, x)
+
+    def paint_brush(y, x):
+        for cell_y, cell_x in get_brush_cells(brush.get(), y, x):
+            paint_seed_cell(cell_y, cell_x)
+
+    def start_stroke(event):
+        nonlocal stroke_end
+        y, x = viewport.get_board_position(event.y, event.x)
+        paint_brush(y, x)
+
+        # A stamp is placed once, centred on the cell pressed
+        stroke_end = None if brush.get() in STAMPS else (y, x)
+
+    def continue_stroke(event):
+        nonlocal stroke_end
+        if stroke_end is None:
+            return
+
+        # Fast strokes skip cells between motion events, so the line between them is painted
+        y, x = viewport.get_board_position(event.y, event.x)
+        for cell_y, cell_x in get_line_cells(stroke_end[0], stroke_end[1], y, x)[1:]:
+            paint_brush(cell_y, cell_x)
+        stroke_end = (y, x)
+
+    def end_stroke(event):
+        nonlocal stroke_end
+        stroke_end = None
+
+    # The cells painted so far follow the view when it is zoomed or panned
+    def redraw_seed(*trace_arguments):
+        canvas.delete(SEED_TAG)
+        top, left, bottom, right = viewport.top, viewport.left, viewport.top + viewport.rows,\
+            viewport.left + viewport.columns
+        for y, x in current_seed:
+            if top <= y < bottom and left <= x < right:
+                draw_seed_cell(y, x)
+
+    def stop_drawing():
+        for sequence in ("<ButtonPress-1>", "<B1-Motion>", "<ButtonRelease-1>"):
+            canvas.unbind(sequence)
+        for variable, trace in traces:
+            variable.trace_remove("write", trace)
+
+        # Reset variables
+        canvas.delete(SEED_TAG)
+        button_apply_drawn_seed.grid_remove()
+        is_button_apply_drawn_seed_pressed.set(False)
+
+    def apply_drawn_seed(*trace_arguments):
+        if not is_button_apply_drawn_seed_pressed.get():
+            return
+
+        stop_drawing()
+
+        # Save seed to file, named with date and time (.seed extension)
+        if VERBOSE:
+            print("Saving seed")
 
-    canvas.bind("<B1-Motion>", paint_seed_cell)
+        saved_seed_file_path = save_seed_to_file(current_seed, canvas_height, canvas_width, boundary_mode, rule)
 
-    while not is_button_apply_drawn_seed_pressed.get():
-        canvas.update()
+        if VERBOSE:
+            print("Seed saved to: " + str(saved_seed_file_path))
 
-    # Save seed to file, named with date and time (.seed extension)
-    if VERBOSE:
-        print("Saving seed")
+        seed_drawn()
 
-    saved_seed_file_path = save_seed_to_file(current_seed, canvas_height, canvas_width)
+    def cancel_drawing(*trace_arguments):
+        stop_drawing()
+        if shutting_down.get():
+            window.destroy()
 
-    if VERBOSE:
-        print("Seed saved to: " + str(saved_seed_file_path))
+    canvas.bind("<ButtonPress-1>", start_stroke)
+    canvas.bind("<B1-Motion>", continue_stroke)
+    canvas.bind("<ButtonRelease-1>", end_stroke)
+    traces = [(viewport.changed, viewport.changed.trace_add("write", redraw_seed)),
+              (is_button_apply_drawn_seed_pressed, is_button_apply_drawn_seed_pressed.trace_add("write",
+                                                                                                apply_drawn_seed)),
+              (simulation_number, simulation_number.trace_add("write", cancel_drawing)),
+              (shutting_down, shutting_down.trace_add("write", cancel_drawing))]
+
+
+def get_brush_cells(brush_name, y, x):
+    """
+    Lists the cells a brush covers, or the cells of the pattern a stamp places, centred on a cell.
+    :param brush_name: The name of one of BRUSH_SIZES or of STAMPS
+    :type brush_name: str
+    :param y: The row of the cell
+    :type y: int
+    :param x: The column of the cell
+    :type x: int
+    :return: cells (list of lists)
+    """
+    if brush_name in STAMPS:
+        stamp = STAMPS[brush_name]
+        top = y - max(cell[0] for cell in stamp) // 2
+        left = x - max(cell[1] for cell in stamp) // 2
+        return [[top + cell_y, left + cell_x] for cell_y, cell_x in stamp]
+
+    brush_size = BRUSH_SIZES[0]
+    for size in BRUSH_SIZES:
+        if brush_name == get_brush_name(size):
+            brush_size = size
 
-    # Reset variables
-    canvas.delete("all")
-    button_apply_drawn_seed.grid_remove()
-    is_button_apply_drawn_seed_pressed.set(False)
+    top = y - brush_size // 2
+    left = x - brush_size // 2
+    return [[cell_y, cell_x] for cell_y in range(top, top + brush_size) for cell_x in range(left, left + brush_size)]
 
 
-def generate_seed(canvas_height, canvas_width, min_auto_seed_percent, max_auto_seed_percent, current_seed):
+def get_line_cells(y1, x1, y2, x2):
+    """
+    Lists the cells on a straight line from one cell to another, both included, using Bresenham's algorithm.
+    :param y1: The row of the first cell
+    :type y1: int
+    :param x1: The column of the first cell
+    :type x1: int
+    :param y2: The row of the last cell
+    :type y2: int
+    :param x2: The column of the last cell
+    :type x2: int
+    :return: cells (list of lists)
+    """
+    height = abs(y2 - y1)
+    width = abs(x2 - x1)
+    step_y = 1 if y2 > y1 else -1
+    step_x = 1 if x2 > x1 else -1
+    error = width - height
+
+    cells = [[y1, x1]]
+    y, x = y1, x1
+    while y != y2 or x != x2:
+        doubled_error = 2 * error
+        if doubled_error > -height:
+            error -= height
+            x += step_x
+        if doubled_error < width:
+            error += width
+            y += step_y
+        cells.append([y, x])
+
+    return cells
+
+
+def generate_seed(canvas_height, canvas_width, min_auto_seed_percent, max_auto_seed_percent, current_seed,
+                  boundary_mode, rule):
     """
     Generates a list of cells that will be alive initially.
     :param canvas_height: The height of the canvas in pixels
@@ -836,6 +1348,38 @@ def generate_seed(canvas_height, canvas_width, min_auto_seed_percent, max_auto_s
     :type max_auto_seed_percent: tkinter.IntVar
     :param current_seed: The seed that determines which cells start as alive or not
     :type current_seed: list of lists
+    :param boundary_mode: What lies beyond the edges of the grid, saved along with the seed
+    :type boundary_mode: str
+    :param rule: The rule in B/S notation, saved along with the seed
+    :type rule: str
+    :return: None
+    """
+    generate_random_seed(canvas_height, canvas_width, min_auto_seed_percent.get(), max_auto_seed_percent.get(),
+                         current_seed)
+
+    # Save seed to file, named with date and time (.seed extension)
+    if VERBOSE:
+        print("Saving seed")
+
+    saved_seed_file_path = save_seed_to_file(current_seed, canvas_height, canvas_width, boundary_mode, rule)
+
+    if VERBOSE:
+        print("Seed saved to: " + str(saved_seed_file_path))
+
+
+def generate_random_seed(canvas_height, canvas_width, min_seed_percent, max_seed_percent, current_seed):
+    """
+    Fills the seed with a random amount of randomly placed living cells.
+    :param canvas_height: The height of the canvas in pixels
+    :type canvas_height: int
+    :param canvas_width: The width of the canvas in pixels
+    :type canvas_width: int
+    :param min_seed_percent: The minimum percentage of the grid which will be alive initially
+    :type min_seed_percent: int
+    :param max_seed_percent: The maximum percentage of the grid which will be alive initially
+    :type max_seed_percent: int
+    :param current_seed: The seed that determines which cells start as alive or not
+    :type current_seed: list of lists
     :return: None
     """
     # Prepares variables
@@ -843,8 +1387,8 @@ def generate_seed(canvas_height, canvas_width, min_auto_seed_percent, max_auto_s
         print("Preparing variables")
 
     current_seed.clear()
-    min_alive_cells = int((canvas_height * canvas_width) * (min_auto_seed_percent.get() / 100))
-    max_alive_cells = int((canvas_height * canvas_width) * (max_auto_seed_percent.get() / 100))
+    min_alive_cells = int((canvas_height * canvas_width) * (min_seed_percent / 100))
+    max_alive_cells = int((canvas_height * canvas_width) * (max_seed_percent / 100))
     amount_of_cells_to_seed = random.randint(min_alive_cells, max_alive_cells)
 
     if VERBOSE:
@@ -868,17 +1412,9 @@ def generate_seed(canvas_height, canvas_width, min_auto_seed_percent, max_auto_s
     if VERBOSE:
         print("Random seed generated")
 
-    # Save seed to file, named with date and time (.seed extension)
-    if VERBOSE:
-        print("Saving seed")
-
-    saved_seed_file_path = save_seed_to_file(current_seed, canvas_height, canvas_width)
-
-    if VERBOSE:
-        print("Seed saved to: " + str(saved_seed_file_path))
 
-
-def save_seed_to_file(current_seed, canvas_height, canvas_width):
+def save_seed_to_file(current_seed, canvas_height, canvas_width, boundary_mode=DEFAULT_BOUNDARY_MODE,
+                      rule=DEFAULT_RULE):
     """
     Saves the current seed as a file.
     Location: seeds/
@@ -890,6 +1426,10 @@ def save_seed_to_file(current_seed, canvas_height, canvas_width):
     :type canvas_height: int
     :param canvas_width: The width of the canvas in pixels
     :type canvas_width: int
+    :param boundary_mode: What lies beyond the edges of the grid
+    :type boundary_mode: str
+    :param rule: The rule in B/S notation
+    :type rule: str
     :return: filename
     """
     # Determines filename including path
@@ -905,21 +1445,1065 @@ def save_seed_to_file(current_seed, canvas_height, canvas_width):
     if VERBOSE:
         print("Filename and path determined")
 
-    # Stores seed in file, one line per cell that starts as alive
-    if VERBOSE:
+    write_seed_file(file_path, current_seed, canvas_height, canvas_width, boundary_mode, rule)
+
+    return file_path
+
+
+def write_seed_file(file_path, current_seed, canvas_height, canvas_width, boundary_mode=DEFAULT_BOUNDARY_MODE,
+                    rule=DEFAULT_RULE):
+    """
+    Stores a seed in a file, after a first line with the canvas size, boundary mode and rule,
+    one line per cell that starts as alive.
+    :param file_path: The path of the seed file
+    :type file_path: str or pathlib.Path
+    :param current_seed: A list of lists containing y, x coordinates of cells that start as alive
+    :type current_seed: list of lists
+    :param canvas_height: The height of the canvas in pixels
+    :type canvas_height: int
+    :param canvas_width: The width of the canvas in pixels
+    :type canvas_width: int
+    :param boundary_mode: What lies beyond the edges of the grid
+    :type boundary_mode: str
+    :param rule: The rule in B/S notation
+    :type rule: str
+    :return: None
+    """
+    if VERBOSE:
         print("Writing seed to file")
 
-    with file_path.open('w') as file:
-        file.write("[" + str(canvas_height) + ", " + str(canvas_width) + "]\n")
+    with open(file_path, 'w') as file:
+        file.write("[" + str(canvas_height) + ", " + str(canvas_width) + ", '" + boundary_mode + "', '" + rule +
+                   "']\n")
         for cell in current_seed:
             file.write("%s\n" % cell)
 
     if VERBOSE:
         print("Seed written to file")
 
+
+def write_binary_seed_file(file_path, current_seed, canvas_height, canvas_width, boundary_mode=DEFAULT_BOUNDARY_MODE,
+                           rule=DEFAULT_RULE):
+    """
+    Stores a seed in a binary file, which BinarySeed loads without parsing a line per cell.
+    :param file_path: The path of the seed file
+    :type file_path: str or pathlib.Path
+    :param current_seed: A list of lists containing y, x coordinates of cells that start as alive
+    :type current_seed: list of lists
+    :param canvas_height: The height of the canvas in pixels
+    :type canvas_height: int
+    :param canvas_width: The width of the canvas in pixels
+    :type canvas_width: int
+    :param boundary_mode: What lies beyond the edges of the grid
+    :type boundary_mode: str
+    :param rule: The rule in B/S notation
+    :type rule: str
+    :return: None
+    """
+    with open(file_path, "wb") as file:
+        file.write(encode_binary_seed(current_seed, canvas_height, canvas_width, boundary_mode, rule))
+
+
+def encode_binary_seed(current_seed, canvas_height, canvas_width, boundary_mode=DEFAULT_BOUNDARY_MODE,
+                       rule=DEFAULT_RULE):
+    """
+    Encodes a seed the way binary seed files store it.
+    After a header with the canvas size, boundary mode, rule and population, the living cells follow either as
+    sorted 4 byte little-endian indices y * canvas_width + x, or as a bit per cell of the whole board, in rows,
+    the least significant bit first. Whichever of the two is smaller is used, so sparse seeds store their cells
+    and dense ones their board.
+    :param current_seed: A list of lists containing y, x coordinates of cells that start as alive
+    :type current_seed: list of lists
+    :param canvas_height: The height of the canvas in pixels
+    :type canvas_height: int
+    :param canvas_width: The width of the canvas in pixels
+    :type canvas_width: int
+    :param boundary_mode: What lies beyond the edges of the grid
+    :type boundary_mode: str
+    :param rule: The rule in B/S notation
+    :type rule: str
+    :return: binary_seed (bytes)
+    """
+    if canvas_height * canvas_width > 0xFFFFFFFF:
+        raise ValueError("Binary seed files hold at most " + str(0xFFFFFFFF) + " cells")
+    if len(boundary_mode) > 16 or len(rule) > 32:
+        raise ValueError("The boundary mode or rule is too long for a binary seed file")
+
+    # A cell listed twice is alive once
+    indices = sorted({y * canvas_width + x for y, x in current_seed})
+    board_bytes = (canvas_height * canvas_width + 7) // 8
+    if 4 * len(indices) < board_bytes:
+        encoding = BINARY_SEED_CELLS
+        payload = array("I", indices)
+        if sys.byteorder == "big":
+            payload.byteswap()
+    else:
+        encoding = BINARY_SEED_BITS
+        payload = bytearray(board_bytes)
+        for index in indices:
+            payload[index >> 3] |= 1 << (index & 7)
+
+    return BINARY_SEED_HEADER.pack(BINARY_SEED_MAGIC, encoding, canvas_height, canvas_width, len(indices),
+                                   boundary_mode.encode("ascii"), rule.encode("ascii")) + bytes(payload)
+
+
+def is_binary_seed_file(file_path):
+    """
+    :param file_path: The path of the seed file
+    :type file_path: str or pathlib.Path
+    :return: Whether or not the file is a binary seed file (bool)
+    """
+    with open(file_path, "rb") as file:
+        return file.read(len(BINARY_SEED_MAGIC)) == BINARY_SEED_MAGIC
+
+
+def convert_seed_file(file_path, binary_file_path=None):
+    """
+    Converts a text seed file into a binary one.
+    :param file_path: The path of the text seed file
+    :type file_path: str or pathlib.Path
+    :param binary_file_path: The path of the binary seed file, defaults to file_path with BINARY_SEED_EXTENSION
+    :type binary_file_path: str or pathlib.Path
+    :return: binary_file_path (pathlib.Path)
+    """
+    if binary_file_path is None:
+        binary_file_path = pathlib.Path(file_path).with_suffix(BINARY_SEED_EXTENSION)
+
+    current_seed = []
+    canvas_height, canvas_width, boundary_mode, rule = read_seed_file(file_path, current_seed)
+    write_binary_seed_file(binary_file_path, current_seed, canvas_height, canvas_width, boundary_mode, rule)
+
+    return pathlib.Path(binary_file_path)
+
+
+class BinarySeed:
+    """
+    A binary seed file, memory-mapped so its cells are read straight from the file into the array they end up in,
+    without creating a Python object per cell. Close it, or use it in a with statement, once done.
+    """
+    def __init__(self, file_path=None, buffer=None):
+        """
+        :param file_path: The path of the seed file, as write_binary_seed_file makes them
+        :type file_path: str or pathlib.Path
+        :param buffer: The seed as encode_binary_seed makes it, read instead of a file
+        :type buffer: bytes
+        """
+        if buffer is not None:
+            self.mmap = buffer
+            file_path = "buffer"
+        else:
+            with open(file_path, "rb") as file:
+                self.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self.mmap) < BINARY_SEED_HEADER.size:
+            self.close()
+            raise ValueError("Not a binary seed file: " + str(file_path))
+        magic, self.encoding, self.canvas_height, self.canvas_width, self.population, boundary_mode, rule = \
+            BINARY_SEED_HEADER.unpack_from(self.mmap)
+        if magic != BINARY_SEED_MAGIC or self.encoding not in (BINARY_SEED_CELLS, BINARY_SEED_BITS):
+            self.close()
+            raise ValueError("Not a binary seed file: " + str(file_path))
+        self.boundary_mode = boundary_mode.rstrip(b"\0").decode("ascii")
+        self.rule = rule.rstrip(b"\0").decode("ascii")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Unmaps the file.
+        :return: None
+        """
+        if isinstance(self.mmap, mmap.mmap):
+            self.mmap.close()
+
+    def get_indices(self):
+        """
+        Lists the living cells by their index y * canvas_width + x, in order.
+        :return: indices (numpy.ndarray, or array.array without NumPy)
+        """
+        offset = BINARY_SEED_HEADER.size
+        if self.encoding == BINARY_SEED_BITS:
+            if numpy is not None:
+                return numpy.flatnonzero(self.get_cells())
+
+            indices = array("I")
+            for byte_index, byte in enumerate(self.mmap[offset:]):
+                for bit in range(8):
+                    if byte >> bit & 1:
+                        indices.append(8 * byte_index + bit)
+            return indices
+
+        if numpy is not None:
+            return numpy.frombuffer(self.mmap, dtype="<u4", count=self.population, offset=offset).astype(numpy.int64)
+
+        indices = array("I", self.mmap[offset:offset + 4 * self.population])
+        if sys.byteorder == "big":
+            indices.byteswap()
+        return indices
+
+    def get_cells(self):
+        """
+        Unpacks the board into the array of cells NumpyEngine, BitBoard and ParallelEngine step.
+        :return: cells (numpy.ndarray)
+        """
+        if numpy is None:
+            raise ImportError("Unpacking a binary seed into an array requires NumPy to be installed")
+
+        board_size = self.canvas_height * self.canvas_width
+        if self.encoding == BINARY_SEED_BITS:
+            packed_cells = numpy.frombuffer(self.mmap, dtype=numpy.uint8, count=(board_size + 7) // 8,
+                                            offset=BINARY_SEED_HEADER.size)
+            cells = numpy.unpackbits(packed_cells, count=board_size, bitorder="little")
+            del packed_cells
+        else:
+            cells = numpy.zeros(board_size, dtype=numpy.uint8)
+            cells[self.get_indices()] = 1
+
+        return cells.reshape(self.canvas_height, self.canvas_width)
+
+    def to_grid(self):
+        """
+        Unpacks the board into the 2D list of cells PythonEngine and SparseEngine step.
+        :return: grid (list of lists)
+        """
+        if numpy is not None:
+            return self.get_cells().tolist()
+
+        grid = [[0] * self.canvas_width for _ in range(self.canvas_height)]
+        for index in self.get_indices():
+            y, x = divmod(index, self.canvas_width)
+            grid[y][x] = 1
+        return grid
+
+    def to_seed(self):
+        """
+        Lists the living cells.
+        :return: cells (list of lists)
+        """
+        if numpy is not None:
+            return numpy.argwhere(self.get_cells()).tolist()
+
+        return [list(divmod(index, self.canvas_width)) for index in self.get_indices()]
+
+
+def write_checkpoint_file(file_path, living_cells, generation_number, canvas_height, canvas_width,
+                          boundary_mode=DEFAULT_BOUNDARY_MODE, rule=DEFAULT_RULE):
+    """
+    Stores the board of a running simulation along with its generation number and the state of the random number
+    generator, so the simulation can be resumed from there. The board is stored as a binary seed, and everything
+    but the first bytes identifying the file is compressed.
+    The checkpoint is written to a temporary file that then replaces file_path, so an interrupted write never leaves
+    a broken checkpoint behind.
+    :param file_path: The path of the checkpoint file
+    :type file_path: str or pathlib.Path
+    :param living_cells: A list of lists containing y, x coordinates of the living cells
+    :type living_cells: list of lists
+    :param generation_number: The number of the generation the board is at
+    :type generation_number: int
+    :param canvas_height: The height of the canvas in pixels
+    :type canvas_height: int
+    :param canvas_width: The width of the canvas in pixels
+    :type canvas_width: int
+    :param boundary_mode: What lies beyond the edges of the grid
+    :type boundary_mode: str
+    :param rule: The rule in B/S notation
+    :type rule: str
+    :return: None
+    """
+    version, internal_state, gauss_next = random.getstate()
+    random_state = json.dumps([version, internal_state, gauss_next]).encode("ascii")
+    checkpoint = CHECKPOINT_HEADER.pack(generation_number, len(random_state)) + random_state +\
+        encode_binary_seed(living_cells, canvas_height, canvas_width, boundary_mode, rule)
+
+    file_path = pathlib.Path(file_path)
+    file_descriptor, temporary_path = tempfile.mkstemp(prefix=file_path.name, dir=file_path.parent)
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            file.write(CHECKPOINT_MAGIC)
+            file.write(zlib.compress(checkpoint, CHECKPOINT_COMPRESSION_LEVEL))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, file_path)
+    except BaseException:
+        os.remove(temporary_path)
+        raise
+
+
+def is_checkpoint_file(file_path):
+    """
+    :param file_path: The path of the file
+    :type file_path: str or pathlib.Path
+    :return: Whether or not the file is a checkpoint file (bool)
+    """
+    with open(file_path, "rb") as file:
+        return file.read(len(CHECKPOINT_MAGIC)) == CHECKPOINT_MAGIC
+
+
+def read_checkpoint_file(file_path):
+    """
+    Loads a checkpoint and restores the state of the random number generator saved with it.
+    :param file_path: The path of the checkpoint file, as write_checkpoint_file makes them
+    :type file_path: str or pathlib.Path
+    :return: binary_seed (BinarySeed) holding the board, generation_number (int)
+    """
+    with open(file_path, "rb") as file:
+        if file.read(len(CHECKPOINT_MAGIC)) != CHECKPOINT_MAGIC:
+            raise ValueError("Not a checkpoint file: " + str(file_path))
+        checkpoint = zlib.decompress(file.read())
+
+    generation_number, random_state_length = CHECKPOINT_HEADER.unpack_from(checkpoint)
+    version, internal_state, gauss_next = json.loads(
+        checkpoint[CHECKPOINT_HEADER.size:CHECKPOINT_HEADER.size + random_state_length])
+    random.setstate((version, tuple(internal_state), gauss_next))
+
+    return BinarySeed(buffer=checkpoint[CHECKPOINT_HEADER.size + random_state_length:]), generation_number
+
+
+def save_checkpoint_to_file(grid, generation_number, boundary_mode=DEFAULT_BOUNDARY_MODE, rule=DEFAULT_RULE):
+    """
+    Saves a checkpoint of the grid as a file.
+    Location: checkpoints/
+    Filename: yyyy.mm.dd.HH.MM.SS.generation
+    File extension: CHECKPOINT_EXTENSION
+    :param grid: The 2D list of cells
+    :type grid: list of lists
+    :param generation_number: The number of the generation the grid is at
+    :type generation_number: int
+    :param boundary_mode: What lies beyond the edges of the grid
+    :type boundary_mode: str
+    :param rule: The rule in B/S notation
+    :type rule: str
+    :return: filename
+    """
+    canvas_height = len(grid)
+    canvas_width = len(grid[0]) if canvas_height else 0
+    filename = datetime.now().strftime("%Y.%m.%d.%H.%M.%S") + "." + str(generation_number) + CHECKPOINT_EXTENSION
+    checkpoint_dir = pathlib.Path("checkpoints/")
+    checkpoint_dir.mkdir(parents=True, exist_ok=True)
+    file_path = checkpoint_dir / filename
+
+    living_cells = [[y, x] for y, row in enumerate(grid) for x, cell in enumerate(row) if cell == 1]
+    write_checkpoint_file(file_path, living_cells, generation_number, canvas_height, canvas_width, boundary_mode,
+                          rule)
+
     return file_path
 
 
+class Checkpointer:
+    """
+    Saves checkpoints of a headless run to a file, every interval generations and whenever one is requested,
+    for example by sending the process SIGUSR1.
+    """
+    def __init__(self, file_path, canvas_height, canvas_width, boundary_mode=DEFAULT_BOUNDARY_MODE,
+                 rule=DEFAULT_RULE, interval=0):
+        """
+        :param file_path: The path of the checkpoint file, replaced by every checkpoint
+        :type file_path: str or pathlib.Path
+        :param canvas_height: The height of the canvas in pixels
+        :type canvas_height: int
+        :param canvas_width: The width of the canvas in pixels
+        :type canvas_width: int
+        :param boundary_mode: What lies beyond the edges of the grid
+        :type boundary_mode: str
+        :param rule: The rule in B/S notation
+        :type rule: str
+        :param interval: The generations between checkpoints, 0 to only save them on request
+        :type interval: int
+        """
+        self.file_path = file_path
+        self.canvas_height = canvas_height
+        self.canvas_width = canvas_width
+        self.boundary_mode = boundary_mode
+        self.rule = rule
+        self.interval = interval
+        self.requested = False
+        self.generation_saved = None
+
+    def request(self, *signal_arguments):
+        """
+        Asks for a checkpoint of the next generation the run gets to. Safe to call from a signal handler.
+        :return: None
+        """
+        self.requested = True
+
+    def get_generations_until_due(self, generation_number):
+        """
+        :param generation_number: The number of the generation the run is at
+        :type generation_number: int
+        :return: The most generations the run can advance before it has to check whether a checkpoint is due (int)
+        """
+        generations = CHECKPOINT_POLL_GENERATIONS
+        if self.interval > 0:
+            generations = min(generations, self.interval - generation_number % self.interval)
+
+        return generations
+
+    def is_due(self, generation_number):
+        """
+        :param generation_number: The number of the generation the run is at
+        :type generation_number: int
+        :return: Whether or not a checkpoint should be saved (bool)
+        """
+        return self.requested or (self.interval > 0 and generation_number % self.interval == 0)
+
+    def save(self, engine, generation_number):
+        """
+        :param engine: The simulation engine
+        :type engine: PythonEngine, NumpyEngine, SparseEngine, BitBoard, ParallelEngine or HashLife
+        :param generation_number: The number of the generation the engine is at
+        :type generation_number: int
+        :return: None
+        """
+        self.requested = False
+        self.generation_saved = generation_number
+        write_checkpoint_file(self.file_path, get_engine_cells(engine, self.canvas_height, self.canvas_width),
+                              generation_number, self.canvas_height, self.canvas_width, self.boundary_mode, self.rule)
+        print("Checkpoint of generation " + str(generation_number) + " written to: " + str(self.file_path))
+
+
+def get_seed_hash(indices, canvas_height, canvas_width, boundary_mode=DEFAULT_BOUNDARY_MODE, rule=DEFAULT_RULE):
+    """
+    Hashes a seed by what it simulates rather than how it is stored, so the same seed saved as a .seed and a binary
+    seed file, or with its cells in another order, hashes the same.
+    :param indices: The living cells as y * canvas_width + x, in any order
+    :type indices: iterable of ints
+    :param canvas_height: The height of the canvas in pixels
+    :type canvas_height: int
+    :param canvas_width: The width of the canvas in pixels
+    :type canvas_width: int
+    :param boundary_mode: What lies beyond the edges of the grid
+    :type boundary_mode: str
+    :param rule: The rule in B/S notation
+    :type rule: str
+    :return: content_hash (str)
+    """
+    cells = array("I", sorted(set(int(index) for index in indices)))
+    if sys.byteorder == "big":
+        cells.byteswap()
+
+    content_hash = hashlib.sha256()
+    content_hash.update((str(canvas_height) + "x" + str(canvas_width) + " " + boundary_mode + " " +
+                         format_rule(compile_rule(rule)) + "\n").encode("ascii"))
+    content_hash.update(cells.tobytes())
+
+    return content_hash.hexdigest()
+
+
+class SeedCatalog:
+    """
+    An SQLite index of the seed files in a directory: their canvas size, boundary mode, rule, population, density and
+    content hash, along with what is known of how each seed turns out. Files are only read again once their size or
+    modification time changes, and seeds with the same content hash are duplicates of each other.
+    The outcome of a seed is stored by its content hash, so it is shared by all of its duplicates.
+    """
+    def __init__(self, catalog_path=SEED_CATALOG_PATH):
+        """
+        :param catalog_path: The path of the SQLite database, created if it does not exist
+        :type catalog_path: str or pathlib.Path
+        """
+        pathlib.Path(catalog_path).parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(catalog_path))
+        self.connection.row_factory = sqlite3.Row
+        with self.connection:
+            self.connection.executescript("""
+                CREATE TABLE IF NOT EXISTS seeds (
+                    path TEXT PRIMARY KEY,
+                    modified INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    canvas_height INTEGER NOT NULL,
+                    canvas_width INTEGER NOT NULL,
+                    boundary_mode TEXT NOT NULL,
+                    rule TEXT NOT NULL,
+                    population INTEGER NOT NULL,
+                    density REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS seeds_by_size ON seeds (canvas_height, canvas_width);
+                CREATE INDEX IF NOT EXISTS seeds_by_hash ON seeds (content_hash);
+                CREATE TABLE IF NOT EXISTS outcomes (
+                    content_hash TEXT PRIMARY KEY,
+                    lifespan INTEGER NOT NULL,
+                    settled INTEGER NOT NULL,
+                    final_population INTEGER NOT NULL,
+                    period INTEGER
+                );
+                CREATE INDEX IF NOT EXISTS outcomes_by_lifespan ON outcomes (lifespan);
+            """)
+
+    def close(self):
+        """
+        :return: None
+        """
+        self.connection.close()
+
+    def update(self, seed_dir="seeds/"):
+        """
+        Indexes the seed files in a directory and its subdirectories that are new or have changed since they were
+        last indexed, and forgets the ones that are gone.
+        :param seed_dir: The directory
+        :type seed_dir: str or pathlib.Path
+        :return: files_indexed (int), files_removed (int)
+        """
+        indexed_files = {row["path"]: (row["modified"], row["size"])
+                         for row in self.connection.execute("SELECT path, modified, size FROM seeds")}
+        seed_dir = pathlib.Path(seed_dir)
+        files_indexed = 0
+        files_found = set()
+        for file_path in seed_dir.rglob("*"):
+            if file_path.suffix not in SEED_EXTENSIONS or not file_path.is_file():
+                continue
+            files_found.add(str(file_path))
+            file_status = file_path.stat()
+            if indexed_files.get(str(file_path)) != (file_status.st_mtime_ns, file_status.st_size):
+                self.index_file(file_path)
+                files_indexed += 1
+
+        # Only the files below the directory are known to be gone
+        files_removed = [(path,) for path in indexed_files
+                         if path not in files_found and seed_dir in pathlib.Path(path).parents]
+        with self.connection:
+            self.connection.executemany("DELETE FROM seeds WHERE path = ?", files_removed)
+
+        return files_indexed, len(files_removed)
+
+    def index_file(self, file_path):
+        """
+        Indexes a .seed or binary seed file, unless it has not changed since it was last indexed.
+        :param file_path: The path of the seed file
+        :type file_path: str or pathlib.Path
+        :return: content_hash (str)
+        """
+        file_path = pathlib.Path(file_path)
+        file_status = file_path.stat()
+        row = self.connection.execute("SELECT modified, size, content_hash FROM seeds WHERE path = ?",
+                                      (str(file_path),)).fetchone()
+        if row is not None and (row["modified"], row["size"]) == (file_status.st_mtime_ns, file_status.st_size):
+            return row["content_hash"]
+
+        if is_binary_seed_file(file_path):
+            with BinarySeed(file_path) as binary_seed:
+                canvas_height = binary_seed.canvas_height
+                canvas_width = binary_seed.canvas_width
+                boundary_mode = binary_seed.boundary_mode
+                rule = binary_seed.rule
+                indices = binary_seed.get_indices()
+        else:
+            current_seed = []
+            canvas_height, canvas_width, boundary_mode, rule = read_seed_file(file_path, current_seed)
+            indices = {y * canvas_width + x for y, x in current_seed}
+
+        content_hash = get_seed_hash(indices, canvas_height, canvas_width, boundary_mode, rule)
+        population = len(indices)
+        with self.connection:
+            self.connection.execute("INSERT OR REPLACE INTO seeds VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                    (str(file_path), file_status.st_mtime_ns, file_status.st_size, content_hash,
+                                     canvas_height, canvas_width, boundary_mode, rule, population,
+                                     population / max(canvas_height * canvas_width, 1)))
+
+        return content_hash
+
+    def record_outcome(self, content_hash, lifespan, settled, final_population, period=None):
+        """
+        Remembers how a seed turned out. An outcome already known is only replaced by one that knows more:
+        a settled seed, or one simulated for longer.
+        :param content_hash: The content hash of the seed
+        :type content_hash: str
+        :param lifespan: The generation the seed settled into still lifes and oscillators at, or the generations
+        simulated if it had not settled by then
+        :type lifespan: int
+        :param settled: Whether or not the seed settled
+        :type settled: bool
+        :param final_population: The amount of living cells at the last generation simulated
+        :type final_population: int
+        :param period: The period of the seed once settled
+        :type period: int
+        :return: None
+        """
+        known_outcome = self.get_outcome(content_hash)
+        if known_outcome is not None and (known_outcome["settled"] or known_outcome["lifespan"] >= lifespan) and\
+                not settled:
+            return
+
+        with self.connection:
+            self.connection.execute("INSERT OR REPLACE INTO outcomes VALUES (?, ?, ?, ?, ?)",
+                                    (content_hash, lifespan, int(settled), final_population, period))
+
+    def get_outcome(self, content_hash):
+        """
+        :param content_hash: The content hash of the seed
+        :type content_hash: str
+        :return: outcome (sqlite3.Row or None) with lifespan, settled, final_population and period
+        """
+        return self.connection.execute("SELECT * FROM outcomes WHERE content_hash = ?", (content_hash,)).fetchone()
+
+    def find(self, canvas_height=None, canvas_width=None, rule=None, min_lifespan=None, max_lifespan=None,
+             min_population=None, max_population=None, period=None, limit=None):
+        """
+        Finds the seeds that match every filter given, the longest lived first. Filtering on the outcome leaves out
+        seeds that have not been simulated. A lifespan is at least the generations a seed that has not settled was
+        simulated for, so it matches a minimum lifespan but not a maximum one.
+        :param canvas_height: The height of the canvas
+        :type canvas_height: int
+        :param canvas_width: The width of the canvas
+        :type canvas_width: int
+        :param rule: The rule in B/S notation
+        :type rule: str
+        :param min_lifespan: The least generations the seed lived for
+        :type min_lifespan: int
+        :param max_lifespan: The most generations the seed lived for
+        :type max_lifespan: int
+        :param min_population: The least living cells of the seed
+        :type min_population: int
+        :param max_population: The most living cells of the seed
+        :type max_population: int
+        :param period: The period the seed settled into
+        :type period: int
+        :param limit: The most seeds to find
+        :type limit: int
+        :return: seeds (list of sqlite3.Row) with the columns of the seed and its outcome
+        """
+        conditions = []
+        parameters = []
+        for condition, value in (("seeds.canvas_height = ?", canvas_height), ("seeds.canvas_width = ?", canvas_width),
+                                 ("outcomes.lifespan >= ?", min_lifespan),
+                                 ("outcomes.lifespan <= ? AND outcomes.settled", max_lifespan),
+                                 ("seeds.population >= ?", min_population), ("seeds.population <= ?", max_population),
+                                 ("outcomes.period = ?", period)):
+            if value is not None:
+                conditions.append(condition)
+                parameters.append(value)
+        if rule is not None:
+            conditions.append("seeds.rule = ?")
+            parameters.append(format_rule(compile_rule(rule)))
+
+        query = "SELECT seeds.*, outcomes.lifespan, outcomes.settled, outcomes.final_population, outcomes.period " \
+                "FROM seeds LEFT JOIN outcomes ON outcomes.content_hash = seeds.content_hash"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY outcomes.lifespan DESC, seeds.path"
+        if limit is not None:
+            query += " LIMIT ?"
+            parameters.append(limit)
+
+        return self.connection.execute(query, parameters).fetchall()
+
+    def find_by_hash(self, content_hash):
+        """
+        :param content_hash: The content hash of the seed
+        :type content_hash: str
+        :return: seed (sqlite3.Row or None) with the columns SeedCatalog.find gives, of one of its files
+        """
+        return self.connection.execute(
+            "SELECT seeds.*, outcomes.lifespan, outcomes.settled, outcomes.final_population, outcomes.period "
+            "FROM seeds LEFT JOIN outcomes ON outcomes.content_hash = seeds.content_hash "
+            "WHERE seeds.content_hash = ? ORDER BY seeds.path LIMIT 1", (content_hash,)).fetchone()
+
+    def find_duplicates(self):
+        """
+        Groups the seed files that hold the same seed.
+        :return: duplicates (list of lists of paths)
+        """
+        duplicates = {}
+        for row in self.connection.execute("SELECT content_hash, path FROM seeds WHERE content_hash IN "
+                                           "(SELECT content_hash FROM seeds GROUP BY content_hash HAVING COUNT(*) > 1) "
+                                           "ORDER BY content_hash, path"):
+            duplicates.setdefault(row["content_hash"], []).append(row["path"])
+
+        return list(duplicates.values())
+
+
+def describe_catalogued_seed(row):
+    """
+    :param row: A seed found in the catalog by SeedCatalog.find
+    :type row: sqlite3.Row
+    :return: description (str)
+    """
+    description = row["path"] + ": " + str(row["canvas_height"]) + "x" + str(row["canvas_width"]) + ", " +\
+        row["rule"] + ", " + str(row["population"]) + " cells (" + str(round(100 * row["density"], 1)) + "%)"
+    if row["lifespan"] is None:
+        return description + ", not simulated yet"
+    if not row["settled"]:
+        return description + ", still changing after " + str(row["lifespan"]) + " generations"
+
+    return description + ", settled at generation " + str(row["lifespan"]) + " with period " + str(row["period"]) +\
+        " and " + str(row["final_population"]) + " cells"
+
+
+def get_pattern_format(file_path):
+    """
+    :param file_path: The path of a pattern file
+    :type file_path: str or pathlib.Path
+    :return: The format of the pattern file by its extension, one of PATTERN_FORMATS' values, or None
+    """
+    return PATTERN_FORMATS.get(pathlib.Path(file_path).suffix.lower())
+
+
+def parse_pattern_rule(rule):
+    """
+    Reads the rule of a pattern file, which is either in B/S notation or in the older S/B notation like 23/3.
+    :param rule: The rule
+    :type rule: str
+    :return: rule (str) in B/S notation
+    """
+    rule = rule.strip()
+    parts = rule.split("/")
+    if len(parts) == 2 and not any(character.isalpha() for character in rule):
+        rule = "B" + parts[1] + "/S" + parts[0]
+
+    return format_rule(compile_rule(rule))
+
+
+def read_pattern_header(file, pattern_format):
+    """
+    Reads the comments and header of a pattern file, leaving the file at the first line of cells.
+    :param file: The pattern file, opened for reading text
+    :type file: io.TextIOWrapper
+    :param pattern_format: The format of the pattern file, one of PATTERN_FORMATS' values
+    :type pattern_format: str
+    :return: rule (str or None), pattern_height (int or None), pattern_width (int or None)
+    """
+    rule = pattern_height = pattern_width = None
+    while True:
+        position = file.tell()
+        line = file.readline()
+        if not line:
+            break
+        stripped_line = line.strip()
+
+        # Empty lines are rows of dead cells in a plaintext file
+        if pattern_format == "plaintext":
+            if line.startswith("!"):
+                continue
+        elif not stripped_line or stripped_line.startswith("#"):
+            continue
+
+        # An RLE file has a line like "x = 3, y = 3, rule = B3/S23" in front of its cells
+        if pattern_format == "rle" and stripped_line.startswith("x"):
+            for field in stripped_line.split(","):
+                name, _, value = field.partition("=")
+                name = name.strip().lower()
+                if name == "x":
+                    pattern_width = int(value)
+                elif name == "y":
+                    pattern_height = int(value)
+                elif name == "rule":
+                    rule = parse_pattern_rule(value)
+            break
+
+        file.seek(position)
+        break
+
+    return rule, pattern_height, pattern_width
+
+
+def iterate_pattern_runs(file, pattern_format):
+    """
+    Reads the cells of a pattern file after its header, as runs of living cells next to each other in a row.
+    The file is read a piece at a time, so however big the pattern is, only the runs being handed out are in memory.
+    Life 1.06 coordinates may be negative, the others start from the top left corner of the pattern at 0, 0.
+    :param file: The pattern file, opened for reading text and positioned by read_pattern_header
+    :type file: io.TextIOWrapper
+    :param pattern_format: The format of the pattern file, one of PATTERN_FORMATS' values
+    :type pattern_format: str
+    :return: runs (generator of tuples of y, x and the amount of cells)
+    """
+    if pattern_format == "life106":
+        for line in file:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                x, y = line.split()[:2]
+                yield int(y), int(x), 1
+
+    elif pattern_format == "plaintext":
+        for y, line in enumerate(line for line in file if not line.startswith("!")):
+            for run in PLAINTEXT_LIVING_RUN.finditer(line):
+                yield y, run.start(), run.end() - run.start()
+
+    elif pattern_format == "rle":
+        y = x = 0
+        pending_digits = ""
+        while True:
+            chunk = file.read(PATTERN_CHUNK_SIZE)
+            if not chunk:
+                break
+
+            # A run count cut off by a line break or the end of the chunk goes with the next tag
+            for count, tag in RLE_TOKEN.findall(chunk):
+                count = pending_digits + count
+                if not tag:
+                    pending_digits = count
+                    continue
+                pending_digits = ""
+                count = int(count) if count else 1
+                if tag == "!":
+                    return
+                elif tag == "$":
+                    y += count
+                    x = 0
+                elif tag in "b.":
+                    x += count
+                else:
+                    yield y, x, count
+                    x += count
+
+    else:
+        raise ValueError("Unknown pattern format: " + str(pattern_format))
+
+
+def place_pattern_runs(runs, canvas_height, canvas_width, top=0, left=0):
+    """
+    Moves runs of living cells to where the pattern is placed on the canvas, cutting off what falls outside of it.
+    :param runs: The runs, as iterate_pattern_runs reads them
+    :type runs: iterable of tuples
+    :param canvas_height: The height of the canvas in pixels
+    :type canvas_height: int
+    :param canvas_width: The width of the canvas in pixels
+    :type canvas_width: int
+    :param top: Where on the canvas the row 0 of the pattern goes
+    :type top: int
+    :param left: Where on the canvas the column 0 of the pattern goes
+    :type left: int
+    :return: runs (generator of tuples of y, x and the amount of cells)
+    """
+    for y, x, count in runs:
+        y += top
+        start = max(x + left, 0)
+        end = min(x + left + count, canvas_width)
+        if 0 <= y < canvas_height and start < end:
+            yield y, start, end - start
+
+
+def get_pattern_bounds(file_path):
+    """
+    Finds the smallest rectangle around the living cells of a pattern file. RLE files say how big they are,
+    the others are read through once.
+    :param file_path: The path of the pattern file
+    :type file_path: str or pathlib.Path
+    :return: top (int), left (int), pattern_height (int), pattern_width (int)
+    """
+    pattern_format = get_pattern_format(file_path)
+    with open(file_path, "r") as file:
+        rule, pattern_height, pattern_width = read_pattern_header(file, pattern_format)
+        if pattern_height is not None and pattern_width is not None:
+            return 0, 0, pattern_height, pattern_width
+
+        top = left = bottom = right = None
+        for y, x, count in iterate_pattern_runs(file, pattern_format):
+            if top is None:
+                top, left, bottom, right = y, x, y, x + count - 1
+            top = min(top, y)
+            bottom = max(bottom, y)
+            left = min(left, x)
+            right = max(right, x + count - 1)
+
+    if top is None:
+        return 0, 0, 0, 0
+
+    return top, left, bottom - top + 1, right - left + 1
+
+
+def get_centred_pattern_offset(file_path, canvas_height, canvas_width):
+    """
+    :param file_path: The path of the pattern file
+    :type file_path: str or pathlib.Path
+    :param canvas_height: The height of the canvas in pixels
+    :type canvas_height: int
+    :param canvas_width: The width of the canvas in pixels
+    :type canvas_width: int
+    :return: top (int), left (int) to place the pattern at so it is in the middle of the canvas
+    """
+    pattern_top, pattern_left, pattern_height, pattern_width = get_pattern_bounds(file_path)
+
+    return (canvas_height - pattern_height) // 2 - pattern_top, (canvas_width - pattern_width) // 2 - pattern_left
+
+
+def read_pattern_file(file_path, current_seed, canvas_height, canvas_width, top=None, left=None):
+    """
+    Loads an RLE, Life 1.06 or plaintext pattern file into memory as a seed of the given canvas size.
+    :param file_path: The path of the pattern file
+    :type file_path: str or pathlib.Path
+    :param current_seed: The seed that determines which cells start as alive or not
+    :type current_seed: list of lists
+    :param canvas_height: The height of the canvas in pixels
+    :type canvas_height: int
+    :param canvas_width: The width of the canvas in pixels
+    :type canvas_width: int
+    :param top: Where on the canvas the row 0 of the pattern goes, None to centre the pattern
+    :type top: int
+    :param left: Where on the canvas the column 0 of the pattern goes, None to centre the pattern
+    :type left: int
+    :return: rule (str or None)
+    """
+    current_seed.clear()
+
+    def place_cells(y, x, count):
+        current_seed.extend([y, x + offset] for offset in range(count))
+
+    return read_pattern_runs(file_path, place_cells, canvas_height, canvas_width, top, left)
+
+
+def place_pattern(grid, file_path, top=None, left=None):
+    """
+    Makes the cells of an RLE, Life 1.06 or plaintext pattern file alive in the grid, a row of cells at a time.
+    :param grid: The 2D list of cells, or a 2D NumPy array of them
+    :type grid: list of lists or numpy.ndarray
+    :param file_path: The path of the pattern file
+    :type file_path: str or pathlib.Path
+    :param top: Where in the grid the row 0 of the pattern goes, None to centre the pattern
+    :type top: int
+    :param left: Where in the grid the column 0 of the pattern goes, None to centre the pattern
+    :type left: int
+    :return: rule (str or None)
+    """
+    canvas_height = len(grid)
+    canvas_width = len(grid[0]) if canvas_height else 0
+
+    def place_cells(y, x, count):
+        grid[y][x:x + count] = [1] * count
+
+    return read_pattern_runs(file_path, place_cells, canvas_height, canvas_width, top, left)
+
+
+def read_pattern_runs(file_path, place_cells, canvas_height, canvas_width, top=None, left=None):
+    """
+    Reads a pattern file in one pass, handing every run of living cells that lands on the canvas to place_cells.
+    :param file_path: The path of the pattern file
+    :type file_path: str or pathlib.Path
+    :param place_cells: Called with the y, x and amount of every run of living cells on the canvas
+    :type place_cells: function
+    :param canvas_height: The height of the canvas in pixels
+    :type canvas_height: int
+    :param canvas_width: The width of the canvas in pixels
+    :type canvas_width: int
+    :param top: Where on the canvas the row 0 of the pattern goes, None to centre the pattern
+    :type top: int
+    :param left: Where on the canvas the column 0 of the pattern goes, None to centre the pattern
+    :type left: int
+    :return: rule (str or None)
+    """
+    pattern_format = get_pattern_format(file_path)
+    if pattern_format is None:
+        raise ValueError("Not a pattern file: " + str(file_path))
+
+    if top is None or left is None:
+        centred_top, centred_left = get_centred_pattern_offset(file_path, canvas_height, canvas_width)
+        top = centred_top if top is None else top
+        left = centred_left if left is None else left
+
+    with open(file_path, "r") as file:
+        rule = read_pattern_header(file, pattern_format)[0]
+        for y, x, count in place_pattern_runs(iterate_pattern_runs(file, pattern_format), canvas_height,
+                                              canvas_width, top, left):
+            place_cells(y, x, count)
+
+    return rule
+
+
+def iterate_grid_runs(grid):
+    """
+    Finds the runs of living cells next to each other in every row of a grid.
+    :param grid: The 2D list of cells, or a 2D NumPy array of them
+    :type grid: list of lists or numpy.ndarray
+    :return: runs (generator of tuples of y, x and the amount of cells)
+    """
+    for y, row in enumerate(grid):
+        if numpy is not None and isinstance(row, numpy.ndarray):
+            # The edges of the runs are where a cell differs from the one to its left
+            edges = numpy.flatnonzero(numpy.diff(row.astype(numpy.int8), prepend=0, append=0))
+            for start, end in zip(edges[::2].tolist(), edges[1::2].tolist()):
+                yield y, start, end - start
+            continue
+
+        x = 0
+        for cell, cells in itertools.groupby(row):
+            count = len(list(cells))
+            if cell == 1:
+                yield y, x, count
+            x += count
+
+
+def get_grid_indices(grid):
+    """
+    Lists the living cells of a grid by their index y * canvas_width + x, in order.
+    :param grid: The 2D list of cells, or a 2D NumPy array of them
+    :type grid: list of lists or numpy.ndarray
+    :return: indices (numpy.ndarray, or array.array for a list)
+    """
+    if numpy is not None and isinstance(grid, numpy.ndarray):
+        return numpy.flatnonzero(grid)
+
+    canvas_width = len(grid[0]) if grid else 0
+    indices = array("I")
+    for y, x, count in iterate_grid_runs(grid):
+        indices.extend(range(y * canvas_width + x, y * canvas_width + x + count))
+    return indices
+
+
+def write_pattern_file(file_path, grid, rule=DEFAULT_RULE):
+    """
+    Stores a grid as an RLE, Life 1.06 or plaintext pattern file, chosen by the extension of the path.
+    The grid is written a row at a time, so no more than a row of the file is in memory at once.
+    :param file_path: The path of the pattern file
+    :type file_path: str or pathlib.Path
+    :param grid: The 2D list of cells, or a 2D NumPy array of them
+    :type grid: list of lists or numpy.ndarray
+    :param rule: The rule in B/S notation
+    :type rule: str
+    :return: None
+    """
+    pattern_format = get_pattern_format(file_path)
+    canvas_height = len(grid)
+    canvas_width = len(grid[0]) if canvas_height else 0
+
+    with open(file_path, "w") as file:
+        if pattern_format == "life106":
+            file.write("#Life 1.06\n")
+            for y, x, count in iterate_grid_runs(grid):
+                for cell_x in range(x, x + count):
+                    file.write(str(cell_x) + " " + str(y) + "\n")
+
+        elif pattern_format == "plaintext":
+            file.write("!Name: " + pathlib.Path(file_path).stem + "\n")
+            for row in grid:
+                if numpy is not None and isinstance(row, numpy.ndarray):
+                    row = row.tolist()
+                file.write("".join("O" if cell == 1 else "." for cell in row).rstrip(".") + "\n")
+
+        elif pattern_format == "rle":
+            file.write("x = " + str(canvas_width) + ", y = " + str(canvas_height) + ", rule = " + rule + "\n")
+            line_length = 0
+            y = x = 0
+            for run_y, run_x, count in itertools.chain(iterate_grid_runs(grid), ((None, 0, 0),)):
+                tokens = []
+                if run_y is None:
+                    tokens.append("!")
+                else:
+                    if run_y > y:
+                        tokens.append((str(run_y - y) if run_y - y > 1 else "") + "$")
+                        y = run_y
+                        x = 0
+                    if run_x > x:
+                        tokens.append((str(run_x - x) if run_x - x > 1 else "") + "b")
+                    tokens.append((str(count) if count > 1 else "") + "o")
+                    x = run_x + count
+
+                # Lines of an RLE file are kept under RLE_LINE_LENGTH characters
+                for token in tokens:
+                    if line_length + len(token) > RLE_LINE_LENGTH:
+                        file.write("\n")
+                        line_length = 0
+                    file.write(token)
+                    line_length += len(token)
+            file.write("\n")
+
+        else:
+            raise ValueError("Not a pattern file: " + str(file_path))
+
+
 def apply_seed(grid, seed, canvas_height, canvas_width):
     """
     For every cell listed in seed, make the corresponding cell in grid alive
@@ -953,175 +2537,1440 @@ def apply_seed(grid, seed, canvas_height, canvas_width):
         print("Seed applied")
 
 
-def run_simulation(max_framerate, drawn_cells, pause_signal, canvas, pause_button, grid, next_frame_signal,
-                   next_frame_button, generation_counter, shutting_down):
+def run_simulation(controls):
     """
-    Generates new generations, draws them on screen, then repeats.
-    :param max_framerate: The maximum amount of times per second the program will run this loop
-    :type max_framerate: tkinter.IntVar
-    :param drawn_cells: The dictionary of already rendered pixels
-    :type drawn_cells: dict
-    :param pause_signal: The signal which controls whether or not to pause the loop
-    :type pause_signal: tkinter.BooleanVar
-    :param canvas: The instance of a tkinter canvas that visualizes the game
-    :type canvas: tkinter.Canvas
-    :param pause_button: The button which changes the pause_signal
-    :type pause_button: tkinter.Button
-    :param grid: The 2D list of cells
-    :type grid: list of lists
-    :param next_frame_signal: The signal which controls whether or not to move to the next frame
-    while the simulation is paused
-    :type next_frame_signal: tkinter.BooleanVar
-    :param next_frame_button: The button which changes the next_frame_signal
-    :type next_frame_button: tkinter.Button
-    :param generation_counter: Keeps track of and displays the current generations number
-    :type generation_counter: tkinter.Label
-    :param shutting_down: Whether or not the program is shutting down
-    :type shutting_down: tkinter.BooleanVar
+    Starts a SimulationWorker that calculates new generations in the background, and draws the generations it
+    finishes from window.after callbacks, at most max_framerate times per second.
+    Pausing, moving to the next frame, jumping, starting another simulation and shutting down are picked up
+    through traces on their variables, so nothing is scheduled while the simulation is paused.
+    In turbo mode the worker runs as fast as it can, and each frame only draws the latest generation.
+    :param controls: The widgets and tkinter variables of the GUI
+    :type controls: SimulationControls
     :return: None
     """
+    max_framerate, drawn_cells, pause_signal, canvas, grid = controls.max_framerate, controls.drawn_cells,\
+        controls.pause_signal, controls.canvas, controls.grid
+    pause_button, next_frame_signal, next_frame_button = controls.pause_button, controls.next_frame_signal,\
+        controls.next_frame_button
+    generation_counter, stability_counter = controls.generation_counter, controls.stability_counter
+    shutting_down, simulation_number, window = controls.shutting_down, controls.simulation_number, controls.window
+    jump_target, pause_when_stable = controls.jump_target, controls.pause_when_stable
+    turbo, speed_counter, viewport = controls.turbo, controls.speed_counter, controls.viewport
+    render_mode, checkpoint_signal, seed_generation = controls.render_mode, controls.checkpoint_signal,\
+        controls.seed_generation
+    rewind_target, timeline = controls.rewind_target, controls.timeline
+
+    simulation_boundary_mode = controls.boundary_mode.get()
+    simulation_rule = controls.rule.get()
+    this_simulation = simulation_number.get()
+    stability_counter.config(text="")
+    generation_number = seed_generation.get()
+    history = CellHistory(grid, generation_number)
+    generation_history = GenerationHistory(len(grid[0]) if grid else 0)
+    generation_history.record_keyframe(generation_number, grid)
+    renderer = create_renderer(canvas, grid, drawn_cells, viewport, history=history, render_mode=render_mode.get())
 
     # Draws the first frame
     if VERBOSE:
         print("Drawing first frame")
 
-    draw_canvas(canvas, grid, drawn_cells)
-    canvas.update()
-    generation_number = 0
+    renderer.draw(grid)
+    generation_counter.config(text="Generation number: " + str(generation_number))
+    jump_target.set(0)
+    rewind_target.set(-1)
+    timeline.config(from_=generation_number, to=generation_number)
+    timeline.set(generation_number)
 
     if VERBOSE:
         print("First frame drawn")
 
-    while not shutting_down.get():
-        # Start measuring time
-        start = timer()
-
-        # Reset
-        pause_button.config(text="Pause")
-        next_frame_button.grid_remove()
-        next_frame_signal.set(False)
-
-        # If the pause button has been pressed
-        if pause_signal.get():
-            # Set the pause button's text to "Resume"
-            pause_button.config(text="Resume")
-
-            # Show the next_frame_button
-            next_frame_button.grid(row=1, column=2)
-
-            # Wait for pause_signal to be false, or next_frame_signal to be true
-            while pause_signal.get() and not next_frame_signal.get():
-                canvas.update()
-                time.sleep(0.01)
-
-        # Calculates the next generation
-        if VERBOSE:
-            print("Calculating next generation")
-        cells_to_be_killed, cells_to_be_revived,\
-            living_cells_before_next_generation = calculate_next_generation(grid)
-        if VERBOSE:
-            print("Creating next generation")
-        create_next_generation(grid, cells_to_be_killed, cells_to_be_revived)
-        if VERBOSE:
-            print("Next generation complete")
-        cells_alive = living_cells_before_next_generation + len(cells_to_be_revived) - len(cells_to_be_killed)
-        if VERBOSE:
-            print("\tNumber of cells alive: " + str(cells_alive))
+    # The worker keeps its own copy of the cells, the grid is only kept in sync for drawing
+    worker = SimulationWorker(grid, simulation_boundary_mode, simulation_rule, generation_number)
+    worker.start()
+
+    # The frames to show even though the simulation is paused, and the pending call to show_frames
+    frames_to_show = 0
+    scheduled_call = None
+
+    # Whether the grid has gone back to an earlier generation than the worker is at
+    rewound = False
+
+    # What the speed counter was last calculated from
+    speed_counter.config(text="")
+    speed_measured_at = timer()
+    speed_measured_generation = generation_number
+    frames_drawn = 0
+
+    def update_turbo():
+        """
+        Lets the worker run ahead in turbo mode, unless the simulation is paused.
+        :return: None
+        """
+        if turbo.get() and not pause_signal.get():
+            worker.turbo.set()
+        else:
+            worker.turbo.clear()
+
+    def schedule(delay):
+        """
+        Makes sure show_frames will be called.
+        :param delay: Milliseconds to wait first
+        :type delay: int
+        :return: None
+        """
+        nonlocal scheduled_call
+        if scheduled_call is None:
+            scheduled_call = window.after(delay, show_frames)
+
+    def show_frame():
+        """
+        Draws the next generation the worker has finished, if there is one.
+        In turbo mode every finished generation is taken, and only the latest is drawn.
+        :return: bool
+        """
+        nonlocal generation_number, frames_drawn
+        frames = []
+        while not frames or turbo.get():
+            try:
+                frames.append(worker.frames.get_nowait())
+            except queue.Empty:
+                break
+
+        if not frames:
+            return False
+
+        for generation_number, cells_to_be_killed, cells_to_be_revived, cells_alive, stability in frames:
+            # After a jump or in turbo mode the frame holds all the living cells, and the history only learns
+            # which cells differ from the last frame, as if they all changed in this generation
+            if cells_to_be_killed is None:
+                canvas_height = len(grid)
+                canvas_width = len(grid[0]) if canvas_height else 0
+                previous_rows = [bytes(row) for row in grid]
+                grid.clear()
+                apply_seed(grid, cells_to_be_revived, canvas_height, canvas_width)
+                history.update(generation_number, *get_grid_changes(previous_rows, grid))
 
-        # Visualize the simulation
-        if VERBOSE:
-            print("Updating visual representation")
+            else:
+                create_next_generation(grid, cells_to_be_killed, cells_to_be_revived)
+                history.update(generation_number, cells_to_be_killed, cells_to_be_revived)
+
+            # The board has just become periodic
+            if stability is not None:
+                if VERBOSE:
+                    print(stability)
+                stability_counter.config(text=stability)
+                if pause_when_stable.get():
+                    pause_signal.set(True)
+
+        # Only the cells that changed are redrawn, unless the frames add up to more than one generation
+        cells_to_be_killed, cells_to_be_revived = frames[0][1:3]
+        if len(frames) == 1 and cells_to_be_killed is not None:
+            renderer.draw_changes(grid, cells_to_be_killed, cells_to_be_revived)
+            generation_history.record(generation_number, grid, cells_to_be_killed, cells_to_be_revived)
+        else:
+            renderer.draw(grid)
+            generation_history.record_keyframe(generation_number, grid)
+        frames_drawn += 1
+        update_timeline()
 
-        # Generation counter
-        generation_number += 1
         generation_counter_text = "Generation number: " + str(generation_number)
         generation_counter.config(text=generation_counter_text)
-
-        # Canvas
-        draw_canvas(canvas, grid, drawn_cells)
-        canvas.update()
-
         if VERBOSE:
-            print("Visual representation updated")
-
-        # Limits automatic loop to max_framerate
-        end = timer()
-        loop_time = end - start
-        max_framerate_calculated = 1 / max_framerate.get()
-        while loop_time < max_framerate_calculated:
-            if VERBOSE:
-                print("Held by max framerate")
+            print("\tNumber of cells alive: " + str(frames[-1][3]))
 
-            end = timer()
-            loop_time = end - start
-            canvas.update()
-            time.sleep(0.01)
+        return True
 
+    def update_timeline():
+        """
+        Stretches the timeline over the generations that can be gone back to, and moves it to the one shown.
+        :return: None
+        """
+        timeline.config(from_=generation_history.oldest_generation, to=generation_history.newest_generation)
+        timeline.set(generation_number)
+
+    def update_speed_counter():
+        """
+        Shows the generations simulated and the frames drawn per second, about once a second.
+        :return: None
+        """
+        nonlocal speed_measured_at, speed_measured_generation, frames_drawn
+        now = timer()
+        if now - speed_measured_at >= 1:
+            generations_per_second = (generation_number - speed_measured_generation) / (now - speed_measured_at)
+            frames_per_second = frames_drawn / (now - speed_measured_at)
+            speed_counter.config(text=str(round(generations_per_second)) + " generations/s, " +
+                                 str(round(frames_per_second)) + " frames/s")
+            speed_measured_at = now
+            speed_measured_generation = generation_number
+            frames_drawn = 0
+
+    def show_frames():
+        """
+        Ends the simulation, goes back or starts a jump, or shows a frame, then comes back after
+        1 / max_framerate seconds unless the simulation is paused.
+        :return: None
+        """
+        nonlocal worker, frames_to_show, scheduled_call, speed_measured_at, speed_measured_generation, frames_drawn,\
+            rewound
+        start = timer()
+        scheduled_call = None
+
+        # This simulation is over once the program shuts down or another simulation is started
+        if shutting_down.get() or simulation_number.get() != this_simulation:
+            for variable, trace in traces:
+                variable.trace_remove("write", trace)
+            worker.stop(wait=shutting_down.get())
+            if shutting_down.get():
+                window.destroy()
+            return
+
+        # Goes back to an earlier generation that is still remembered
+        if 0 < jump_target.get() < generation_number:
+            rewind_target.set(jump_target.get())
+            jump_target.set(0)
+
+        # Jumps straight to a later generation, leaving the frames calculated so far
+        if jump_target.get() > generation_number:
+            if VERBOSE:
+                print("Jumping to generation " + str(jump_target.get()))
+            worker.stop(wait=False)
+            generation_history.truncate(generation_number)
+            rewound = False
+            worker = SimulationWorker(grid, simulation_boundary_mode, simulation_rule, generation_number,
+                                      jump_target.get() - generation_number)
+            update_turbo()
+            worker.start()
+            frames_to_show = 1
+
+            # The generations jumped over do not count towards the speed
+            speed_measured_at = timer()
+            speed_measured_generation = jump_target.get()
+            frames_drawn = 0
+            jump_target.set(0)
+
+        # Carries on from the generation gone back to, forgetting the generations after it
+        if rewound and (not pause_signal.get() or frames_to_show > 0):
+            worker = SimulationWorker(grid, simulation_boundary_mode, simulation_rule, generation_number)
+            update_turbo()
+            worker.start()
+            generation_history.truncate(generation_number)
+            update_timeline()
+            rewound = False
+
+            speed_measured_at = timer()
+            speed_measured_generation = generation_number
+            frames_drawn = 0
+
+        if not pause_signal.get() or frames_to_show > 0:
+            if show_frame() and frames_to_show > 0:
+                frames_to_show -= 1
+            update_speed_counter()
+
+        # Limits the frames shown to max_framerate
+        if not pause_signal.get() or frames_to_show > 0:
+            frame_time = int(1000 / max(max_framerate.get(), 1))
+            schedule(max(frame_time - int((timer() - start) * 1000), 1))
+
+    def pause_changed(*trace_arguments):
+        """
+        Shows the next frame button while the simulation is paused, and starts showing frames again after.
+        :return: None
+        """
+        if pause_signal.get():
+            pause_button.config(text="Resume")
+            next_frame_button.grid(row=1, column=2)
+        else:
+            pause_button.config(text="Pause")
+            next_frame_button.grid_remove()
+            schedule(0)
+        update_turbo()
+
+    def viewport_changed(*trace_arguments):
+        """
+        Draws the grid again once the view of it has been zoomed or panned.
+        :return: None
+        """
+        if simulation_number.get() == this_simulation and not shutting_down.get():
+            renderer.draw(grid)
+
+    def render_mode_changed(*trace_arguments):
+        """
+        Draws the grid again in the colours of the render mode chosen.
+        :return: None
+        """
+        renderer.render_mode = render_mode.get()
+        viewport_changed()
+
+    def checkpoint_requested(*trace_arguments):
+        """
+        Saves a checkpoint of the generation shown, which the grid is kept in sync with.
+        :return: None
+        """
+        if checkpoint_signal.get():
+            checkpoint_signal.set(False)
+            file_path = save_checkpoint_to_file(grid, generation_number, simulation_boundary_mode, simulation_rule)
+            if VERBOSE:
+                print("Checkpoint saved to: " + str(file_path))
+
+    def rewind_requested(*trace_arguments):
+        """
+        Pauses the simulation and shows an earlier generation, rebuilt from the generation history.
+        The worker is only replaced once the simulation carries on, so the newer generations can still be gone to.
+        :return: None
+        """
+        nonlocal generation_number, frames_to_show, rewound
+        target = rewind_target.get()
+        if target < 0:
+            return
+        rewind_target.set(-1)
+
+        rewound_generation, cells = generation_history.get(target)
+        if cells is None or rewound_generation == generation_number:
+            update_timeline()
+            return
+        if VERBOSE:
+            print("Going back to generation " + str(rewound_generation))
+
+        if not rewound:
+            worker.stop(wait=False)
+            rewound = True
+        pause_signal.set(True)
+        frames_to_show = 0
+
+        canvas_height = len(grid)
+        canvas_width = len(grid[0]) if canvas_height else 0
+        grid.clear()
+        apply_seed(grid, cells, canvas_height, canvas_width)
+        generation_number = rewound_generation
+        history.reset(grid, generation_number)
+        renderer.draw(grid)
+        generation_counter.config(text="Generation number: " + str(generation_number))
+        stability_counter.config(text="")
+        update_timeline()
+
+    def next_frame_requested(*trace_arguments):
+        """
+        Shows one more frame while the simulation is paused.
+        :return: None
+        """
+        nonlocal frames_to_show
+        if next_frame_signal.get():
+            frames_to_show += 1
+            next_frame_signal.set(False)
+            schedule(0)
+
+    traces = [(pause_signal, pause_signal.trace_add("write", pause_changed)),
+              (next_frame_signal, next_frame_signal.trace_add("write", next_frame_requested)),
+              (jump_target, jump_target.trace_add("write", lambda *trace_arguments: schedule(0))),
+              (shutting_down, shutting_down.trace_add("write", lambda *trace_arguments: schedule(0))),
+              (simulation_number, simulation_number.trace_add("write", lambda *trace_arguments: schedule(0))),
+              (turbo, turbo.trace_add("write", lambda *trace_arguments: update_turbo())),
+              (viewport.changed, viewport.changed.trace_add("write", viewport_changed)),
+              (render_mode, render_mode.trace_add("write", render_mode_changed)),
+              (checkpoint_signal, checkpoint_signal.trace_add("write", checkpoint_requested)),
+              (rewind_target, rewind_target.trace_add("write", rewind_requested))]
+
+    next_frame_signal.set(False)
+    pause_changed()
+    schedule(0)
+
+
+class SimulationWorker(threading.Thread):
+    """
+    Calculates the generations of a simulation in a background thread and hands them to the GUI through a
+    bounded queue of frames. Once the queue is full the worker waits for the GUI to catch up, which is also what
+    keeps a paused simulation from using the processor.
+    In turbo mode the worker does not wait for the GUI, but keeps stepping and only puts a frame in the queue
+    once the GUI has taken the last one.
+    A frame is generation_number, cells_to_be_killed, cells_to_be_revived, cells_alive and stability.
+    After a jump or in turbo mode cells_to_be_killed is None and cells_to_be_revived holds all the living cells,
+    and stability describes the board once it is found to have become periodic, otherwise None.
+    """
+    def __init__(self, grid, boundary_mode=DEFAULT_BOUNDARY_MODE, rule=DEFAULT_RULE, generation_number=0,
+                 jump_generations=0):
+        """
+        :param grid: The 2D list of cells
+        :type grid: list of lists
+        :param boundary_mode: What lies beyond the edges of the grid, one of BOUNDARY_MODES
+        :type boundary_mode: str
+        :param rule: The rule in B/S notation
+        :type rule: str
+        :param generation_number: The generation number of the grid
+        :type generation_number: int
+        :param jump_generations: The amount of generations to jump straight ahead before stepping
+        :type jump_generations: int
+        """
+        super().__init__(daemon=True)
+        self.grid = [row[:] for row in grid]
+        self.boundary_mode = boundary_mode
+        self.rule = rule
+        self.generation_number = generation_number
+        self.jump_generations = jump_generations
+        self.frames = queue.Queue(maxsize=FRAME_QUEUE_SIZE)
+        self.stopping = threading.Event()
+        self.turbo = threading.Event()
+
+    def run(self):
+        """
+        Calculates generations until stopped.
+        :return: None
+        """
+        engine = None
+        try:
+            if self.jump_generations:
+                engine = self.jump()
+            else:
+                engine = create_engine(self.grid, boundary_mode=self.boundary_mode, rule=self.rule)
+            cycle_detector = CycleDetector(len(self.grid[0]) if self.grid else 0, engine.to_seed(),
+                                           generation=self.generation_number)
+
+            # Whether the GUI has missed generations, and the stability it has not been told about yet
+            frames_skipped = False
+            stability = None
+
+            while not self.stopping.is_set():
+                if self.turbo.is_set():
+                    # Steps the fastest way there is, only reporting the changed cells to the cycle detector
+                    if cycle_detector.period is not None:
+                        advance_engine(engine, 1)
+                    elif step_engine_with_detector(engine, cycle_detector)[3]:
+                        stability = describe_stability(cycle_detector)
+                    self.generation_number += 1
+
+                    # Only the latest generation is handed over, once the GUI has taken the one before it
+                    if not self.frames.empty():
+                        frames_skipped = True
+                    else:
+                        self.put_living_cells(engine, stability)
+                        frames_skipped = False
+                        stability = None
+                    continue
+
+                cells_to_be_killed, cells_to_be_revived, living_cells_before_next_generation = engine.step()
+                self.generation_number += 1
+                cells_alive = living_cells_before_next_generation + len(cells_to_be_revived) -\
+                    len(cells_to_be_killed)
+
+                # Checks whether the board has become periodic
+                if cycle_detector.period is None and cycle_detector.update(cells_to_be_killed, cells_to_be_revived):
+                    stability = describe_stability(cycle_detector)
+
+                # The changed cells are only enough to draw the generation if the GUI has seen the one before it
+                if frames_skipped:
+                    self.put_living_cells(engine, stability)
+                    frames_skipped = False
+                else:
+                    self.frames.put((self.generation_number, cells_to_be_killed, cells_to_be_revived, cells_alive,
+                                     stability))
+                stability = None
+        finally:
+            if engine is not None:
+                close_engine(engine)
+
+    def jump(self):
+        """
+        Jumps straight ahead by jump_generations and puts the whole board in the queue as one frame.
+        The jump is cut short when the worker is stopped, and then no frame is put in the queue.
+        :return: engine (PythonEngine, NumpyEngine, SparseEngine, BitBoard or ParallelEngine)
+        """
+        self.generation_number += jump_to_generation(self.grid, self.jump_generations, self.boundary_mode, self.rule,
+                                                     self.stopping.is_set)
+        engine = create_engine(self.grid, boundary_mode=self.boundary_mode, rule=self.rule)
+        if self.stopping.is_set():
+            return engine
+
+        self.put_living_cells(engine)
 
-def draw_canvas(canvas, grid, drawn_cells):
+        if VERBOSE:
+            print("Jump complete")
+
+        return engine
+
+    def put_living_cells(self, engine, stability=None):
+        """
+        Puts a frame holding all the living cells in the queue.
+        :param engine: The simulation engine
+        :type engine: PythonEngine, NumpyEngine, SparseEngine, BitBoard or ParallelEngine
+        :param stability: The description of the board if it has just become periodic
+        :type stability: str
+        :return: None
+        """
+        living_cells = engine.to_seed()
+        self.frames.put((self.generation_number, None, living_cells, len(living_cells), stability))
+
+    def stop(self, wait=True):
+        """
+        Stops calculating generations.
+        :param wait: Whether or not to wait for the engine to be closed
+        :type wait: bool
+        :return: None
+        """
+        self.stopping.set()
+
+        # Makes room in the queue, in case the worker is waiting to put a frame in it
+        while True:
+            try:
+                self.frames.get_nowait()
+            except queue.Empty:
+                break
+
+        if wait:
+            self.join()
+
+
+def draw_canvas(canvas, grid, drawn_cells, viewport=None):
     """
     If a cell is alive, make it white, if not then make it black.
+    Given a viewport, only the cells in view are looked at.
     :param canvas: The instance of a tkinter canvas that visualizes the game
     :type canvas: tkinter.Canvas
     :param grid: The 2D list of cells
     :type grid: list of lists
-    :param drawn_cells: The dictionary of already rendered pixels
-    :type drawn_cells: dict
+    :param drawn_cells: The canvas item ids of the drawn cells by y * canvas_width + x, 0 where not drawn
+    :type drawn_cells: array.array
+    :param viewport: The part of the board shown on the canvas, all of it one pixel per cell by default
+    :type viewport: Viewport
     :return: None
     """
     if VERBOSE:
         print("Drawing canvas")
 
-    # For every row in the grid
-    for y in range(len(grid)):
-        # For every cell in the row
-        for x in range(len(grid[y])):
-            # Create a name which will be the name of the object when instantiating the pixel, corresponds with y, x
-            rectangle_name = str(y) + "_" + str(x)
+    canvas_width = len(grid[0]) if grid else 0
+    top, left, bottom, right = get_visible_area(grid, viewport)
 
-            # Is this cell already drawn on canvas?
-            exists = is_drawn_before(rectangle_name, drawn_cells)
+    # For every row in view
+    for y in range(top, bottom):
+        row = grid[y]
+        # For every cell in view in the row
+        for x in range(left, right):
+            index = y * canvas_width + x
 
             # If this cell is alive
-            if grid[y][x] == 1:
+            if row[x] == 1:
                 # And is not already drawn on canvas
-                if not exists:
-                    # Create a new instance of a pixel and register it in drawn_cells with object name as rectangle_name
-                    vars()[rectangle_name] = canvas.create_rectangle(x, y, x, y, fill="green", outline="")
-                    drawn_cells[rectangle_name] = vars()[rectangle_name]
-
-            # If this cell is not alive
-            else:
-                # But is drawn on canvas
-                if exists:
-                    # Destroy the corresponding instance of a pixel and remove it from the drawn_cells dictionary
-                    canvas.delete(drawn_cells[rectangle_name])
-                    drawn_cells.pop(rectangle_name)
+                if not drawn_cells[index]:
+                    # Create a new instance of a pixel and register its id in drawn_cells
+                    x1, y1, x2, y2 = get_cell_rectangle(y, x, viewport)
+                    drawn_cells[index] = canvas.create_rectangle(x1, y1, x2, y2, fill="green", outline="",
+                                                                 tags=CELL_TAG)
+
+            # If this cell is not alive, but is drawn on canvas
+            elif drawn_cells[index]:
+                # Destroy the corresponding instance of a pixel and remove it from drawn_cells
+                canvas.delete(drawn_cells[index])
+                drawn_cells[index] = 0
 
     if VERBOSE:
         print("Canvas drawn")
 
 
-def is_drawn_before(rectangle_name, drawn_cells):
+def draw_canvas_changes(canvas, cells_to_be_killed, cells_to_be_revived, drawn_cells, canvas_width, viewport=None):
     """
-    Checks if a specific canvas widget's reference exists in the dictionary of already rendered widgets.
-    :param rectangle_name: The object name to check
-    :type rectangle_name: string
-    :param drawn_cells: The dictionary of already rendered widgets (pixels in this case)
-    :type drawn_cells: dict
-    :return: bool
+    Deletes the rectangles of the cells that died and draws the ones that came alive, skipping those out of view.
+    :param canvas: The instance of a tkinter canvas that visualizes the game
+    :type canvas: tkinter.Canvas
+    :param cells_to_be_killed: A list of lists containing y and x coordinates of cells that died
+    :type cells_to_be_killed: list of lists
+    :param cells_to_be_revived: A list of lists containing y and x coordinates of cells that came alive
+    :type cells_to_be_revived: list of lists
+    :param drawn_cells: The canvas item ids of the drawn cells by y * canvas_width + x, 0 where not drawn
+    :type drawn_cells: array.array
+    :param canvas_width: The width of the canvas in pixels
+    :type canvas_width: int
+    :param viewport: The part of the board shown on the canvas, all of it one pixel per cell by default
+    :type viewport: Viewport
+    :return: None
     """
-    if rectangle_name in drawn_cells:
-        return True
+    if VERBOSE:
+        print("Drawing changed cells")
+
+    for y, x in cells_to_be_killed:
+        index = y * canvas_width + x
+        if drawn_cells[index]:
+            canvas.delete(drawn_cells[index])
+            drawn_cells[index] = 0
+
+    if viewport is None:
+        top, left, bottom, right = 0, 0, len(drawn_cells) // canvas_width if canvas_width else 0, canvas_width
     else:
-        return False
+        top, left, bottom, right = viewport.top, viewport.left, viewport.top + viewport.rows,\
+            viewport.left + viewport.columns
 
+    for y, x in cells_to_be_revived:
+        index = y * canvas_width + x
+        if not drawn_cells[index] and top <= y < bottom and left <= x < right:
+            x1, y1, x2, y2 = get_cell_rectangle(y, x, viewport)
+            drawn_cells[index] = canvas.create_rectangle(x1, y1, x2, y2, fill="green", outline="", tags=CELL_TAG)
 
-def calculate_next_generation(grid):
-    """
-    Determines which cells will live or die based on the three fundamental rules of the game.
+    if VERBOSE:
+        print("Changed cells drawn")
+
+
+def get_visible_area(grid, viewport=None):
+    """
+    Finds the rows and columns of the grid that are in view.
+    :param grid: The 2D list of cells
+    :type grid: list of lists
+    :param viewport: The part of the board shown on the canvas, all of it by default
+    :type viewport: Viewport
+    :return: top (int), left (int), bottom (int), right (int)
+    """
+    if viewport is None:
+        return 0, 0, len(grid), len(grid[0]) if grid else 0
+
+    return viewport.top, viewport.left, viewport.top + viewport.rows, viewport.left + viewport.columns
+
+
+def get_cell_rectangle(y, x, viewport=None):
+    """
+    Finds the corners of the rectangle a cell is drawn as on the canvas.
+    :param y: The row of the cell
+    :type y: int
+    :param x: The column of the cell
+    :type x: int
+    :param viewport: The part of the board shown on the canvas, all of it one pixel per cell by default
+    :type viewport: Viewport
+    :return: x1 (int), y1 (int), x2 (int), y2 (int)
+    """
+    if viewport is None:
+        return x, y, x, y
+
+    pixels_per_cell = viewport.pixels_per_cell
+    pixel_y, pixel_x = viewport.get_pixel(y, x)
+    return pixel_x, pixel_y, pixel_x + pixels_per_cell - 1, pixel_y + pixels_per_cell - 1
+
+
+def get_visible_row(grid, y, left, right, cells_per_pixel=1):
+    """
+    Turns a row of pixels into one byte per pixel, 1 where any of the cells the pixel covers is alive.
+    A pixel covers cells_per_pixel rows from y down and cells_per_pixel columns, from left up to right.
+    :param grid: The 2D list of cells
+    :type grid: list of lists
+    :param y: The first row the pixels cover
+    :type y: int
+    :param left: The first column the pixels cover
+    :type left: int
+    :param right: The column after the last one the pixels cover
+    :type right: int
+    :param cells_per_pixel: The amount of cells every pixel covers in both directions
+    :type cells_per_pixel: int
+    :return: pixels (bytes)
+    """
+    if cells_per_pixel == 1:
+        return bytes(grid[y][left:right])
+
+    # Every cell is a byte of 0 or 1, so ORing the rows as big integers finds the living cells of all of them
+    living_cells = 0
+    for row in grid[y:y + cells_per_pixel]:
+        living_cells |= int.from_bytes(bytes(row[left:right]), "big")
+
+    cells = living_cells.to_bytes(right - left, "big")
+    return bytes(b"\x01" in cells[x:x + cells_per_pixel] for x in range(0, right - left, cells_per_pixel))
+
+
+def get_visible_history_row(grid, history, y, left, right, cells_per_pixel=1):
+    """
+    Turns a row of pixels into one colour key per pixel: 128 where the cell is alive, plus how recently it last
+    came alive or died, from HISTORY_LIMIT for the current generation down to 0 for HISTORY_LIMIT generations ago.
+    Zoomed out, a pixel gets the highest key of the cells it covers, so the living and most recent ones show.
+    :param grid: The 2D list of cells
+    :type grid: list of lists
+    :param history: When the cells last changed
+    :type history: CellHistory
+    :param y: The first row the pixels cover
+    :type y: int
+    :param left: The first column the pixels cover
+    :type left: int
+    :param right: The column after the last one the pixels cover
+    :type right: int
+    :param cells_per_pixel: The amount of cells every pixel covers in both directions
+    :type cells_per_pixel: int
+    :return: keys (bytes)
+    """
+    recency_table = history.get_recency_table()
+    rows = []
+    for row_y in range(y, min(y + cells_per_pixel, len(grid))):
+        # Both are one byte per cell without overlapping bits, so ORing them as big integers combines them
+        start = row_y * history.canvas_width
+        recency = int.from_bytes(history.changed_at[start + left:start + right].translate(recency_table), "big")
+        living = int.from_bytes(bytes(grid[row_y][left:right]).translate(LIVING_KEY_TABLE), "big")
+        rows.append((recency | living).to_bytes(right - left, "big"))
+
+    if cells_per_pixel == 1:
+        return rows[0]
+
+    # Every column of the cells a pixel covers is an extended slice, so one call to max per pixel covers them all
+    padding = bytes(-(right - left) % cells_per_pixel)
+    return bytes(map(max, *((row + padding)[offset::cells_per_pixel]
+                            for row in rows for offset in range(cells_per_pixel))))
+
+
+def get_gradient_colour(colours, position):
+    """
+    :param colours: Pairs of a position and the colour there, as red, green and blue, by position
+    :type colours: tuple of tuples
+    :param position: Where between the colours to take the colour from
+    :type position: float
+    :return: colour (tuple of ints)
+    """
+    for (start, start_colour), (end, end_colour) in zip(colours, colours[1:]):
+        if position <= end:
+            fraction = max(position - start, 0) / (end - start)
+            return tuple(round(a + (b - a) * fraction) for a, b in zip(start_colour, end_colour))
+
+    return tuple(colours[-1][1])
+
+
+def create_render_palette(render_mode):
+    """
+    Creates the colours of the keys get_visible_history_row makes, as one translation table per colour channel,
+    so a row of keys turns into a row of red, green or blue values with a single bytes.translate.
+    :param render_mode: What the cells are coloured by, one of RENDER_MODES
+    :type render_mode: str
+    :return: reds (bytes), greens (bytes), blues (bytes)
+    """
+    if render_mode not in RENDER_MODES:
+        raise ValueError("Unknown render mode: " + str(render_mode))
+
+    colours = []
+    for key in range(256):
+        alive = key >= 128
+        generations_ago = HISTORY_LIMIT - (key & 127)
+        heat = max(ACTIVITY_DECAY - generations_ago, 0) / ACTIVITY_DECAY
+        if render_mode == "cells":
+            colour = LIVING_CELL_PIXEL if alive else DEAD_CELL_PIXEL
+        elif render_mode == "age":
+            colour = get_gradient_colour(AGE_COLOURS, generations_ago) if alive else DEAD_CELL_PIXEL
+        elif alive:
+            colour = get_gradient_colour(((0, LIVING_CELL_PIXEL), (1, HOT_LIVING_CELL_PIXEL)), heat)
+        else:
+            colour = get_gradient_colour(((0, DEAD_CELL_PIXEL), (1, HOT_DEAD_CELL_PIXEL)), heat)
+        colours.append(colour)
+
+    return tuple(bytes(colour[channel] for colour in colours) for channel in range(3))
+
+
+def get_grid_changes(previous_rows, grid):
+    """
+    Finds the cells that differ between two versions of the grid, for when only the living cells are known.
+    :param previous_rows: The rows of the grid before, one byte per cell
+    :type previous_rows: list of bytes
+    :param grid: The 2D list of cells
+    :type grid: list of lists
+    :return: cells_to_be_killed (list of lists), cells_to_be_revived (list of lists)
+    """
+    cells_to_be_killed = []
+    cells_to_be_revived = []
+    for y, (previous_row, row) in enumerate(zip(previous_rows, grid)):
+        if previous_row == bytes(row):
+            continue
+
+        for x, (previous_cell, cell) in enumerate(zip(previous_row, row)):
+            if previous_cell and not cell:
+                cells_to_be_killed.append([y, x])
+            elif cell and not previous_cell:
+                cells_to_be_revived.append([y, x])
+
+    return cells_to_be_killed, cells_to_be_revived
+
+
+class CellHistory:
+    """
+    Remembers the generation every cell last came alive or died in, modulo 256, in one byte per cell by
+    y * canvas_width + x. Only the cells that changed are written each generation. How long ago that was is the
+    current generation minus the byte, which get_recency_table works out for all 256 values at once.
+    Every HISTORY_REFRESH_INTERVAL generations the cells that have not changed for HISTORY_LIMIT generations are
+    moved up to exactly HISTORY_LIMIT generations ago, so they never wrap around to look recent again.
+    """
+    def __init__(self, grid, generation=0):
+        """
+        :param grid: The 2D list of cells, whose living cells count as having just come alive
+        :type grid: list of lists
+        :param generation: The generation the grid is at
+        :type generation: int
+        """
+        self.reset(grid, generation)
+
+    def reset(self, grid, generation):
+        """
+        Forgets when the cells changed, as if the grid was a new seed at a generation.
+        :param grid: The 2D list of cells, whose living cells count as having just come alive
+        :type grid: list of lists
+        :param generation: The generation the grid is at
+        :type generation: int
+        :return: None
+        """
+        self.canvas_width = len(grid[0]) if grid else 0
+        self.generation = generation
+        self.refreshed_at = generation
+        self.changed_at = bytearray([(generation - HISTORY_LIMIT) & 255]) * (len(grid) * self.canvas_width)
+        self.recency_table = None
+        for y, row in enumerate(grid):
+            cells = bytes(row)
+            x = cells.find(1)
+            while x != -1:
+                self.changed_at[y * self.canvas_width + x] = generation & 255
+                x = cells.find(1, x + 1)
+
+    def update(self, generation, cells_to_be_killed, cells_to_be_revived):
+        """
+        Records the cells that changed on the way to a generation.
+        :param generation: The generation the cells changed to reach
+        :type generation: int
+        :param cells_to_be_killed: A list of lists containing y and x coordinates of cells that died
+        :type cells_to_be_killed: list of lists
+        :param cells_to_be_revived: A list of lists containing y and x coordinates of cells that came alive
+        :type cells_to_be_revived: list of lists
+        :return: None
+        """
+        if generation - self.refreshed_at >= HISTORY_REFRESH_INTERVAL:
+            self.refresh(generation)
+
+        self.generation = generation
+        self.recency_table = None
+        changed_at = self.changed_at
+        canvas_width = self.canvas_width
+        stamp = generation & 255
+        for cells in (cells_to_be_killed, cells_to_be_revived):
+            for y, x in cells:
+                changed_at[y * canvas_width + x] = stamp
+
+    def refresh(self, generation):
+        """
+        Moves the cells that will not have changed for HISTORY_LIMIT generations by the time of a generation
+        up to exactly HISTORY_LIMIT generations before it, all in one bytes.translate.
+        :param generation: The generation to refresh for, at or after the last one recorded
+        :type generation: int
+        :return: None
+        """
+        generations_passed = generation - self.generation
+        refresh_table = bytes((generation - min(((self.generation - stamp) & 255) + generations_passed,
+                                                HISTORY_LIMIT)) & 255 for stamp in range(256))
+        self.changed_at = self.changed_at.translate(refresh_table)
+        self.generation = generation
+        self.refreshed_at = generation
+        self.recency_table = None
+
+    def get_recency_table(self):
+        """
+        :return: recency_table (bytes), turns the byte of a cell into HISTORY_LIMIT minus the generations since
+        it last changed, or 0 once that is HISTORY_LIMIT or more
+        """
+        if self.recency_table is None:
+            self.recency_table = bytes(HISTORY_LIMIT - min((self.generation - stamp) & 255, HISTORY_LIMIT)
+                                       for stamp in range(256))
+
+        return self.recency_table
+
+
+class GenerationHistory:
+    """
+    Remembers the last generations shown, so that the GUI can go back to them without calculating them again.
+    The generations are kept in segments: a keyframe holding every living cell, followed by the cells that died and
+    came alive in each generation after it, up to keyframe_interval generations in all. Every keyframe and change is
+    stored as varints like the generations of a DeltaStream, keyframes compressed as well.
+    Once the history takes up more than memory_budget bytes, the oldest segments are forgotten first.
+    """
+    def __init__(self, canvas_width, keyframe_interval=REWIND_KEYFRAME_INTERVAL, memory_budget=REWIND_MEMORY_BUDGET):
+        """
+        :param canvas_width: The width of the canvas in pixels
+        :type canvas_width: int
+        :param keyframe_interval: The most generations in a segment
+        :type keyframe_interval: int
+        :param memory_budget: The most bytes of keyframes and changes to keep, the newest segment is always kept
+        :type memory_budget: int
+        """
+        self.canvas_width = canvas_width
+        self.keyframe_interval = keyframe_interval
+        self.memory_budget = memory_budget
+
+        # Every segment is a list of the generation number of its keyframe, the keyframe and a list of changes
+        self.segments = deque()
+        self.size = 0
+
+    @property
+    def oldest_generation(self):
+        """
+        :return: The generation number of the oldest generation remembered, None if there is none
+        """
+        return self.segments[0][0] if self.segments else None
+
+    @property
+    def newest_generation(self):
+        """
+        :return: The generation number of the newest generation remembered, None if there is none
+        """
+        return self.segments[-1][0] + len(self.segments[-1][2]) if self.segments else None
+
+    def record_keyframe(self, generation, grid):
+        """
+        Remembers a generation by all of its living cells, starting a new segment.
+        :param generation: The generation number
+        :type generation: int
+        :param grid: The 2D list of cells at the generation
+        :type grid: list of lists
+        :return: None
+        """
+        self.truncate(generation - 1)
+        keyframe = zlib.compress(bytes(encode_cell_indices(get_grid_indices(grid))), CHECKPOINT_COMPRESSION_LEVEL)
+        self.segments.append([generation, keyframe, []])
+        self.size += len(keyframe)
+        self.evict()
+
+    def record(self, generation, grid, cells_to_be_killed, cells_to_be_revived):
+        """
+        Remembers a generation by the cells that changed since the one before it. The first generation of a segment,
+        and a generation that does not follow the newest one remembered, is remembered by all of its living cells.
+        :param generation: The generation number
+        :type generation: int
+        :param grid: The 2D list of cells at the generation
+        :type grid: list of lists
+        :param cells_to_be_killed: The cells that died, as y, x coordinates
+        :type cells_to_be_killed: list of lists
+        :param cells_to_be_revived: The cells that came alive, as y, x coordinates
+        :type cells_to_be_revived: list of lists
+        :return: None
+        """
+        if not self.segments or generation != self.newest_generation + 1 or\
+                len(self.segments[-1][2]) + 1 >= self.keyframe_interval:
+            self.record_keyframe(generation, grid)
+            return
+
+        changes = bytes(encode_stream_cells(cells_to_be_killed, self.canvas_width) +
+                        encode_stream_cells(cells_to_be_revived, self.canvas_width))
+        self.segments[-1][2].append(changes)
+        self.size += len(changes)
+        self.evict()
+
+    def evict(self):
+        """
+        Forgets the oldest segments until the history fits within the memory budget.
+        :return: None
+        """
+        while self.size > self.memory_budget and len(self.segments) > 1:
+            generation, keyframe, changes = self.segments.popleft()
+            self.size -= len(keyframe) + sum(len(generation_changes) for generation_changes in changes)
+
+    def truncate(self, generation):
+        """
+        Forgets the generations after a generation, once the simulation has gone back to it and carries on from there.
+        :param generation: The last generation to remember
+        :type generation: int
+        :return: None
+        """
+        while self.segments and self.segments[-1][0] > generation:
+            keyframe_generation, keyframe, changes = self.segments.pop()
+            self.size -= len(keyframe) + sum(len(generation_changes) for generation_changes in changes)
+
+        if self.segments:
+            changes = self.segments[-1][2]
+            while self.segments[-1][0] + len(changes) > generation:
+                self.size -= len(changes.pop())
+
+    def get(self, generation):
+        """
+        Rebuilds a generation from the keyframe before it and the changes since.
+        Generations that were never shown, like the ones skipped in turbo mode, give the one shown before them.
+        :param generation: The generation number
+        :type generation: int
+        :return: generation (int) rebuilt, cells (list of lists) alive at it, or None, None if it is not remembered
+        """
+        if not self.segments or generation < self.oldest_generation:
+            return None, None
+        generation = min(generation, self.newest_generation)
+
+        for keyframe_generation, keyframe, changes in reversed(self.segments):
+            if keyframe_generation <= generation:
+                break
+        generation = keyframe_generation + min(generation - keyframe_generation, len(changes))
+        living_cells = set(decode_cell_indices(zlib.decompress(keyframe), 0)[0])
+        for generation_changes in changes[:generation - keyframe_generation]:
+            killed_indices, offset = decode_cell_indices(generation_changes, 0)
+            revived_indices = decode_cell_indices(generation_changes, offset)[0]
+            living_cells.difference_update(killed_indices)
+            living_cells.update(revived_indices)
+
+        return generation, [list(divmod(index, self.canvas_width)) for index in sorted(living_cells)]
+
+
+def clear_drawn_cells(canvas, drawn_cells, canvas_height=0, canvas_width=0):
+    """
+    Deletes every drawn cell from the canvas in one go and resizes the table of drawn cells, with nothing drawn.
+    :param canvas: The instance of a tkinter canvas that visualizes the game
+    :type canvas: tkinter.Canvas
+    :param drawn_cells: The canvas item ids of the drawn cells by y * canvas_width + x, 0 where not drawn
+    :type drawn_cells: array.array
+    :param canvas_height: The height of the canvas in pixels
+    :type canvas_height: int
+    :param canvas_width: The width of the canvas in pixels
+    :type canvas_width: int
+    :return: None
+    """
+    canvas.delete(CELL_TAG)
+    drawn_cells[:] = array(drawn_cells.typecode, bytes(drawn_cells.itemsize * canvas_height * canvas_width))
+
+
+def create_renderer(canvas, grid, drawn_cells, viewport, renderer_name=None, history=None,
+                    render_mode=DEFAULT_RENDER_MODE):
+    """
+    Creates the renderer that draws the part of the grid in view onto the canvas.
+    Only the bitmap renderer colours the cells by their history, the rectangles are always coloured alike.
+    :param canvas: The instance of a tkinter canvas that visualizes the game
+    :type canvas: tkinter.Canvas
     :param grid: The 2D list of cells
     :type grid: list of lists
+    :param drawn_cells: The canvas item ids of the drawn cells by y * canvas_width + x, 0 where not drawn
+    :type drawn_cells: array.array
+    :param viewport: The part of the board shown on the canvas
+    :type viewport: Viewport
+    :param renderer_name: "bitmap" or "rectangles", defaults to RENDERER
+    :type renderer_name: str
+    :param history: When the cells last changed, needed to colour them by anything but whether they are alive
+    :type history: CellHistory
+    :param render_mode: What the cells are coloured by, one of RENDER_MODES
+    :type render_mode: str
+    :return: renderer (BitmapRenderer or RectangleRenderer)
+    """
+    if renderer_name is None:
+        renderer_name = RENDERER
+
+    if renderer_name == "bitmap":
+        return BitmapRenderer(canvas, viewport, history, render_mode)
+    elif renderer_name == "rectangles":
+        return RectangleRenderer(canvas, grid, drawn_cells, viewport)
+    else:
+        raise ValueError("Unknown renderer: " + str(renderer_name))
+
+
+class RectangleRenderer:
+    """
+    Draws every living cell in view as its own canvas rectangle using draw_canvas.
+    """
+    def __init__(self, canvas, grid, drawn_cells, viewport):
+        """
+        :param canvas: The instance of a tkinter canvas that visualizes the game
+        :type canvas: tkinter.Canvas
+        :param grid: The 2D list of cells
+        :type grid: list of lists
+        :param drawn_cells: The canvas item ids of the drawn cells by y * canvas_width + x, 0 where not drawn
+        :type drawn_cells: array.array
+        :param viewport: The part of the board shown on the canvas
+        :type viewport: Viewport
+        """
+        self.canvas = canvas
+        self.drawn_cells = drawn_cells
+        self.viewport = viewport
+        self.canvas_width = len(grid[0]) if grid else 0
+        self.drawn_view = None
+        self.render_mode = DEFAULT_RENDER_MODE
+
+        # The table has to cover the whole grid, whatever was drawn before
+        if len(drawn_cells) != len(grid) * self.canvas_width:
+            clear_drawn_cells(canvas, drawn_cells, len(grid), self.canvas_width)
+
+    def draw(self, grid):
+        """
+        Draws the grid, starting over if the view has moved since the last time.
+        :param grid: The 2D list of cells
+        :type grid: list of lists
+        :return: None
+        """
+        view = self.viewport.get_view()
+        if view != self.drawn_view:
+            clear_drawn_cells(self.canvas, self.drawn_cells, len(grid), self.canvas_width)
+            self.drawn_view = view
+
+        draw_canvas(self.canvas, grid, self.drawn_cells, self.viewport)
+
+    def draw_changes(self, grid, cells_to_be_killed, cells_to_be_revived):
+        """
+        Draws only the cells that changed since the last frame.
+        :param grid: The 2D list of cells
+        :type grid: list of lists
+        :param cells_to_be_killed: A list of lists containing y and x coordinates of cells that died
+        :type cells_to_be_killed: list of lists
+        :param cells_to_be_revived: A list of lists containing y and x coordinates of cells that came alive
+        :type cells_to_be_revived: list of lists
+        :return: None
+        """
+        draw_canvas_changes(self.canvas, cells_to_be_killed, cells_to_be_revived, self.drawn_cells, self.canvas_width,
+                            self.viewport)
+
+
+class BitmapRenderer:
+    """
+    Draws the board as a single image, so the canvas holds one item no matter how many cells are alive.
+    Every frame the part of the grid in view is turned into a binary PPM image in one go and handed to the image,
+    so drawing takes as long however big the board is.
+    Coloured by age or activity the colour of every cell changes every generation, so every frame is drawn whole,
+    still without looking at the cells one by one.
+    """
+    def __init__(self, canvas, viewport, history=None, render_mode=DEFAULT_RENDER_MODE):
+        """
+        :param canvas: The instance of a tkinter canvas that visualizes the game
+        :type canvas: tkinter.Canvas
+        :param viewport: The part of the board shown on the canvas
+        :type viewport: Viewport
+        :param history: When the cells last changed, needed to colour them by anything but whether they are alive
+        :type history: CellHistory
+        :param render_mode: What the cells are coloured by, one of RENDER_MODES
+        :type render_mode: str
+        """
+        self.canvas = canvas
+        self.viewport = viewport
+        self.history = history
+        self.render_mode = render_mode
+        self.palettes = {}
+        self.image_size = None
+        self.living_colour = "#%02x%02x%02x" % tuple(LIVING_CELL_PIXEL)
+        self.dead_colour = "#%02x%02x%02x" % tuple(DEAD_CELL_PIXEL)
+
+        # The image has to stay referenced for as long as it is shown, or tkinter throws it away
+        canvas.delete(BITMAP_TAG)
+        self.image = tkinter.PhotoImage(master=canvas, width=0, height=0)
+        canvas.create_image(0, 0, image=self.image, anchor=tkinter.NW, tags=BITMAP_TAG)
+
+    def draw(self, grid):
+        """
+        Draws the grid.
+        :param grid: The 2D list of cells
+        :type grid: list of lists
+        :return: None
+        """
+        if VERBOSE:
+            print("Drawing bitmap")
+
+        viewport = self.viewport
+        pixels_per_cell = viewport.pixels_per_cell
+        cells_per_pixel = viewport.cells_per_pixel
+        top, left, bottom, right = get_visible_area(grid, viewport)
+        coloured_by_history = self.render_mode != "cells" and self.history is not None
+        if coloured_by_history:
+            rows = [get_visible_history_row(grid, self.history, y, left, right, cells_per_pixel)
+                    for y in range(top, bottom, cells_per_pixel)]
+        else:
+            rows = [get_visible_row(grid, y, left, right, cells_per_pixel)
+                    for y in range(top, bottom, cells_per_pixel)]
+        if not rows or not rows[0]:
+            self.image.blank()
+            return
+
+        if coloured_by_history:
+            pixels = self.colour_keys(b"".join(rows), pixels_per_cell)
+        else:
+            # One byte per pixel, then three per pixel wide cell. Neither pixel contains the byte 1,
+            # so the replacements can't mix
+            pixels = b"".join(rows).replace(b"\x00", DEAD_CELL_PIXEL * pixels_per_cell)\
+                .replace(b"\x01", LIVING_CELL_PIXEL * pixels_per_cell)
+        height = len(rows) * pixels_per_cell
+        width = len(rows[0]) * pixels_per_cell
+        if pixels_per_cell > 1:
+            row_length = width * 3
+            pixels = b"".join(pixels[start:start + row_length] * pixels_per_cell
+                              for start in range(0, len(pixels), row_length))
+
+        if self.image_size != (height, width):
+            self.image.configure(width=width, height=height)
+            self.image_size = (height, width)
+
+        header = ("P6 " + str(width) + " " + str(height) + " 255\n").encode("ascii")
+        self.image.configure(data=header + pixels, format="PPM")
+
+        if VERBOSE:
+            print("Bitmap drawn")
+
+    def colour_keys(self, keys, pixels_per_cell):
+        """
+        Turns the colour keys of get_visible_history_row into pixels, pixels_per_cell wide each.
+        :param keys: One key per cell
+        :type keys: bytes
+        :param pixels_per_cell: The amount of pixels every cell is wide
+        :type pixels_per_cell: int
+        :return: pixels (bytearray)
+        """
+        if self.render_mode not in self.palettes:
+            self.palettes[self.render_mode] = create_render_palette(self.render_mode)
+
+        # Every key is repeated for the width of its cell, then each channel is translated and interleaved
+        # through extended slices, so no pixel is handled on its own
+        if pixels_per_cell > 1:
+            wide_keys = bytearray(len(keys) * pixels_per_cell)
+            for offset in range(pixels_per_cell):
+                wide_keys[offset::pixels_per_cell] = keys
+            keys = wide_keys
+
+        pixels = bytearray(len(keys) * 3)
+        for channel, palette in enumerate(self.palettes[self.render_mode]):
+            pixels[channel::3] = keys.translate(palette)
+
+        return pixels
+
+    def draw_changes(self, grid, cells_to_be_killed, cells_to_be_revived):
+        """
+        Draws only the pixels of the cells in view that changed since the last frame.
+        Every pixel is a call into Tk, so when more than 1 / BITMAP_REDRAW_FRACTION of the view changed
+        the whole image is drawn again instead, as it always is when the cells are coloured by their history.
+        :param grid: The 2D list of cells
+        :type grid: list of lists
+        :param cells_to_be_killed: A list of lists containing y and x coordinates of cells that died
+        :type cells_to_be_killed: list of lists
+        :param cells_to_be_revived: A list of lists containing y and x coordinates of cells that came alive
+        :type cells_to_be_revived: list of lists
+        :return: None
+        """
+        viewport = self.viewport
+        if self.render_mode != "cells" and self.history is not None or\
+                (len(cells_to_be_killed) + len(cells_to_be_revived)) * BITMAP_REDRAW_FRACTION >\
+                viewport.rows * viewport.columns:
+            self.draw(grid)
+            return
+
+        put = self.image.put
+        pixels_per_cell = viewport.pixels_per_cell
+        cells_per_pixel = viewport.cells_per_pixel
+        top, left, bottom, right = get_visible_area(grid, viewport)
+        if cells_per_pixel == 1:
+            for colour, cells in ((self.dead_colour, cells_to_be_killed), (self.living_colour, cells_to_be_revived)):
+                for y, x in cells:
+                    if top <= y < bottom and left <= x < right:
+                        pixel_y = (y - top) * pixels_per_cell
+                        pixel_x = (x - left) * pixels_per_cell
+                        put(colour, to=(pixel_x, pixel_y, pixel_x + pixels_per_cell, pixel_y + pixels_per_cell))
+            return
+
+        # Zoomed out a pixel covers several cells, and stays alive for as long as any of them are
+        changed_pixels = set()
+        for cells in (cells_to_be_killed, cells_to_be_revived):
+            for y, x in cells:
+                if top <= y < bottom and left <= x < right:
+                    changed_pixels.add(((y - top) // cells_per_pixel, (x - left) // cells_per_pixel))
+
+        for pixel_y, pixel_x in changed_pixels:
+            x = left + pixel_x * cells_per_pixel
+            if b"\x01" in get_visible_row(grid, top + pixel_y * cells_per_pixel, x, min(x + cells_per_pixel, right),
+                                          cells_per_pixel):
+                put(self.living_colour, to=(pixel_x, pixel_y, pixel_x + 1, pixel_y + 1))
+            else:
+                put(self.dead_colour, to=(pixel_x, pixel_y, pixel_x + 1, pixel_y + 1))
+
+
+class Viewport:
+    """
+    The part of the board shown on the canvas, and how far it is zoomed.
+    At zoom levels above 0 every cell is 2 ** zoom pixels wide, below 0 every pixel covers 2 ** -zoom cells
+    in both directions and is drawn alive if any of them are.
+    The canvas grows with the board up to MAX_VIEWPORT_HEIGHT by MAX_VIEWPORT_WIDTH pixels,
+    the rest of the board is reached by panning.
+    """
+    def __init__(self, canvas, canvas_height, canvas_width):
+        """
+        :param canvas: The instance of a tkinter canvas that visualizes the game
+        :type canvas: tkinter.Canvas
+        :param canvas_height: The height of the canvas in cells new simulations get, and of the board shown at first
+        :type canvas_height: int
+        :param canvas_width: The width of the canvas in cells new simulations get, and of the board shown at first
+        :type canvas_width: int
+        """
+        self.canvas = canvas
+        self.canvas_height = canvas_height
+        self.canvas_width = canvas_width
+        self.board_height = None
+        self.board_width = None
+        self.zoom = 0
+        self.top = 0
+        self.left = 0
+        self.view_height = 0
+        self.view_width = 0
+
+        # Changes every time the view does, so whatever is drawn on the canvas can follow it
+        self.changed = tkinter.IntVar(canvas, 0)
+
+        self.show_board(canvas_height, canvas_width)
+
+    @property
+    def pixels_per_cell(self):
+        """
+        :return: pixels_per_cell (int)
+        """
+        return 2 ** max(self.zoom, 0)
+
+    @property
+    def cells_per_pixel(self):
+        """
+        :return: cells_per_pixel (int)
+        """
+        return 2 ** max(-self.zoom, 0)
+
+    @property
+    def rows(self):
+        """
+        The amount of rows of the board that are at least partly in view.
+        :return: rows (int)
+        """
+        rows = -(-self.view_height * self.cells_per_pixel // self.pixels_per_cell)
+        return max(min(rows, self.board_height - self.top), 0)
+
+    @property
+    def columns(self):
+        """
+        The amount of columns of the board that are at least partly in view.
+        :return: columns (int)
+        """
+        columns = -(-self.view_width * self.cells_per_pixel // self.pixels_per_cell)
+        return max(min(columns, self.board_width - self.left), 0)
+
+    def get_view(self):
+        """
+        :return: zoom (int), top (int), left (int), rows (int), columns (int)
+        """
+        return self.zoom, self.top, self.left, self.rows, self.columns
+
+    def get_board_position(self, y, x):
+        """
+        Finds where on the board a pixel of the canvas would be, even if it is off the canvas or the board.
+        :param y: The row of the pixel
+        :type y: int
+        :param x: The column of the pixel
+        :type x: int
+        :return: cell_y (int), cell_x (int)
+        """
+        return self.top + y * self.cells_per_pixel // self.pixels_per_cell,\
+            self.left + x * self.cells_per_pixel // self.pixels_per_cell
+
+    def get_cell(self, y, x):
+        """
+        Finds the cell under a pixel of the canvas.
+        :param y: The row of the pixel
+        :type y: int
+        :param x: The column of the pixel
+        :type x: int
+        :return: cell (list or None)
+        """
+        cell_y, cell_x = self.get_board_position(y, x)
+        if 0 <= y < self.view_height and 0 <= x < self.view_width and\
+                cell_y < self.board_height and cell_x < self.board_width:
+            return [cell_y, cell_x]
+
+        return None
+
+    def get_pixel(self, y, x):
+        """
+        Finds the top left pixel of the canvas a cell is drawn at.
+        :param y: The row of the cell
+        :type y: int
+        :param x: The column of the cell
+        :type x: int
+        :return: pixel_y (int), pixel_x (int)
+        """
+        return (y - self.top) * self.pixels_per_cell // self.cells_per_pixel,\
+            (x - self.left) * self.pixels_per_cell // self.cells_per_pixel
+
+    def get_fitting_zoom(self):
+        """
+        Finds the highest zoom level the whole board fits in the canvas at.
+        :return: zoom (int)
+        """
+        zoom = MAX_ZOOM
+        while zoom > MIN_ZOOM and (self.board_height * 2 ** max(zoom, 0) > MAX_VIEWPORT_HEIGHT * 2 ** max(-zoom, 0) or
+                                   self.board_width * 2 ** max(zoom, 0) > MAX_VIEWPORT_WIDTH * 2 ** max(-zoom, 0)):
+            zoom -= 1
+
+        return zoom
+
+    def show_board(self, board_height, board_width):
+        """
+        Shows a board of the given size, zoomed out to fit the canvas unless it is as big as the one shown before.
+        :param board_height: The height of the board in cells
+        :type board_height: int
+        :param board_width: The width of the board in cells
+        :type board_width: int
+        :return: None
+        """
+        if (board_height, board_width) == (self.board_height, self.board_width):
+            self.update()
+            return
+
+        self.board_height = board_height
+        self.board_width = board_width
+        self.zoom = self.get_fitting_zoom()
+        self.top = 0
+        self.left = 0
+        self.update()
+
+    def set_zoom(self, zoom, y=None, x=None):
+        """
+        Zooms in or out, keeping the cell under a pixel of the canvas in place. Zooming out stops once the whole
+        board fits.
+        :param zoom: The zoom level
+        :type zoom: int
+        :param y: The row of the pixel, the middle of the canvas by default
+        :type y: int
+        :param x: The column of the pixel, the middle of the canvas by default
+        :type x: int
+        :return: None
+        """
+        if y is None:
+            y = self.view_height // 2
+        if x is None:
+            x = self.view_width // 2
+
+        cell_y = self.top + y * self.cells_per_pixel / self.pixels_per_cell
+        cell_x = self.left + x * self.cells_per_pixel / self.pixels_per_cell
+        self.zoom = max(min(zoom, MAX_ZOOM), min(self.get_fitting_zoom(), 0))
+        self.top = int(cell_y - y * self.cells_per_pixel / self.pixels_per_cell)
+        self.left = int(cell_x - x * self.cells_per_pixel / self.pixels_per_cell)
+        self.update()
+
+    def pan(self, pixels_down, pixels_right):
+        """
+        Moves the view by as many whole cells as there are in a distance on the canvas.
+        :param pixels_down: How far to move the view down, in pixels
+        :type pixels_down: int
+        :param pixels_right: How far to move the view right, in pixels
+        :type pixels_right: int
+        :return: pixels_down (int), pixels_right (int) the distance moved, in pixels
+        """
+        rows = int(pixels_down * self.cells_per_pixel / self.pixels_per_cell)
+        columns = int(pixels_right * self.cells_per_pixel / self.pixels_per_cell)
+        if rows or columns:
+            self.top += rows
+            self.left += columns
+            self.update()
+
+        return rows * self.pixels_per_cell // self.cells_per_pixel,\
+            columns * self.pixels_per_cell // self.cells_per_pixel
+
+    def update(self):
+        """
+        Sizes the canvas to the view, keeps the view on the board and lets whatever is drawn follow it.
+        :return: None
+        """
+        pixels_per_cell = self.pixels_per_cell
+        cells_per_pixel = self.cells_per_pixel
+        self.view_height = min(-(-self.board_height * pixels_per_cell // cells_per_pixel), MAX_VIEWPORT_HEIGHT)
+        self.view_width = min(-(-self.board_width * pixels_per_cell // cells_per_pixel), MAX_VIEWPORT_WIDTH)
+
+        # Zoomed out the view starts on a whole pixel, so panning does not change what the pixels show
+        rows = -(-self.view_height * cells_per_pixel // pixels_per_cell)
+        columns = -(-self.view_width * cells_per_pixel // pixels_per_cell)
+        self.top = max(min(self.top, self.board_height - rows), 0)
+        self.left = max(min(self.left, self.board_width - columns), 0)
+        self.top -= self.top % cells_per_pixel
+        self.left -= self.left % cells_per_pixel
+
+        self.canvas.config(height=self.view_height, width=self.view_width)
+        self.changed.set(self.changed.get() + 1)
+
+
+def calculate_next_generation(grid, boundary_mode=DEFAULT_BOUNDARY_MODE, rule_table=None):
+    """
+    Determines which cells will live or die based on the rules of the game.
+    :param grid: The 2D list of cells
+    :type grid: list of lists
+    :param boundary_mode: What lies beyond the edges of the grid, one of BOUNDARY_MODES
+    :type boundary_mode: str
+    :param rule_table: The rules compiled by compile_rule, defaults to DEFAULT_RULE
+    :type rule_table: tuple
     :return: cells_to_be_killed (2D list), cells_to_be_revived (2D list), living_cells_before_next_generation (int)
     """
     if VERBOSE:
@@ -1131,36 +3980,42 @@ def calculate_next_generation(grid):
     cells_to_be_killed = []
     cells_to_be_revived = []
     living_cells_before_next_generation = 0
+    if rule_table is None:
+        rule_table = compile_rule(DEFAULT_RULE)
+
+    # The grid surrounded by ghost cells, so that every cell has eight neighbours to look at
+    padded_grid = pad_grid(grid, boundary_mode)
 
     # For every row in the grid
     for y in range(len(grid)):
+        row_above = padded_grid[y]
+        row = padded_grid[y + 1]
+        row_below = padded_grid[y + 2]
+
         # For every cell in the row
         for x in range(len(grid[y])):
-            # Reset variable
-            living_neighbours = 0
-
-            # For every possible neighbour (those outside of scope are accounted for in the check_neighbour function)
-            for i in range(8):
-                # Add 1 to living_neighbours if the neighbour exists and is alive
-                neighbour = check_neighbour(y, x, i, grid)
-                living_neighbours += neighbour
+            # Count the living neighbours, cell x in the grid being cell x + 1 in the padded grid
+            living_neighbours = row_above[x] + row_above[x + 1] + row_above[x + 2] + row[x] + row[x + 2] +\
+                row_below[x] + row_below[x + 1] + row_below[x + 2]
 
             # Determine the state of this cell in the next generation based on the amount of living neighbours
+            cell = grid[y][x]
+            next_state = rule_table[cell * 9 + living_neighbours]
 
             # If currently alive
-            if grid[y][x] == 1:
+            if cell == 1:
                 # To keep track of total amount of living cells in each generation
                 living_cells_before_next_generation += 1
 
-                # Rule of starvation and overpopulation
-                if living_neighbours < 2 or living_neighbours > 3:
+                # Rule of survival
+                if next_state == 0:
                     # Dies in next generation
                     cells_to_be_killed.append([y, x])
 
             # If currently dead
             else:
-                # Rule of reproduction
-                if living_neighbours == 3:
+                # Rule of birth
+                if next_state == 1:
                     # Resurrects in next generation
                     cells_to_be_revived.append([y, x])
 
@@ -1170,83 +4025,149 @@ def calculate_next_generation(grid):
     return cells_to_be_killed, cells_to_be_revived, living_cells_before_next_generation
 
 
-def check_neighbour(y, x, i, grid):
+def compile_rule(rule):
     """
-    Checks the state of a neighbour in i direction of the cell at y, x.
-    The direction corresponds with cardinal directions like this: 0 being north, 2 being east, 7 being north-west.
-    :param y: The y coordinate the origin cell has in the list of cells
-    :type y: int
-    :param x: The x coordinate the origin cell has in the list of cells
-    :type x: int
-    :param i: The direction in which to check the neighbour's state
-    :type i: int
+    Compiles a rule written in B/S notation, like B3/S23 for Conway's Game of Life or B36/S23 for HighLife,
+    into a table of the next state of a cell: entry state * 9 + living_neighbours.
+    The digits after B are the amounts of living neighbours that make a dead cell come alive,
+    the digits after S the amounts that keep a living cell alive.
+    :param rule: The rule, for example "B3/S23"
+    :type rule: str
+    :return: rule_table (tuple)
+    """
+    parts = rule.replace(" ", "").upper().split("/")
+    if len(parts) != 2:
+        raise ValueError("Not a rule in B/S notation: " + str(rule))
+
+    births = survivals = None
+    for part in parts:
+        if part.startswith("B") and births is None:
+            births = part[1:]
+        elif part.startswith("S") and survivals is None:
+            survivals = part[1:]
+        else:
+            raise ValueError("Not a rule in B/S notation: " + str(rule))
+
+    if any(digit not in "012345678" for digit in births + survivals):
+        raise ValueError("Not a rule in B/S notation: " + str(rule))
+
+    return tuple(int(str(living_neighbours) in births) for living_neighbours in range(9)) +\
+        tuple(int(str(living_neighbours) in survivals) for living_neighbours in range(9))
+
+
+def format_rule(rule_table):
+    """
+    Writes a compiled rule in B/S notation.
+    :param rule_table: The rule compiled by compile_rule
+    :type rule_table: tuple
+    :return: rule (str)
+    """
+    births = "".join(str(living_neighbours) for living_neighbours in range(9) if rule_table[living_neighbours])
+    survivals = "".join(str(living_neighbours) for living_neighbours in range(9) if rule_table[9 + living_neighbours])
+
+    return "B" + births + "/S" + survivals
+
+
+def pad_grid(grid, boundary_mode):
+    """
+    Surrounds the grid with one row and column of ghost cells on every side, holding whatever lies beyond the edges:
+    dead: Dead cells
+    torus: The opposite edge
+    klein: The opposite edge, but the rows above the first row and below the last row are mirrored
+    legacy: The last row above the first row and the last column left of the first column, but dead cells past the
+    last row and the last column, which is how the grid used to behave
     :param grid: The 2D list of cells
     :type grid: list of lists
-    :return: neighbour_state (int, 0 or 1)
+    :param boundary_mode: What lies beyond the edges of the grid, one of BOUNDARY_MODES
+    :type boundary_mode: str
+    :return: padded_grid (list of lists)
     """
-    # North neighbour
-    if i == 0:
-        try:
-            neighbour_state = grid[y - 1][x]
-        except IndexError:
-            neighbour_state = 0
-        return neighbour_state
+    if boundary_mode not in BOUNDARY_MODES:
+        raise ValueError("Unknown boundary mode: " + str(boundary_mode))
 
-    # North-east neighbour
-    if i == 1:
-        try:
-            neighbour_state = grid[y - 1][x + 1]
-        except IndexError:
-            neighbour_state = 0
-        return neighbour_state
+    canvas_width = len(grid[0]) if grid else 0
+    dead_row = [0] * canvas_width
 
-    # East neighbour
-    if i == 2:
-        try:
-            neighbour_state = grid[y][x + 1]
-        except IndexError:
-            neighbour_state = 0
-        return neighbour_state
+    # Ghost rows
+    if boundary_mode in ("torus", "legacy"):
+        row_above = grid[-1]
+    elif boundary_mode == "klein":
+        row_above = grid[-1][::-1]
+    else:
+        row_above = dead_row
 
-    # South-east neighbour
-    if i == 3:
-        try:
-            neighbour_state = grid[y + 1][x + 1]
-        except IndexError:
-            neighbour_state = 0
-        return neighbour_state
+    if boundary_mode == "torus":
+        row_below = grid[0]
+    elif boundary_mode == "klein":
+        row_below = grid[0][::-1]
+    else:
+        row_below = dead_row
 
-    # South neighbour
-    if i == 4:
-        try:
-            neighbour_state = grid[y + 1][x]
-        except IndexError:
-            neighbour_state = 0
-        return neighbour_state
+    # Ghost columns
+    wraps_left = boundary_mode != "dead"
+    wraps_right = boundary_mode in ("torus", "klein")
 
-    # South-west neighbour
-    if i == 5:
-        try:
-            neighbour_state = grid[y + 1][x - 1]
-        except IndexError:
-            neighbour_state = 0
-        return neighbour_state
+    padded_grid = []
+    for row in [row_above] + grid + [row_below]:
+        if canvas_width:
+            padded_grid.append([row[-1] if wraps_left else 0] + row + [row[0] if wraps_right else 0])
+        else:
+            padded_grid.append([0, 0])
 
-    # West neighbour
-    if i == 6:
-        try:
-            neighbour_state = grid[y][x - 1]
-        except IndexError:
-            neighbour_state = 0
-        return neighbour_state
+    return padded_grid
 
-    # North-west neighbour
-    if i == 7:
-        try:
-            neighbour_state = grid[y - 1][x - 1]
-        except IndexError:
-            neighbour_state = 0
-        return neighbour_state
+
+def fill_padded_cells(padded, cells, boundary_mode, band_top=0, band_bottom=None):
+    """
+    Copies rows of the cells into the inside of a padded array and fills its ghost cells the same way as pad_grid.
+    :param padded: The array to fill, two rows and columns bigger than the copied rows
+    :type padded: numpy.ndarray
+    :param cells: The cells of the whole board
+    :type cells: numpy.ndarray
+    :param boundary_mode: What lies beyond the edges of the board, one of BOUNDARY_MODES
+    :type boundary_mode: str
+    :param band_top: The first row to copy
+    :type band_top: int
+    :param band_bottom: The row after the last row to copy, defaults to the last row of the board
+    :type band_bottom: int
+    :return: None
+    """
+    canvas_height = cells.shape[0]
+    if band_bottom is None:
+        band_bottom = canvas_height
+    padded[1:-1, 1:-1] = cells[band_top:band_bottom]
+    if not cells.size:
+        return
+
+    # Ghost rows, which are the neighbouring rows inside the board if only a band is copied
+    if band_top > 0:
+        padded[0, 1:-1] = cells[band_top - 1]
+    elif boundary_mode in ("torus", "legacy"):
+        padded[0, 1:-1] = cells[-1]
+    elif boundary_mode == "klein":
+        padded[0, 1:-1] = cells[-1, ::-1]
+    else:
+        padded[0, 1:-1] = 0
+
+    if band_bottom < canvas_height:
+        padded[-1, 1:-1] = cells[band_bottom]
+    elif boundary_mode == "torus":
+        padded[-1, 1:-1] = cells[0]
+    elif boundary_mode == "klein":
+        padded[-1, 1:-1] = cells[0, ::-1]
+    else:
+        padded[-1, 1:-1] = 0
+
+    # Ghost columns, including the corners
+    if boundary_mode == "dead":
+        padded[:, 0] = 0
+    else:
+        padded[:, 0] = padded[:, -2]
+
+    if boundary_mode in ("torus", "klein"):
+        padded[:, -1] = padded[:, 1]
+    else:
+        padded[:, -1] = 0
 
 
 def create_next_generation(grid, cells_to_be_killed, cells_to_be_revived):
@@ -1291,5 +4212,2924 @@ def create_next_generation(grid, cells_to_be_killed, cells_to_be_revived):
         print("Next generation created")
 
 
+def create_engine(grid, engine_name=None, boundary_mode=DEFAULT_BOUNDARY_MODE, rule=DEFAULT_RULE):
+    """
+    Creates the simulation engine that will calculate the generations following the state of the grid.
+    :param grid: The 2D list of cells
+    :type grid: list of lists
+    :param engine_name: Which engine to use, defaults to SIMULATION_ENGINE
+    :type engine_name: str
+    :param boundary_mode: What lies beyond the edges of the grid, one of BOUNDARY_MODES
+    :type boundary_mode: str
+    :param rule: The rule in B/S notation
+    :type rule: str
+    :return: engine (PythonEngine, NumpyEngine, SparseEngine, BitBoard or ParallelEngine)
+    """
+    if engine_name is None:
+        engine_name = SIMULATION_ENGINE
+    if boundary_mode not in BOUNDARY_MODES:
+        raise ValueError("Unknown boundary mode: " + str(boundary_mode))
+
+    if engine_name == "python":
+        return PythonEngine(grid, boundary_mode, rule)
+    elif engine_name == "numpy":
+        return NumpyEngine(grid, boundary_mode, rule)
+    elif engine_name == "sparse":
+        return SparseEngine(grid, boundary_mode, rule)
+    elif engine_name == "bitpacked":
+        return BitBoard.from_grid(grid, boundary_mode, rule)
+    elif engine_name == "parallel":
+        return ParallelEngine(grid, boundary_mode, rule)
+    else:
+        raise ValueError("Unknown simulation engine: " + str(engine_name))
+
+
+def close_engine(engine):
+    """
+    Stops the worker processes and frees the shared memory of an engine that has any.
+    :param engine: The simulation engine
+    :type engine: PythonEngine, NumpyEngine, SparseEngine, BitBoard, ParallelEngine or HashLife
+    :return: None
+    """
+    if isinstance(engine, ParallelEngine):
+        engine.close()
+
+
+def advance_engine(engine, generations):
+    """
+    Advances an engine by a number of generations as fast as it can, without reporting the changes.
+    :param engine: The simulation engine
+    :type engine: PythonEngine, NumpyEngine, SparseEngine, BitBoard, ParallelEngine or HashLife
+    :param generations: The amount of generations
+    :type generations: int
+    :return: None
+    """
+    if isinstance(engine, (ParallelEngine, HashLife)):
+        engine.advance(generations)
+    elif isinstance(engine, (NumpyEngine, BitBoard)):
+        for generation in range(generations):
+            engine.step_buffered()
+    else:
+        for generation in range(generations):
+            engine.step()
+
+
+def get_engine_cells(engine, canvas_height, canvas_width):
+    """
+    Lists the living cells of an engine, the ones of HashLife's unbounded plane that are on the canvas.
+    :param engine: The simulation engine
+    :type engine: PythonEngine, NumpyEngine, SparseEngine, BitBoard, ParallelEngine or HashLife
+    :param canvas_height: The height of the canvas in pixels
+    :type canvas_height: int
+    :param canvas_width: The width of the canvas in pixels
+    :type canvas_width: int
+    :return: cells (list of lists)
+    """
+    if isinstance(engine, HashLife):
+        return engine.get_cells(canvas_height, canvas_width)
+
+    return engine.to_seed()
+
+
+def get_zobrist_key(index):
+    """
+    Gives a cell its own pseudo random 64 bit number, so that a board can be hashed by xoring the numbers
+    of its living cells. The numbers are calculated on the fly with splitmix64 rather than stored in a table.
+    :param index: The index of the cell, y * canvas_width + x
+    :type index: int
+    :return: key (int)
+    """
+    key = ((index + 1) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+    key = ((key ^ (key >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    key = ((key ^ (key >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+
+    return key ^ (key >> 31)
+
+
+def get_zobrist_keys(indices):
+    """
+    The same as get_zobrist_key, for an array of cells at once.
+    :param indices: The indices of the cells, y * canvas_width + x
+    :type indices: numpy.ndarray
+    :return: keys (numpy.ndarray)
+    """
+    keys = (indices.astype(numpy.uint64) + numpy.uint64(1)) * numpy.uint64(0x9E3779B97F4A7C15)
+    keys = (keys ^ (keys >> numpy.uint64(30))) * numpy.uint64(0xBF58476D1CE4E5B9)
+    keys = (keys ^ (keys >> numpy.uint64(27))) * numpy.uint64(0x94D049BB133111EB)
+
+    return keys ^ (keys >> numpy.uint64(31))
+
+
+def describe_stability(cycle_detector):
+    """
+    Describes what the board has settled into.
+    :param cycle_detector: The cycle detector following the simulation
+    :type cycle_detector: CycleDetector
+    :return: description (str)
+    """
+    if cycle_detector.period is None:
+        return "No cycle found within " + str(cycle_detector.window) + " generations"
+    elif cycle_detector.period == 1:
+        return "Still since generation " + str(cycle_detector.stable_generation)
+    else:
+        return "Period " + str(cycle_detector.period) + " since generation " + str(cycle_detector.stable_generation)
+
+
+class CycleDetector:
+    """
+    Notices when the board becomes periodic, by keeping a Zobrist hash of the board that is updated with the
+    cells that change every generation, and remembering the hashes of the last window generations.
+    """
+    def __init__(self, canvas_width, seed=(), window=CYCLE_DETECTION_WINDOW, generation=0, seed_indices=None):
+        """
+        :param canvas_width: The width of the canvas in pixels
+        :type canvas_width: int
+        :param seed: A list of lists containing y, x coordinates of cells that are alive
+        :type seed: list of lists
+        :param window: The longest period that can be detected
+        :type window: int
+        :param generation: The generation number of the seed
+        :type generation: int
+        :param seed_indices: The cells that are alive as y * canvas_width + x, the way BinarySeed.get_indices lists
+        them, instead of seed
+        :type seed_indices: numpy.ndarray or array.array
+        """
+        self.canvas_width = canvas_width
+        self.window = window
+        self.generation = generation
+        self.hash = 0
+        for y, x in seed:
+            self.hash ^= get_zobrist_key(y * canvas_width + x)
+        if seed_indices is not None:
+            if numpy is not None and isinstance(seed_indices, numpy.ndarray):
+                if len(seed_indices):
+                    self.hash ^= int(numpy.bitwise_xor.reduce(get_zobrist_keys(seed_indices)))
+            else:
+                for index in seed_indices:
+                    self.hash ^= get_zobrist_key(index)
+
+        # The hashes of the last window generations, and the generation number of each
+        self.recent_hashes = deque()
+        self.generations_by_hash = {self.hash: generation}
+        self.recent_hashes.append(self.hash)
+
+        # Once the board repeats itself, the length of the cycle and the first generation of it
+        self.period = None
+        self.stable_generation = None
+
+    def update(self, cells_to_be_killed, cells_to_be_revived):
+        """
+        Moves on to the next generation.
+        :param cells_to_be_killed: The cells that died, as y, x coordinates
+        :type cells_to_be_killed: list of lists
+        :param cells_to_be_revived: The cells that came alive, as y, x coordinates
+        :type cells_to_be_revived: list of lists
+        :return: period (int or None)
+        """
+        canvas_width = self.canvas_width
+        for y, x in cells_to_be_killed:
+            self.hash ^= get_zobrist_key(y * canvas_width + x)
+        for y, x in cells_to_be_revived:
+            self.hash ^= get_zobrist_key(y * canvas_width + x)
+
+        return self.record()
+
+    def update_indices(self, killed_indices, revived_indices):
+        """
+        Moves on to the next generation, with the changed cells given the way step_buffered reports them.
+        :param killed_indices: The cells that died, as y * canvas_width + x
+        :type killed_indices: numpy.ndarray
+        :param revived_indices: The cells that came alive, as y * canvas_width + x
+        :type revived_indices: numpy.ndarray
+        :return: period (int or None)
+        """
+        for indices in (killed_indices, revived_indices):
+            if len(indices):
+                self.hash ^= int(numpy.bitwise_xor.reduce(get_zobrist_keys(indices)))
+
+        return self.record()
+
+    def record(self):
+        """
+        Remembers the hash of the new generation and checks whether it has been seen within the window.
+        :return: period (int or None)
+        """
+        self.generation += 1
+
+        if self.period is None and self.hash in self.generations_by_hash:
+            self.stable_generation = self.generations_by_hash[self.hash]
+            self.period = self.generation - self.stable_generation
+
+        # Forget the generation that falls out of the window
+        self.generations_by_hash[self.hash] = self.generation
+        self.recent_hashes.append(self.hash)
+        if len(self.recent_hashes) > self.window:
+            oldest_hash = self.recent_hashes.popleft()
+            if self.generations_by_hash.get(oldest_hash) == self.generation - self.window:
+                del self.generations_by_hash[oldest_hash]
+
+        return self.period
+
+
+def advance_engine_until_stable(engine, generations, cycle_detector):
+    """
+    Advances an engine by a number of generations, stopping early once the cycle detector finds a period.
+    :param engine: The simulation engine
+    :type engine: PythonEngine, NumpyEngine, SparseEngine, BitBoard or ParallelEngine
+    :param generations: The most amount of generations
+    :type generations: int
+    :param cycle_detector: The cycle detector following the engine
+    :type cycle_detector: CycleDetector
+    :return: generations_advanced (int)
+    """
+    for generation in range(generations):
+        if step_engine_with_detector(engine, cycle_detector)[3] is not None:
+            return generation + 1
+
+    return generations
+
+
+def step_engine_with_detector(engine, cycle_detector):
+    """
+    Advances an engine by one generation and tells the cycle detector which cells changed. The engines that keep
+    their cells in NumPy arrays report them as arrays of indices, so that no list of cells is built.
+    :param engine: The simulation engine
+    :type engine: PythonEngine, NumpyEngine, SparseEngine, BitBoard or ParallelEngine
+    :param cycle_detector: The cycle detector following the engine
+    :type cycle_detector: CycleDetector
+    :return: cells_killed (int), cells_revived (int), living_cells_before_next_generation (int), period (int or None)
+    """
+    if isinstance(engine, (NumpyEngine, BitBoard, ParallelEngine)):
+        cells_killed, cells_revived, living_cells_before_next_generation, killed_indices, revived_indices =\
+            engine.step_buffered(report_indices=True)
+        period = cycle_detector.update_indices(killed_indices, revived_indices)
+    else:
+        cells_to_be_killed, cells_to_be_revived, living_cells_before_next_generation = engine.step()
+        period = cycle_detector.update(cells_to_be_killed, cells_to_be_revived)
+        cells_killed = len(cells_to_be_killed)
+        cells_revived = len(cells_to_be_revived)
+
+    return cells_killed, cells_revived, living_cells_before_next_generation, period
+
+
+def advance_engine_with_checkpoints(engine, generations, checkpointer, generation_number=0, cycle_detector=None):
+    """
+    Advances an engine by a number of generations a few at a time, saving a checkpoint whenever one is due.
+    Given a cycle detector it stops early like advance_engine_until_stable once the detector finds a period.
+    :param engine: The simulation engine
+    :type engine: PythonEngine, NumpyEngine, SparseEngine, BitBoard, ParallelEngine or HashLife
+    :param generations: The amount of generations
+    :type generations: int
+    :param checkpointer: Saves the checkpoints
+    :type checkpointer: Checkpointer
+    :param generation_number: The number of the generation the engine is at
+    :type generation_number: int
+    :param cycle_detector: The cycle detector following the engine, None to not check
+    :type cycle_detector: CycleDetector
+    :return: generations_advanced (int)
+    """
+    generations_advanced = 0
+    while generations_advanced < generations:
+        chunk = min(generations - generations_advanced,
+                    checkpointer.get_generations_until_due(generation_number + generations_advanced))
+        if cycle_detector is not None:
+            chunk = advance_engine_until_stable(engine, chunk, cycle_detector)
+        else:
+            advance_engine(engine, chunk)
+        generations_advanced += chunk
+
+        if checkpointer.is_due(generation_number + generations_advanced):
+            checkpointer.save(engine, generation_number + generations_advanced)
+        if cycle_detector is not None and cycle_detector.period is not None:
+            break
+
+    return generations_advanced
+
+
+class PythonEngine:
+    """
+    Steps a private copy of the grid using calculate_next_generation and create_next_generation.
+    """
+    def __init__(self, grid, boundary_mode=DEFAULT_BOUNDARY_MODE, rule=DEFAULT_RULE):
+        """
+        :param grid: The 2D list of cells
+        :type grid: list of lists
+        :param boundary_mode: What lies beyond the edges of the grid, one of BOUNDARY_MODES
+        :type boundary_mode: str
+        :param rule: The rule in B/S notation
+        :type rule: str
+        """
+        self.grid = [row[:] for row in grid]
+        self.boundary_mode = boundary_mode
+        self.rule_table = compile_rule(rule)
+
+    @property
+    def population(self):
+        """
+        :return: The amount of living cells
+        """
+        return sum(sum(row) for row in self.grid)
+
+    def to_seed(self):
+        """
+        Lists the living cells.
+        :return: cells (list of lists)
+        """
+        return [[y, x] for y, row in enumerate(self.grid) for x, cell in enumerate(row) if cell == 1]
+
+    def step(self):
+        """
+        Calculates and creates the next generation.
+        :return: cells_to_be_killed (2D list), cells_to_be_revived (2D list), living_cells_before_next_generation (int)
+        """
+        cells_to_be_killed, cells_to_be_revived, living_cells_before_next_generation = \
+            calculate_next_generation(self.grid, self.boundary_mode, self.rule_table)
+        create_next_generation(self.grid, cells_to_be_killed, cells_to_be_revived)
+
+        return cells_to_be_killed, cells_to_be_revived, living_cells_before_next_generation
+
+
+class NumpyEngine:
+    """
+    Keeps the cells in a 2D NumPy array and calculates every generation for the whole board at once.
+    Gives the same results as calculate_next_generation.
+    Every array used while stepping is allocated up front. The next generation is written into a back buffer
+    which then swaps places with the current one, so step_buffered allocates next to nothing.
+    """
+    def __init__(self, grid, boundary_mode=DEFAULT_BOUNDARY_MODE, rule=DEFAULT_RULE):
+        """
+        :param grid: The 2D list of cells
+        :type grid: list of lists
+        :param boundary_mode: What lies beyond the edges of the grid, one of BOUNDARY_MODES
+        :type boundary_mode: str
+        :param rule: The rule in B/S notation
+        :type rule: str
+        """
+        if numpy is None:
+            raise ImportError("The numpy engine requires NumPy to be installed")
+
+        self.boundary_mode = boundary_mode
+        self.rule_table = numpy.array(compile_rule(rule), dtype=numpy.uint8)
+        canvas_height = len(grid)
+        canvas_width = len(grid[0]) if canvas_height else 0
+        self.cells = numpy.array(grid, dtype=numpy.uint8).reshape(canvas_height, canvas_width)
+        self.next_cells = numpy.zeros_like(self.cells)
+        self.population = int(numpy.count_nonzero(self.cells))
+
+        # The cells surrounded by one row and column of neighbours on every side
+        self.padded_cells = numpy.zeros((canvas_height + 2, canvas_width + 2), dtype=numpy.uint8)
+
+        # Work buffers
+        self.living_neighbours = numpy.zeros_like(self.cells)
+        # numpy.take would copy indices of any other type into a new intp array every generation
+        self.rule_index = numpy.zeros(self.cells.shape, dtype=numpy.intp)
+        self.changed_cells = numpy.zeros(self.cells.shape, dtype=bool)
+        self.revived_cells = numpy.zeros(self.cells.shape, dtype=bool)
+
+    def count_living_neighbours(self):
+        """
+        Counts the living neighbours of every cell by summing the eight shifted views of the padded cells.
+        :return: living_neighbours (numpy.ndarray)
+        """
+        fill_padded_cells(self.padded_cells, self.cells, self.boundary_mode)
+
+        return sum_padded_neighbours(self.padded_cells, self.living_neighbours)
+
+    def calculate_next_cells(self):
+        """
+        Writes the next generation into the back buffer and marks the cells that change and the cells that revive.
+        :return: None
+        """
+        living_neighbours = self.count_living_neighbours()
+
+        # Look up the next state of every cell in the rule table
+        numpy.multiply(self.cells, 9, out=self.rule_index)
+        numpy.add(self.rule_index, living_neighbours, out=self.rule_index)
+        numpy.take(self.rule_table, self.rule_index, out=self.next_cells, mode="clip")
+
+        numpy.not_equal(self.next_cells, self.cells, out=self.changed_cells)
+        numpy.logical_and(self.changed_cells, self.next_cells, out=self.revived_cells)
+
+    def swap_buffers(self, cells_killed, cells_revived):
+        """
+        Makes the back buffer the current generation.
+        :param cells_killed: The amount of cells that died
+        :type cells_killed: int
+        :param cells_revived: The amount of cells that were born
+        :type cells_revived: int
+        :return: None
+        """
+        self.cells, self.next_cells = self.next_cells, self.cells
+        self.population += cells_revived - cells_killed
+
+    def step_buffered(self, report_indices=False):
+        """
+        Calculates and creates the next generation without building lists of cells.
+        :param report_indices: Whether or not to also return the changed cells as arrays of y * canvas_width + x
+        :type report_indices: bool
+        :return: cells_killed (int), cells_revived (int), living_cells_before_next_generation (int),
+        and with report_indices also killed_indices (numpy.ndarray), revived_indices (numpy.ndarray)
+        """
+        living_cells_before_next_generation = self.population
+        self.calculate_next_cells()
+
+        cells_changed = int(numpy.count_nonzero(self.changed_cells))
+        cells_revived = int(numpy.count_nonzero(self.revived_cells))
+        cells_killed = cells_changed - cells_revived
+
+        if report_indices:
+            revived_indices = numpy.flatnonzero(self.revived_cells)
+            numpy.logical_and(self.changed_cells, self.cells, out=self.changed_cells)
+            killed_indices = numpy.flatnonzero(self.changed_cells)
+            self.swap_buffers(cells_killed, cells_revived)
+
+            return cells_killed, cells_revived, living_cells_before_next_generation, killed_indices, revived_indices
+
+        self.swap_buffers(cells_killed, cells_revived)
+
+        return cells_killed, cells_revived, living_cells_before_next_generation
+
+    def step(self):
+        """
+        Calculates and creates the next generation.
+        :return: cells_to_be_killed (2D list), cells_to_be_revived (2D list), living_cells_before_next_generation (int)
+        """
+        living_cells_before_next_generation = self.population
+        self.calculate_next_cells()
+
+        cells_to_be_revived = numpy.argwhere(self.revived_cells).tolist()
+        numpy.logical_and(self.changed_cells, self.cells, out=self.changed_cells)
+        cells_to_be_killed = numpy.argwhere(self.changed_cells).tolist()
+        self.swap_buffers(len(cells_to_be_killed), len(cells_to_be_revived))
+
+        return cells_to_be_killed, cells_to_be_revived, living_cells_before_next_generation
+
+    def to_seed(self):
+        """
+        Lists the living cells.
+        :return: cells (list of lists)
+        """
+        return numpy.argwhere(self.cells).tolist()
+
+
+def sum_padded_neighbours(padded, living_neighbours=None):
+    """
+    Counts the living neighbours of every cell by summing the eight shifted views of a padded array.
+    :param padded: The cells surrounded by one row and column of neighbours on every side
+    :type padded: numpy.ndarray
+    :param living_neighbours: An array to write the result into instead of allocating a new one
+    :type living_neighbours: numpy.ndarray
+    :return: living_neighbours (numpy.ndarray)
+    """
+    living_neighbours = numpy.add(padded[:-2, :-2], padded[:-2, 1:-1], out=living_neighbours)
+    living_neighbours += padded[:-2, 2:]
+    living_neighbours += padded[1:-1, :-2]
+    living_neighbours += padded[1:-1, 2:]
+    living_neighbours += padded[2:, :-2]
+    living_neighbours += padded[2:, 1:-1]
+    living_neighbours += padded[2:, 2:]
+
+    return living_neighbours
+
+
+class SparseEngine:
+    """
+    Keeps the living cells in a set and only evaluates the cells that changed in the last generation together
+    with every cell that has one of them as a neighbour. The cost of a generation therefore scales with the
+    activity on the board rather than with its size. Cells are stored by their index y * canvas_width + x.
+    Rules where dead cells without living neighbours come alive (B0) would make every cell active,
+    so they are not supported.
+    """
+    def __init__(self, grid, boundary_mode=DEFAULT_BOUNDARY_MODE, rule=DEFAULT_RULE):
+        """
+        :param grid: The 2D list of cells
+        :type grid: list of lists
+        :param boundary_mode: What lies beyond the edges of the grid, one of BOUNDARY_MODES
+        :type boundary_mode: str
+        :param rule: The rule in B/S notation
+        :type rule: str
+        """
+        self.rule_table = compile_rule(rule)
+        if self.rule_table[0]:
+            raise ValueError("The sparse engine does not support B0 rules")
+
+        self.canvas_height = len(grid)
+        self.canvas_width = len(grid[0]) if self.canvas_height else 0
+        self.living_cells = set()
+        for y in range(self.canvas_height):
+            row_offset = y * self.canvas_width
+            for x in range(self.canvas_width):
+                if grid[y][x] == 1:
+                    self.living_cells.add(row_offset + x)
+
+        # Every living cell counts as changed, so that its whole neighbourhood is evaluated in the first generation
+        self.changed_cells = set(self.living_cells)
+        self.active_cells = 0
+
+        # The neighbour (above, same, below) of every row as a (row, mirrored) pair, mirrored rows being read
+        # from right to left, and the neighbour (left, same, right) of every column, None being outside the board
+        self.neighbour_rows = [self.get_neighbour_rows(y, boundary_mode) for y in range(self.canvas_height)]
+        self.neighbour_columns = [self.get_neighbour_columns(x, boundary_mode) for x in range(self.canvas_width)]
+
+        # The opposite: every row and column that has this row or column as a neighbour
+        self.affected_rows = [set() for _ in range(self.canvas_height)]
+        for y, neighbour_rows in enumerate(self.neighbour_rows):
+            for neighbour_row in neighbour_rows:
+                if neighbour_row is not None:
+                    self.affected_rows[neighbour_row[0]].add((y, neighbour_row[1]))
+
+        self.affected_columns = [set() for _ in range(self.canvas_width)]
+        for x, neighbour_columns in enumerate(self.neighbour_columns):
+            for neighbour_column in neighbour_columns:
+                if neighbour_column is not None:
+                    self.affected_columns[neighbour_column].add(x)
+
+    def get_neighbour_rows(self, y, boundary_mode):
+        """
+        Finds the rows above, at and below a row, the same way as pad_grid.
+        :param y: The row number
+        :type y: int
+        :param boundary_mode: What lies beyond the edges of the grid, one of BOUNDARY_MODES
+        :type boundary_mode: str
+        :return: neighbour_rows (tuple)
+        """
+        last_row = self.canvas_height - 1
+
+        if y > 0:
+            row_above = (y - 1, False)
+        elif boundary_mode in ("torus", "legacy"):
+            row_above = (last_row, False)
+        elif boundary_mode == "klein":
+            row_above = (last_row, True)
+        else:
+            row_above = None
+
+        if y < last_row:
+            row_below = (y + 1, False)
+        elif boundary_mode == "torus":
+            row_below = (0, False)
+        elif boundary_mode == "klein":
+            row_below = (0, True)
+        else:
+            row_below = None
+
+        return row_above, (y, False), row_below
+
+    def get_neighbour_columns(self, x, boundary_mode):
+        """
+        Finds the columns left of, at and right of a column, the same way as pad_grid.
+        :param x: The column number
+        :type x: int
+        :param boundary_mode: What lies beyond the edges of the grid, one of BOUNDARY_MODES
+        :type boundary_mode: str
+        :return: neighbour_columns (tuple)
+        """
+        last_column = self.canvas_width - 1
+
+        if x > 0:
+            column_left = x - 1
+        elif boundary_mode != "dead":
+            column_left = last_column
+        else:
+            column_left = None
+
+        if x < last_column:
+            column_right = x + 1
+        elif boundary_mode in ("torus", "klein"):
+            column_right = 0
+        else:
+            column_right = None
+
+        return column_left, x, column_right
+
+    @property
+    def population(self):
+        """
+        :return: The amount of living cells
+        """
+        return len(self.living_cells)
+
+    def to_seed(self):
+        """
+        Lists the living cells.
+        :return: cells (list of lists)
+        """
+        return [list(divmod(cell, self.canvas_width)) for cell in sorted(self.living_cells)]
+
+    def count_living_neighbours(self, y, x):
+        """
+        Counts the living neighbours of the cell at y, x.
+        :param y: The y coordinate of the cell
+        :type y: int
+        :param x: The x coordinate of the cell
+        :type x: int
+        :return: living_neighbours (int)
+        """
+        living_cells = self.living_cells
+        neighbour_columns = self.neighbour_columns[x]
+        last_column = self.canvas_width - 1
+        living_neighbours = 0
+
+        for i, neighbour_row in enumerate(self.neighbour_rows[y]):
+            if neighbour_row is None:
+                continue
+            neighbour_y, mirrored = neighbour_row
+            row_offset = neighbour_y * self.canvas_width
+
+            for j, neighbour_x in enumerate(neighbour_columns):
+                # Skip cells outside the board and the cell itself
+                if neighbour_x is None or (i == 1 and j == 1):
+                    continue
+                if mirrored:
+                    neighbour_x = last_column - neighbour_x
+                if row_offset + neighbour_x in living_cells:
+                    living_neighbours += 1
+
+        return living_neighbours
+
+    def step(self):
+        """
+        Calculates and creates the next generation.
+        :return: cells_to_be_killed (2D list), cells_to_be_revived (2D list), living_cells_before_next_generation (int)
+        """
+        canvas_width = self.canvas_width
+        living_cells = self.living_cells
+
+        # Only the cells near the last generation's changes can change in this generation
+        active_cells = set()
+        for cell in self.changed_cells:
+            y, x = divmod(cell, canvas_width)
+            for affected_y, mirrored in self.affected_rows[y]:
+                row_offset = affected_y * canvas_width
+                for affected_x in self.affected_columns[canvas_width - 1 - x if mirrored else x]:
+                    active_cells.add(row_offset + affected_x)
+
+        self.active_cells = len(active_cells)
+        if VERBOSE:
+            print("\tNumber of active cells: " + str(self.active_cells))
+
+        cells_to_be_killed = []
+        cells_to_be_revived = []
+        rule_table = self.rule_table
+        for cell in active_cells:
+            y, x = divmod(cell, canvas_width)
+            living_neighbours = self.count_living_neighbours(y, x)
+
+            # Rule of survival
+            if cell in living_cells:
+                if not rule_table[9 + living_neighbours]:
+                    cells_to_be_killed.append(cell)
+
+            # Rule of birth
+            elif rule_table[living_neighbours]:
+                cells_to_be_revived.append(cell)
+
+        living_cells_before_next_generation = len(living_cells)
+        living_cells.difference_update(cells_to_be_killed)
+        living_cells.update(cells_to_be_revived)
+        self.changed_cells = set(cells_to_be_killed)
+        self.changed_cells.update(cells_to_be_revived)
+
+        cells_to_be_killed.sort()
+        cells_to_be_revived.sort()
+        cells_to_be_killed = [list(divmod(cell, canvas_width)) for cell in cells_to_be_killed]
+        cells_to_be_revived = [list(divmod(cell, canvas_width)) for cell in cells_to_be_revived]
+
+        return cells_to_be_killed, cells_to_be_revived, living_cells_before_next_generation
+
+
+def jump_to_generation(grid, generations, boundary_mode=DEFAULT_BOUNDARY_MODE, rule=DEFAULT_RULE, is_cancelled=None):
+    """
+    Advances the grid by any amount of generations at once.
+    HashLife gets there in one go, but it simulates an unbounded plane, so it is only used when that gives the same
+    board as stepping the grid, see is_jump_within_canvas, and never for rules where dead cells come alive without
+    living neighbours (B0). Otherwise the generations are stepped one at a time with the fastest engine there is,
+    until they are done or is_cancelled returns True.
+    :param grid: The 2D list of cells
+    :type grid: list of lists
+    :param generations: The amount of generations to advance
+    :type generations: int
+    :param boundary_mode: What lies beyond the edges of the grid when stepping, one of BOUNDARY_MODES
+    :type boundary_mode: str
+    :param rule: The rule in B/S notation
+    :type rule: str
+    :param is_cancelled: Tells whether to stop stepping, it is called before every generation
+    :type is_cancelled: function
+    :return: generations_advanced (int)
+    """
+    if compile_rule(rule)[0] or not is_jump_within_canvas(grid, generations):
+        engine = create_engine(grid, "numpy" if numpy is not None else "python", boundary_mode, rule)
+        generations_advanced = 0
+        while generations_advanced < generations and (is_cancelled is None or not is_cancelled()):
+            cells_to_be_killed, cells_to_be_revived = engine.step()[:2]
+            create_next_generation(grid, cells_to_be_killed, cells_to_be_revived)
+            generations_advanced += 1
+
+        return generations_advanced
+
+    canvas_height = len(grid)
+    canvas_width = len(grid[0]) if canvas_height else 0
+    living_cells = [[y, x] for y in range(canvas_height) for x in range(canvas_width) if grid[y][x] == 1]
+
+    hashlife = HashLife(living_cells, rule=rule)
+    hashlife.advance(generations)
+
+    for y in range(canvas_height):
+        grid[y] = [0] * canvas_width
+    for y, x in hashlife.get_cells(canvas_height, canvas_width):
+        grid[y][x] = 1
+
+    return generations
+
+
+def is_jump_within_canvas(grid, generations):
+    """
+    Whether jumping ahead with HashLife gives the same board as stepping the grid.
+    Living cells spread at most one cell per generation. As long as the box around the living cells, grown by the
+    amount of generations, stays inside the canvas, no cell is alive on an edge before the last generation,
+    so whatever lies beyond the edges never comes into play.
+    :param grid: The 2D list of cells
+    :type grid: list of lists
+    :param generations: The amount of generations to advance
+    :type generations: int
+    :return: bool
+    """
+    living_rows = [y for y, row in enumerate(grid) if 1 in row]
+    if not living_rows:
+        return True
+    left = min(row.index(1) for row in grid if 1 in row)
+    right = max(len(row) - 1 - row[::-1].index(1) for row in grid if 1 in row)
+
+    return living_rows[0] - generations >= 0 and living_rows[-1] + generations < len(grid) and\
+        left - generations >= 0 and right + generations < len(grid[0])
+
+
+class HashLifeNode:
+    """
+    A square of 2^level by 2^level cells, made out of four squares of 2^(level - 1) by 2^(level - 1) cells.
+    Nodes are canonical: two nodes with the same cells are the same object, which is what makes it possible to
+    remember the result of advancing a node.
+    """
+    __slots__ = ("nw", "ne", "sw", "se", "level", "population", "results")
+
+    def __init__(self, nw, ne, sw, se, level, population):
+        """
+        :param nw: The north-west quadrant
+        :type nw: HashLifeNode
+        :param ne: The north-east quadrant
+        :type ne: HashLifeNode
+        :param sw: The south-west quadrant
+        :type sw: HashLifeNode
+        :param se: The south-east quadrant
+        :type se: HashLifeNode
+        :param level: The node is 2^level cells wide and high
+        :type level: int
+        :param population: The amount of living cells in the node
+        :type population: int
+        """
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.level = level
+        self.population = population
+
+        # The centre of the node advanced by 2^j generations, keyed by j
+        self.results = None
+
+
+class HashLife:
+    """
+    Advances a seed by large amounts of generations using Bill Gosper's HashLife algorithm.
+    The board is a quadtree of canonical nodes, and the result of advancing each node is remembered, so repeating
+    patterns in space and time are only calculated once.
+    Unlike the other engines HashLife simulates an unbounded plane, so cells never reach the edges of the canvas,
+    which also means rules where dead cells without living neighbours come alive (B0) are not supported.
+    """
+    def __init__(self, seed, max_nodes=DEFAULT_HASHLIFE_MAX_NODES, rule=DEFAULT_RULE):
+        """
+        :param seed: A list of lists containing y, x coordinates of cells that are alive
+        :type seed: list of lists
+        :param max_nodes: The amount of nodes that can be cached before the cache is garbage collected
+        :type max_nodes: int
+        :param rule: The rule in B/S notation
+        :type rule: str
+        """
+        self.rule_table = compile_rule(rule)
+        if self.rule_table[0]:
+            raise ValueError("HashLife does not support B0 rules")
+
+        self.max_nodes = max_nodes
+        self.nodes = {}
+        self.dead_cell = HashLifeNode(None, None, None, None, 0, 0)
+        self.living_cell = HashLifeNode(None, None, None, None, 0, 1)
+        self.empty_nodes = [self.dead_cell]
+        self.generation = 0
+
+        # The root node and the coordinates of its north-west corner
+        self.root, self.top, self.left = self.build(seed)
+
+    @property
+    def population(self):
+        """
+        :return: The amount of living cells
+        """
+        return self.root.population
+
+    def join(self, nw, ne, sw, se):
+        """
+        Returns the canonical node made out of four quadrants.
+        :param nw: The north-west quadrant
+        :type nw: HashLifeNode
+        :param ne: The north-east quadrant
+        :type ne: HashLifeNode
+        :param sw: The south-west quadrant
+        :type sw: HashLifeNode
+        :param se: The south-east quadrant
+        :type se: HashLifeNode
+        :return: node (HashLifeNode)
+        """
+        key = (nw, ne, sw, se)
+        node = self.nodes.get(key)
+        if node is None:
+            node = HashLifeNode(nw, ne, sw, se, nw.level + 1,
+                                nw.population + ne.population + sw.population + se.population)
+            self.nodes[key] = node
+
+        return node
+
+    def get_empty_node(self, level):
+        """
+        Returns the node without any living cells at a given level.
+        :param level: The level of the node
+        :type level: int
+        :return: node (HashLifeNode)
+        """
+        while len(self.empty_nodes) <= level:
+            empty = self.empty_nodes[-1]
+            self.empty_nodes.append(self.join(empty, empty, empty, empty))
+
+        return self.empty_nodes[level]
+
+    def build(self, seed):
+        """
+        Builds the quadtree of a seed, bottom up.
+        :param seed: A list of lists containing y, x coordinates of cells that are alive
+        :type seed: list of lists
+        :return: root (HashLifeNode), top (int), left (int)
+        """
+        if not seed:
+            return self.get_empty_node(3), 0, 0
+
+        top = min(cell[0] for cell in seed)
+        left = min(cell[1] for cell in seed)
+        pattern = {(cell[0] - top, cell[1] - left): self.living_cell for cell in seed}
+
+        level = 0
+        while len(pattern) > 1 or level < 3:
+            empty = self.get_empty_node(level)
+
+            # Group the nodes into the quadrants of their parent
+            quadrants = {}
+            for (y, x), node in pattern.items():
+                parent_quadrants = quadrants.setdefault((y >> 1, x >> 1), [empty, empty, empty, empty])
+                parent_quadrants[(y & 1) * 2 + (x & 1)] = node
+
+            pattern = {position: self.join(*parent_quadrants) for position, parent_quadrants in quadrants.items()}
+            level += 1
+
+        return pattern[(0, 0)], top, left
+
+    def centre(self):
+        """
+        Surrounds the root node with empty space, making it one level bigger.
+        :return: None
+        """
+        root = self.root
+        empty = self.get_empty_node(root.level - 1)
+        self.root = self.join(self.join(empty, empty, empty, root.nw), self.join(empty, empty, root.ne, empty),
+                              self.join(empty, root.sw, empty, empty), self.join(root.se, empty, empty, empty))
+        self.top -= 1 << (root.level - 1)
+        self.left -= 1 << (root.level - 1)
+
+    def is_padded(self):
+        """
+        Checks whether all the living cells of the root node are inside its central sixteenth.
+        :return: bool
+        """
+        root = self.root
+        return root.level >= 3 and root.nw.population == root.nw.se.se.population and\
+            root.ne.population == root.ne.sw.sw.population and\
+            root.sw.population == root.sw.ne.ne.population and\
+            root.se.population == root.se.nw.nw.population
+
+    def advance_4x4(self, node):
+        """
+        Calculates the central 2x2 cells of a 4x4 node one generation later.
+        :param node: The node, at level 2
+        :type node: HashLifeNode
+        :return: result (HashLifeNode)
+        """
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+        cells = [[nw.nw.population, nw.ne.population, ne.nw.population, ne.ne.population],
+                 [nw.sw.population, nw.se.population, ne.sw.population, ne.se.population],
+                 [sw.nw.population, sw.ne.population, se.nw.population, se.ne.population],
+                 [sw.sw.population, sw.se.population, se.sw.population, se.se.population]]
+
+        next_cells = []
+        for y in (1, 2):
+            for x in (1, 2):
+                living_neighbours = cells[y - 1][x - 1] + cells[y - 1][x] + cells[y - 1][x + 1] +\
+                    cells[y][x - 1] + cells[y][x + 1] +\
+                    cells[y + 1][x - 1] + cells[y + 1][x] + cells[y + 1][x + 1]
+
+                if self.rule_table[cells[y][x] * 9 + living_neighbours]:
+                    next_cells.append(self.living_cell)
+                else:
+                    next_cells.append(self.dead_cell)
+
+        return self.join(*next_cells)
+
+    def advance_node(self, node, j):
+        """
+        Calculates the centre of a node 2^j generations later.
+        A node at level k can be advanced by at most 2^(k - 2) generations.
+        :param node: The node, at level 2 or higher
+        :type node: HashLifeNode
+        :param j: The base 2 logarithm of the amount of generations
+        :type j: int
+        :return: result (HashLifeNode)
+        """
+        j = min(j, node.level - 2)
+        if node.results is not None and j in node.results:
+            return node.results[j]
+
+        if node.population == 0:
+            return node.nw
+
+        if node.level == 2:
+            result = self.advance_4x4(node)
+
+        else:
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            join = self.join
+
+            # The nine overlapping sub-squares of half the size, advanced
+            c1 = self.advance_node(nw, j)
+            c2 = self.advance_node(join(nw.ne, ne.nw, nw.se, ne.sw), j)
+            c3 = self.advance_node(ne, j)
+            c4 = self.advance_node(join(nw.sw, nw.se, sw.nw, sw.ne), j)
+            c5 = self.advance_node(join(nw.se, ne.sw, sw.ne, se.nw), j)
+            c6 = self.advance_node(join(ne.sw, ne.se, se.nw, se.ne), j)
+            c7 = self.advance_node(sw, j)
+            c8 = self.advance_node(join(sw.ne, se.nw, sw.se, se.sw), j)
+            c9 = self.advance_node(se, j)
+
+            # Advancing less than the maximum: the nine results are already far enough ahead,
+            # so just put their centres together
+            if j < node.level - 2:
+                result = join(join(c1.se, c2.sw, c4.ne, c5.nw), join(c2.se, c3.sw, c5.ne, c6.nw),
+                              join(c4.se, c5.sw, c7.ne, c8.nw), join(c5.se, c6.sw, c8.ne, c9.nw))
+
+            # Advancing the maximum: advance the four overlapping squares made from the nine results once more
+            else:
+                result = join(self.advance_node(join(c1, c2, c4, c5), j),
+                              self.advance_node(join(c2, c3, c5, c6), j),
+                              self.advance_node(join(c4, c5, c7, c8), j),
+                              self.advance_node(join(c5, c6, c8, c9), j))
+
+        if node.results is None:
+            node.results = {}
+        node.results[j] = result
+
+        return result
+
+    def step_power(self, j):
+        """
+        Advances the board by 2^j generations.
+        :param j: The base 2 logarithm of the amount of generations
+        :type j: int
+        :return: None
+        """
+        # Make room for the cells to spread out for 2^j generations
+        while self.root.level < j + 3 or not self.is_padded():
+            self.centre()
+
+        level = self.root.level
+        self.root = self.advance_node(self.root, j)
+        self.top += 1 << (level - 2)
+        self.left += 1 << (level - 2)
+        self.generation += 1 << j
+
+        if len(self.nodes) > self.max_nodes:
+            self.collect_garbage()
+
+    def advance(self, generations):
+        """
+        Advances the board by any amount of generations, one power of two at a time.
+        :param generations: The amount of generations
+        :type generations: int
+        :return: None
+        """
+        if generations < 0:
+            raise ValueError("HashLife can only advance forwards")
+
+        j = 0
+        while generations:
+            if generations & 1:
+                self.step_power(j)
+            generations >>= 1
+            j += 1
+
+    def advance_to(self, target_generation):
+        """
+        Advances the board to a specific generation.
+        :param target_generation: The generation number to advance to
+        :type target_generation: int
+        :return: None
+        """
+        self.advance(target_generation - self.generation)
+
+    def collect_garbage(self):
+        """
+        Forgets every node that is not part of the current board, along with every remembered result.
+        :return: None
+        """
+        if VERBOSE:
+            print("Collecting garbage, " + str(len(self.nodes)) + " nodes cached")
+
+        self.nodes = {}
+        nodes_to_keep = [self.root] + self.empty_nodes[1:]
+        while nodes_to_keep:
+            node = nodes_to_keep.pop()
+            key = (node.nw, node.ne, node.sw, node.se)
+            if node.level == 0 or key in self.nodes:
+                continue
+
+            node.results = None
+            self.nodes[key] = node
+            nodes_to_keep.extend(key)
+
+        if VERBOSE:
+            print("Garbage collected, " + str(len(self.nodes)) + " nodes cached")
+
+    def get_cells(self, canvas_height=None, canvas_width=None):
+        """
+        Lists the living cells, optionally only those inside the canvas.
+        :param canvas_height: The height of the canvas in pixels
+        :type canvas_height: int
+        :param canvas_width: The width of the canvas in pixels
+        :type canvas_width: int
+        :return: cells (list of lists)
+        """
+        cells = []
+        nodes_to_visit = [(self.root, self.top, self.left)]
+        while nodes_to_visit:
+            node, top, left = nodes_to_visit.pop()
+            if node.population == 0:
+                continue
+
+            size = 1 << node.level
+            if canvas_height is not None and (top >= canvas_height or top + size <= 0 or
+                                              left >= canvas_width or left + size <= 0):
+                continue
+
+            if node.level == 0:
+                cells.append([top, left])
+            else:
+                half = size >> 1
+                nodes_to_visit.append((node.se, top + half, left + half))
+                nodes_to_visit.append((node.sw, top + half, left))
+                nodes_to_visit.append((node.ne, top, left + half))
+                nodes_to_visit.append((node.nw, top, left))
+
+        return cells
+
+
+class BitBoard:
+    """
+    Stores the cells packed 64 to a machine word, one NumPy array of uint64 words per row, where bit i of word k
+    in a row is the cell at x = 64 * k + i. The next generation is calculated for 64 cells per operation by adding
+    up shifted copies of the rows with bitwise full adders. Gives the same results as calculate_next_generation.
+    """
+    def __init__(self, canvas_height, canvas_width, seed=(), boundary_mode=DEFAULT_BOUNDARY_MODE, rule=DEFAULT_RULE):
+        """
+        :param canvas_height: The height of the canvas in pixels
+        :type canvas_height: int
+        :param canvas_width: The width of the canvas in pixels
+        :type canvas_width: int
+        :param seed: A list of lists containing y, x coordinates of cells that are alive
+        :type seed: list of lists
+        :param boundary_mode: What lies beyond the edges of the board, one of BOUNDARY_MODES
+        :type boundary_mode: str
+        :param rule: The rule in B/S notation
+        :type rule: str
+        """
+        if numpy is None:
+            raise ImportError("The bitpacked engine requires NumPy to be installed")
+
+        self.boundary_mode = boundary_mode
+        rule_table = compile_rule(rule)
+        self.births = [living_neighbours for living_neighbours in range(9) if rule_table[living_neighbours]]
+        self.survivals = [living_neighbours for living_neighbours in range(9) if rule_table[9 + living_neighbours]]
+        self.canvas_height = canvas_height
+        self.canvas_width = canvas_width
+        self.words_per_row = (canvas_width + 63) // 64
+
+        # The bits of the last word in a row that are inside the canvas
+        self.last_word_mask = numpy.uint64((1 << (canvas_width - 64 * (self.words_per_row - 1))) - 1)
+        self.words = numpy.zeros((canvas_height, self.words_per_row), dtype=numpy.uint64)
+
+        # The rows surrounded by one row of neighbours above and below
+        self.padded_words = numpy.zeros((canvas_height + 2, self.words_per_row), dtype=numpy.uint64)
+
+        if len(seed):
+            cells = numpy.array(seed, dtype=numpy.int64).reshape(-1, 2)
+            numpy.bitwise_or.at(self.words, (cells[:, 0], cells[:, 1] >> 6),
+                                numpy.left_shift(numpy.uint64(1), (cells[:, 1] & 63).astype(numpy.uint64)))
+
+    @classmethod
+    def from_grid(cls, grid, boundary_mode=DEFAULT_BOUNDARY_MODE, rule=DEFAULT_RULE):
+        """
+        Packs a grid.
+        :param grid: The 2D list of cells, or the 2D array of them BinarySeed.get_cells unpacks
+        :type grid: list of lists or numpy.ndarray
+        :param boundary_mode: What lies beyond the edges of the grid, one of BOUNDARY_MODES
+        :type boundary_mode: str
+        :param rule: The rule in B/S notation
+        :type rule: str
+        :return: bit_board (BitBoard)
+        """
+        canvas_height = len(grid)
+        canvas_width = len(grid[0]) if canvas_height else 0
+        if numpy is not None and isinstance(grid, numpy.ndarray):
+            bit_board = cls(canvas_height, canvas_width, (), boundary_mode, rule)
+            bit_board.words = bit_board.pack(grid)
+            return bit_board
+
+        seed = [[y, x] for y in range(canvas_height) for x in range(canvas_width) if grid[y][x] == 1]
+
+        return cls(canvas_height, canvas_width, seed, boundary_mode, rule)
+
+    def pack(self, cells):
+        """
+        Packs a 2D array with one byte per cell into words.
+        :param cells: The cells, 0 or 1
+        :type cells: numpy.ndarray
+        :return: words (numpy.ndarray)
+        """
+        padded_cells = numpy.zeros((cells.shape[0], self.words_per_row * 64), dtype=numpy.uint8)
+        padded_cells[:, :self.canvas_width] = cells
+        packed_bytes = numpy.packbits(padded_cells, axis=1, bitorder="little")
+
+        return packed_bytes.view("<u8").astype(numpy.uint64)
+
+    def mirror(self, words):
+        """
+        Reverses the order of the cells in a packed row.
+        :param words: A packed row
+        :type words: numpy.ndarray
+        :return: mirrored_words (numpy.ndarray)
+        """
+        return self.pack(self.unpack(words[numpy.newaxis])[:, ::-1])[0]
+
+    def unpack(self, words):
+        """
+        Unpacks words into a 2D array with one byte per cell.
+        :param words: Packed rows
+        :type words: numpy.ndarray
+        :return: cells (numpy.ndarray)
+        """
+        cells = numpy.unpackbits(words.astype("<u8", copy=False).view(numpy.uint8), axis=1, bitorder="little")
+
+        return cells[:, :self.canvas_width]
+
+    def to_seed(self):
+        """
+        Lists the living cells.
+        :return: cells (list of lists)
+        """
+        return numpy.argwhere(self.unpack(self.words)).tolist()
+
+    @property
+    def population(self):
+        """
+        :return: The amount of living cells
+        """
+        return self.count_cells(self.words)
+
+    @staticmethod
+    def count_cells(words):
+        """
+        Counts the living cells in packed rows without unpacking them, by adding up the bits of every word
+        in pairs, then in nibbles and then in bytes.
+        :param words: Packed rows
+        :type words: numpy.ndarray
+        :return: cells (int)
+        """
+        pair_mask = numpy.uint64(0x3333333333333333)
+        words = words - ((words >> numpy.uint64(1)) & numpy.uint64(0x5555555555555555))
+        words = (words & pair_mask) + ((words >> numpy.uint64(2)) & pair_mask)
+        words = (words + (words >> numpy.uint64(4))) & numpy.uint64(0x0F0F0F0F0F0F0F0F)
+
+        # Multiplying adds up the eight bytes into the highest one
+        return int(((words * numpy.uint64(0x0101010101010101)) >> numpy.uint64(56)).sum())
+
+    def shift_from_west(self, words):
+        """
+        Moves every cell one step east, so that each cell lines up with its west neighbour.
+        The cells in the first column get the ghost cells left of the board.
+        :param words: Packed rows
+        :type words: numpy.ndarray
+        :return: shifted_words (numpy.ndarray)
+        """
+        shifted_words = words << numpy.uint64(1)
+        shifted_words[:, 1:] |= words[:, :-1] >> numpy.uint64(63)
+
+        if self.boundary_mode != "dead":
+            last_bit = numpy.uint64((self.canvas_width - 1) & 63)
+            shifted_words[:, 0] |= (words[:, -1] >> last_bit) & numpy.uint64(1)
+        shifted_words[:, -1] &= self.last_word_mask
+
+        return shifted_words
+
+    def shift_from_east(self, words):
+        """
+        Moves every cell one step west, so that each cell lines up with its east neighbour.
+        The cells in the last column get the ghost cells right of the board.
+        :param words: Packed rows
+        :type words: numpy.ndarray
+        :return: shifted_words (numpy.ndarray)
+        """
+        shifted_words = words >> numpy.uint64(1)
+        shifted_words[:, :-1] |= words[:, 1:] << numpy.uint64(63)
+
+        if self.boundary_mode in ("torus", "klein"):
+            last_bit = numpy.uint64((self.canvas_width - 1) & 63)
+            shifted_words[:, -1] |= (words[:, 0] & numpy.uint64(1)) << last_bit
+
+        return shifted_words
+
+    def calculate_next_words(self):
+        """
+        Calculates the packed rows of the next generation.
+        :return: next_words (numpy.ndarray)
+        """
+        words = self.words
+        padded = self.padded_words
+        padded[1:-1] = words
+
+        # Ghost rows, the same way as pad_grid
+        if self.boundary_mode in ("torus", "legacy"):
+            padded[0] = words[-1]
+        elif self.boundary_mode == "klein":
+            padded[0] = self.mirror(words[-1])
+        else:
+            padded[0] = 0
+
+        if self.boundary_mode == "torus":
+            padded[-1] = words[0]
+        elif self.boundary_mode == "klein":
+            padded[-1] = self.mirror(words[0])
+        else:
+            padded[-1] = 0
+
+        west = self.shift_from_west(padded)
+        east = self.shift_from_east(padded)
+
+        # Add up the three neighbours in the row above and the row below, and the two in the same row,
+        # giving a two bit number for each
+        above_ones = west[:-2] ^ padded[:-2] ^ east[:-2]
+        above_twos = (west[:-2] & padded[:-2]) | (east[:-2] & (west[:-2] ^ padded[:-2]))
+        same_ones = west[1:-1] ^ east[1:-1]
+        same_twos = west[1:-1] & east[1:-1]
+        below_ones = west[2:] ^ padded[2:] ^ east[2:]
+        below_twos = (west[2:] & padded[2:]) | (east[2:] & (west[2:] ^ padded[2:]))
+
+        # Add the three numbers together, giving the four bits of the total
+        ones = above_ones ^ same_ones ^ below_ones
+        ones_carry = (above_ones & same_ones) | (below_ones & (above_ones ^ same_ones))
+        first_pair = above_twos ^ same_twos
+        second_pair = below_twos ^ ones_carry
+        twos = first_pair ^ second_pair
+        first_pair_carry = above_twos & same_twos
+        second_pair_carry = below_twos & ones_carry
+        fours = first_pair_carry ^ second_pair_carry ^ (first_pair & second_pair)
+        eights = first_pair_carry & second_pair_carry
+        bits = ((ones, ~ones), (twos, ~twos), (fours, ~fours), (eights, ~eights))
+
+        # Come alive or stay alive wherever the total is one of the amounts in the rule
+        next_words = numpy.zeros_like(words)
+        for living_neighbours in set(self.births + self.survivals):
+            matches = bits[0][living_neighbours & 1 == 0] & bits[1][living_neighbours & 2 == 0] &\
+                bits[2][living_neighbours & 4 == 0] & bits[3][living_neighbours & 8 == 0]
+            if living_neighbours not in self.survivals:
+                matches &= ~words
+            elif living_neighbours not in self.births:
+                matches &= words
+            next_words |= matches
+
+        next_words[:, -1] &= self.last_word_mask
+
+        return next_words
+
+    def step(self):
+        """
+        Calculates and creates the next generation.
+        :return: cells_to_be_killed (2D list), cells_to_be_revived (2D list), living_cells_before_next_generation (int)
+        """
+        living_cells_before_next_generation = self.population
+        next_words = self.calculate_next_words()
+        changed_words = next_words ^ self.words
+
+        cells_to_be_killed = numpy.argwhere(self.unpack(changed_words & self.words)).tolist()
+        cells_to_be_revived = numpy.argwhere(self.unpack(changed_words & next_words)).tolist()
+        self.words = next_words
+
+        return cells_to_be_killed, cells_to_be_revived, living_cells_before_next_generation
+
+    def step_buffered(self, report_indices=False):
+        """
+        Calculates and creates the next generation without unpacking the cells or building lists of them.
+        :param report_indices: Whether or not to also return the changed cells as arrays of y * canvas_width + x,
+        which does unpack the changed cells
+        :type report_indices: bool
+        :return: cells_killed (int), cells_revived (int), living_cells_before_next_generation (int),
+        and with report_indices also killed_indices (numpy.ndarray), revived_indices (numpy.ndarray)
+        """
+        living_cells_before_next_generation = self.population
+        next_words = self.calculate_next_words()
+        changed_words = next_words ^ self.words
+
+        cells_revived = self.count_cells(changed_words & next_words)
+        cells_killed = self.count_cells(changed_words) - cells_revived
+
+        if report_indices:
+            killed_indices = numpy.flatnonzero(self.unpack(changed_words & self.words))
+            revived_indices = numpy.flatnonzero(self.unpack(changed_words & next_words))
+            self.words = next_words
+
+            return cells_killed, cells_revived, living_cells_before_next_generation, killed_indices, revived_indices
+
+        self.words = next_words
+
+        return cells_killed, cells_revived, living_cells_before_next_generation
+
+
+class ParallelEngine:
+    """
+    Splits the board into horizontal bands and steps each band in its own worker process.
+    Both the current and the next generation live in shared memory, so no cells are ever pickled: each worker reads
+    the row above and the row below its band straight from its neighbours' bands (the halo), writes its band of the
+    next generation, and then waits at a barrier for the other workers before the buffers are swapped.
+    Gives the same results as calculate_next_generation.
+    """
+    def __init__(self, grid, boundary_mode=DEFAULT_BOUNDARY_MODE, rule=DEFAULT_RULE, workers=None):
+        """
+        :param grid: The 2D list of cells
+        :type grid: list of lists
+        :param boundary_mode: What lies beyond the edges of the grid, one of BOUNDARY_MODES
+        :type boundary_mode: str
+        :param rule: The rule in B/S notation
+        :type rule: str
+        :param workers: The amount of worker processes, defaults to DEFAULT_PARALLEL_WORKERS
+        :type workers: int
+        """
+        if numpy is None:
+            raise ImportError("The parallel engine requires NumPy to be installed")
+
+        self.canvas_height = len(grid)
+        self.canvas_width = len(grid[0]) if self.canvas_height else 0
+        if workers is None:
+            workers = DEFAULT_PARALLEL_WORKERS
+        workers = max(1, min(workers, self.canvas_height))
+
+        # Two buffers of cells, the current generation being in buffers[self.current_buffer]
+        board_size = max(1, self.canvas_height * self.canvas_width)
+        self.shared_board = shared_memory.SharedMemory(create=True, size=2 * board_size)
+        self.buffers = numpy.ndarray((2, self.canvas_height, self.canvas_width), dtype=numpy.uint8,
+                                     buffer=self.shared_board.buf)
+        self.buffers[0] = numpy.array(grid, dtype=numpy.uint8).reshape(self.canvas_height, self.canvas_width)
+        self.current_buffer = 0
+
+        # control[0] is the command for the workers and control[1] the amount of generations to calculate
+        self.control = multiprocessing.RawArray("q", 2)
+        self.band_populations = multiprocessing.RawArray("q", workers)
+        self.population = int(numpy.count_nonzero(self.buffers[0]))
+
+        # The start and done barriers include this process, the step barrier is only between the workers
+        self.start_barrier = multiprocessing.Barrier(workers + 1)
+        self.done_barrier = multiprocessing.Barrier(workers + 1)
+        self.step_barrier = multiprocessing.Barrier(workers)
+
+        self.workers = []
+        for worker in range(workers):
+            band_top = self.canvas_height * worker // workers
+            band_bottom = self.canvas_height * (worker + 1) // workers
+            process = multiprocessing.Process(target=run_parallel_worker, daemon=True,
+                                              args=(self.shared_board.name, self.canvas_height, self.canvas_width,
+                                                    band_top, band_bottom, boundary_mode, compile_rule(rule),
+                                                    worker, self.control,
+                                                    self.band_populations, self.start_barrier, self.step_barrier,
+                                                    self.done_barrier))
+            process.start()
+            self.workers.append(process)
+
+    def advance(self, generations):
+        """
+        Has the workers calculate a number of generations without reporting the changes in between.
+        :param generations: The amount of generations
+        :type generations: int
+        :return: None
+        """
+        self.control[0] = PARALLEL_COMMAND_STEP
+        self.control[1] = generations
+        self.start_barrier.wait()
+        self.done_barrier.wait()
+
+        self.current_buffer = (self.current_buffer + generations) % 2
+        self.population = sum(self.band_populations)
+
+    def step(self):
+        """
+        Calculates and creates the next generation.
+        :return: cells_to_be_killed (2D list), cells_to_be_revived (2D list), living_cells_before_next_generation (int)
+        """
+        living_cells_before_next_generation = self.population
+        self.advance(1)
+
+        cells = self.buffers[self.current_buffer]
+        previous_cells = self.buffers[1 - self.current_buffer]
+        cells_to_be_killed = numpy.argwhere(previous_cells > cells).tolist()
+        cells_to_be_revived = numpy.argwhere(previous_cells < cells).tolist()
+
+        return cells_to_be_killed, cells_to_be_revived, living_cells_before_next_generation
+
+    def step_buffered(self, report_indices=False):
+        """
+        Calculates and creates the next generation without building lists of cells.
+        :param report_indices: Whether or not to also return the changed cells as arrays of y * canvas_width + x
+        :type report_indices: bool
+        :return: cells_killed (int), cells_revived (int), living_cells_before_next_generation (int),
+        and with report_indices also killed_indices (numpy.ndarray), revived_indices (numpy.ndarray)
+        """
+        living_cells_before_next_generation = self.population
+        self.advance(1)
+
+        cells = self.buffers[self.current_buffer]
+        previous_cells = self.buffers[1 - self.current_buffer]
+        if report_indices:
+            killed_indices = numpy.flatnonzero(previous_cells > cells)
+            revived_indices = numpy.flatnonzero(previous_cells < cells)
+
+            return len(killed_indices), len(revived_indices), living_cells_before_next_generation,\
+                killed_indices, revived_indices
+
+        # The workers counted the population, so the deaths follow from the births
+        cells_revived = int(numpy.count_nonzero(previous_cells < cells))
+        cells_killed = living_cells_before_next_generation + cells_revived - self.population
+
+        return cells_killed, cells_revived, living_cells_before_next_generation
+
+    @property
+    def cells(self):
+        """
+        :return: The current generation as a 2D array
+        """
+        return self.buffers[self.current_buffer]
+
+    def to_seed(self):
+        """
+        Lists the living cells.
+        :return: cells (list of lists)
+        """
+        return numpy.argwhere(self.cells).tolist()
+
+    def close(self):
+        """
+        Stops the worker processes and frees the shared memory.
+        :return: None
+        """
+        if not self.workers:
+            return
+
+        self.control[0] = PARALLEL_COMMAND_STOP
+        self.start_barrier.wait()
+        for process in self.workers:
+            process.join()
+        self.workers = []
+
+        del self.buffers
+        self.shared_board.close()
+        self.shared_board.unlink()
+
+
+def run_parallel_worker(shared_board_name, canvas_height, canvas_width, band_top, band_bottom, boundary_mode,
+                        rule_table, worker, control, band_populations, start_barrier, step_barrier, done_barrier):
+    """
+    Steps one horizontal band of the board in shared memory until told to stop.
+    :param shared_board_name: The name of the shared memory holding both buffers of cells
+    :type shared_board_name: str
+    :param canvas_height: The height of the canvas in pixels
+    :type canvas_height: int
+    :param canvas_width: The width of the canvas in pixels
+    :type canvas_width: int
+    :param band_top: The first row of the band
+    :type band_top: int
+    :param band_bottom: The row after the last row of the band
+    :type band_bottom: int
+    :param boundary_mode: What lies beyond the edges of the board, one of BOUNDARY_MODES
+    :type boundary_mode: str
+    :param rule_table: The rule compiled by compile_rule
+    :type rule_table: tuple
+    :param worker: The number of this worker
+    :type worker: int
+    :param control: The command and the amount of generations to calculate
+    :type control: multiprocessing.RawArray
+    :param band_populations: The amount of living cells in each band
+    :type band_populations: multiprocessing.RawArray
+    :param start_barrier: Waited on by the workers and the engine before each command
+    :type start_barrier: multiprocessing.Barrier
+    :param step_barrier: Waited on by the workers after each generation
+    :type step_barrier: multiprocessing.Barrier
+    :param done_barrier: Waited on by the workers and the engine after each command
+    :type done_barrier: multiprocessing.Barrier
+    :return: None
+    """
+    shared_board = shared_memory.SharedMemory(name=shared_board_name)
+    buffers = numpy.ndarray((2, canvas_height, canvas_width), dtype=numpy.uint8, buffer=shared_board.buf)
+    padded = numpy.zeros((band_bottom - band_top + 2, canvas_width + 2), dtype=numpy.uint8)
+    living_neighbours = numpy.zeros((band_bottom - band_top, canvas_width), dtype=numpy.uint8)
+    rule_index = numpy.zeros_like(living_neighbours)
+    rule_table = numpy.array(rule_table, dtype=numpy.uint8)
+    current_buffer = 0
+
+    while True:
+        start_barrier.wait()
+        if control[0] == PARALLEL_COMMAND_STOP:
+            break
+
+        for generation in range(control[1]):
+            cells = buffers[current_buffer]
+            next_cells = buffers[1 - current_buffer]
+
+            # The band with the halo rows of the neighbouring bands
+            fill_padded_cells(padded, cells, boundary_mode, band_top, band_bottom)
+
+            sum_padded_neighbours(padded, living_neighbours)
+
+            # Look up the next state of every cell in the rule table
+            numpy.multiply(padded[1:-1, 1:-1], 9, out=rule_index)
+            numpy.add(rule_index, living_neighbours, out=rule_index)
+            numpy.take(rule_table, rule_index, out=next_cells[band_top:band_bottom], mode="clip")
+
+            # Wait for every band to be written before anyone reads it as the current generation
+            step_barrier.wait()
+            current_buffer = 1 - current_buffer
+
+        band_populations[worker] = int(numpy.count_nonzero(buffers[current_buffer][band_top:band_bottom]))
+        done_barrier.wait()
+
+    del buffers
+    shared_board.close()
+
+
+def get_engine_frame(engine, crop):
+    """
+    Reads the cells inside a region of the board as one byte per cell, 1 where a cell is alive.
+    The engines that keep their cells in NumPy arrays have the region sliced out of them,
+    the others list their living cells.
+    :param engine: The simulation engine
+    :type engine: PythonEngine, NumpyEngine, SparseEngine, BitBoard, ParallelEngine or HashLife
+    :param crop: The top, left, height and width of the region, in cells
+    :type crop: tuple of ints
+    :return: frame (bytes)
+    """
+    top, left, height, width = crop
+    if isinstance(engine, (NumpyEngine, BitBoard, ParallelEngine)):
+        frame = numpy.zeros((height, width), dtype=numpy.uint8)
+        region_top = max(top, 0)
+        region_left = max(left, 0)
+        region_bottom = max(top + height, 0)
+        region_right = max(left + width, 0)
+
+        # Only the rows in the region are unpacked
+        if isinstance(engine, BitBoard):
+            region = engine.unpack(engine.words[region_top:region_bottom])[:, region_left:region_right]
+        else:
+            region = engine.cells[region_top:region_bottom, region_left:region_right]
+        frame[region_top - top:region_top - top + region.shape[0],
+              region_left - left:region_left - left + region.shape[1]] = region != 0
+        return frame.tobytes()
+
+    if isinstance(engine, HashLife):
+        cells = engine.get_cells(top + height, left + width) if top >= 0 and left >= 0 else engine.get_cells()
+    else:
+        cells = engine.to_seed()
+
+    frame = bytearray(height * width)
+    for y, x in cells:
+        y -= top
+        x -= left
+        if 0 <= y < height and 0 <= x < width:
+            frame[y * width + x] = 1
+
+    return bytes(frame)
+
+
+def get_frame_pixels(frame, crop, scale=1):
+    """
+    Scales the cells of a frame up to one byte per pixel, 1 where a cell is alive.
+    :param frame: The cells inside the region, one byte per cell, 1 where a cell is alive
+    :type frame: bytes
+    :param crop: The top, left, height and width of the region, in cells
+    :type crop: tuple of ints
+    :param scale: The width and height of a cell, in pixels
+    :type scale: int
+    :return: pixels (bytes)
+    """
+    width = crop[3]
+    if scale == 1:
+        return frame
+
+    if numpy is not None:
+        return numpy.frombuffer(frame, dtype=numpy.uint8).reshape(-1, width).repeat(scale, axis=0)\
+            .repeat(scale, axis=1).tobytes()
+
+    # Every byte is widened to scale bytes, then every row repeated scale times
+    wide_dead_cell = b"\x00" * scale
+    wide_living_cell = b"\x01" * scale
+    return b"".join(frame[start:start + width].replace(b"\x00", wide_dead_cell)
+                    .replace(b"\x01", wide_living_cell) * scale for start in range(0, len(frame), width))
+
+
+def create_png_chunk(chunk_type, data):
+    """
+    Wraps data in a PNG chunk, with its length in front and its checksum behind.
+    :param chunk_type: The four letter type of the chunk
+    :type chunk_type: bytes
+    :param data: The contents of the chunk
+    :type data: bytes
+    :return: chunk (bytes)
+    """
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", zlib.crc32(chunk_type + data))
+
+
+def encode_png(pixels, height, width):
+    """
+    Encodes a frame as a PNG image, with the colours of dead and living cells as its palette.
+    :param pixels: One byte per pixel, 1 where a cell is alive
+    :type pixels: bytes
+    :param height: The height of the image in pixels
+    :type height: int
+    :param width: The width of the image in pixels
+    :type width: int
+    :return: image (bytes)
+    """
+    # Every row starts with filter type 0, as zlib alone squeezes runs of dead cells well enough
+    rows = b"".join(b"\x00" + pixels[start:start + width] for start in range(0, len(pixels), width))
+    return b"\x89PNG\r\n\x1a\n" +\
+        create_png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 3, 0, 0, 0)) +\
+        create_png_chunk(b"PLTE", DEAD_CELL_PIXEL + LIVING_CELL_PIXEL) +\
+        create_png_chunk(b"IDAT", zlib.compress(rows, EXPORT_COMPRESSION_LEVEL)) +\
+        create_png_chunk(b"IEND", b"")
+
+
+def encode_gif_lzw(pixels):
+    """
+    Compresses pixels of two colours the way GIF images store them, with variable length LZW codes
+    starting at GIF_MINIMUM_CODE_SIZE + 1 bits, packed least significant bit first.
+    :param pixels: One byte per pixel, 0 or 1
+    :type pixels: bytes
+    :return: compressed_pixels (bytes)
+    """
+    clear_code = 1 << GIF_MINIMUM_CODE_SIZE
+    end_code = clear_code + 1
+    compressed_pixels = bytearray()
+
+    # The codes are gathered in bits until there is a whole byte of them
+    code_size = GIF_MINIMUM_CODE_SIZE + 1
+    bits = clear_code
+    bit_count = code_size
+
+    # A string of pixels is known by the code of the string before it and the pixel it ends with
+    codes = {}
+    next_code = end_code + 1
+    prefix = pixels[0] if pixels else None
+    for pixel in pixels[1:]:
+        code = codes.get(prefix << 8 | pixel)
+        if code is not None:
+            prefix = code
+            continue
+
+        bits |= prefix << bit_count
+        bit_count += code_size
+        while bit_count >= 8:
+            compressed_pixels.append(bits & 255)
+            bits >>= 8
+            bit_count -= 8
+
+        # The codes can be at most 12 bits long, after that the table starts over
+        if next_code < 4096:
+            codes[prefix << 8 | pixel] = next_code
+            if next_code == 1 << code_size:
+                code_size += 1
+            next_code += 1
+        else:
+            bits |= clear_code << bit_count
+            bit_count += code_size
+            codes.clear()
+            code_size = GIF_MINIMUM_CODE_SIZE + 1
+            next_code = end_code + 1
+
+        prefix = pixel
+
+    for code in (prefix, end_code):
+        if code is not None:
+            bits |= code << bit_count
+            bit_count += code_size
+
+    while bit_count > 0:
+        compressed_pixels.append(bits & 255)
+        bits >>= 8
+        bit_count -= 8
+
+    return bytes(compressed_pixels)
+
+
+def encode_gif_frame(pixels, height, width, delay):
+    """
+    Encodes a frame of an animated GIF, using the colours of dead and living cells in the global colour table.
+    :param pixels: One byte per pixel, 1 where a cell is alive
+    :type pixels: bytes
+    :param height: The height of the image in pixels
+    :type height: int
+    :param width: The width of the image in pixels
+    :type width: int
+    :param delay: How long the frame is shown, in hundredths of a second
+    :type delay: int
+    :return: frame (bytes)
+    """
+    compressed_pixels = encode_gif_lzw(pixels)
+
+    # The compressed pixels are split into blocks of at most 255 bytes, each with its length in front
+    blocks = b"".join(bytes((len(compressed_pixels[start:start + 255]),)) + compressed_pixels[start:start + 255]
+                      for start in range(0, len(compressed_pixels), 255))
+    return b"\x21\xf9\x04\x00" + struct.pack("<H", delay) + b"\x00\x00" +\
+        b"\x2c" + struct.pack("<HHHH", 0, 0, width, height) + b"\x00" +\
+        bytes((GIF_MINIMUM_CODE_SIZE,)) + blocks + b"\x00"
+
+
+def write_png_frame(file_path, frame, crop, scale=1):
+    """
+    Writes the cells inside a region of the board to a PNG image.
+    :param file_path: Where to write the image
+    :type file_path: str
+    :param frame: The cells inside the region, one byte per cell, 1 where a cell is alive
+    :type frame: bytes
+    :param crop: The top, left, height and width of the region, in cells
+    :type crop: tuple of ints
+    :param scale: The width and height of a cell, in pixels
+    :type scale: int
+    :return: None
+    """
+    with open(file_path, "wb") as file:
+        file.write(encode_png(get_frame_pixels(frame, crop, scale), crop[2] * scale, crop[3] * scale))
+
+
+def get_gif_frame(frame, crop, scale=1, delay=1):
+    """
+    Encodes the cells inside a region of the board as a frame of an animated GIF.
+    :param frame: The cells inside the region, one byte per cell, 1 where a cell is alive
+    :type frame: bytes
+    :param crop: The top, left, height and width of the region, in cells
+    :type crop: tuple of ints
+    :param scale: The width and height of a cell, in pixels
+    :type scale: int
+    :param delay: How long the frame is shown, in hundredths of a second
+    :type delay: int
+    :return: frame (bytes)
+    """
+    return encode_gif_frame(get_frame_pixels(frame, crop, scale), crop[2] * scale, crop[3] * scale, delay)
+
+
+class FrameExporter:
+    """
+    Writes generations as they are simulated, to an animated GIF if the path ends with .gif
+    and otherwise as numbered PNG images in the directory at the path.
+    Every frame is encoded and written before the next is taken, or with workers in a process pool
+    that holds at most two frames per worker, so memory use does not grow with the length of the run.
+    """
+    def __init__(self, path, canvas_height, canvas_width, scale=1, crop=None, framerate=DEFAULT_MAX_FRAMERATE,
+                 workers=0):
+        """
+        :param path: The .gif file or the directory of PNG images to write
+        :type path: str
+        :param canvas_height: The height of the canvas in pixels
+        :type canvas_height: int
+        :param canvas_width: The width of the canvas in pixels
+        :type canvas_width: int
+        :param scale: The width and height of a cell, in pixels
+        :type scale: int
+        :param crop: The top, left, height and width of the region to export, in cells, the whole canvas by default
+        :type crop: tuple of ints
+        :param framerate: The frames per second of an animated GIF
+        :type framerate: int
+        :param workers: The amount of processes encoding frames, 0 encodes them in this one
+        :type workers: int
+        """
+        if crop is None:
+            crop = (0, 0, canvas_height, canvas_width)
+        if scale < 1 or crop[2] * scale < 1 or crop[3] * scale < 1 or crop[2] * scale > 65535 or\
+                crop[3] * scale > 65535:
+            raise ValueError("Frames must be between 1 and 65535 pixels high and wide")
+
+        self.path = path
+        self.crop = tuple(crop)
+        self.scale = scale
+        self.delay = max(round(100 / max(framerate, 1)), 2)
+        self.is_gif = path.lower().endswith(".gif")
+        self.frames_written = 0
+        self.pending_frames = deque()
+        self.workers = workers
+        self.pool = multiprocessing.Pool(workers) if workers > 0 else None
+
+        if self.is_gif:
+            self.file = open(path, "wb")
+
+            # The logical screen with a global colour table of two colours, then the extension that loops the animation
+            self.file.write(b"GIF89a" + struct.pack("<HHBBB", crop[3] * scale, crop[2] * scale, 0x80, 0, 0) +
+                            DEAD_CELL_PIXEL + LIVING_CELL_PIXEL + b"\x21\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00")
+        else:
+            self.file = None
+            os.makedirs(path, exist_ok=True)
+
+    def export(self, engine, generation_number):
+        """
+        Writes the generation an engine is at.
+        :param engine: The simulation engine
+        :type engine: PythonEngine, NumpyEngine, SparseEngine, BitBoard, ParallelEngine or HashLife
+        :param generation_number: The number of the generation, which PNG images are named after
+        :type generation_number: int
+        :return: None
+        """
+        frame = get_engine_frame(engine, self.crop)
+        if self.is_gif:
+            arguments = (frame, self.crop, self.scale, self.delay)
+            function = get_gif_frame
+        else:
+            arguments = (os.path.join(self.path, "generation_" + str(generation_number).zfill(8) + ".png"), frame,
+                         self.crop, self.scale)
+            function = write_png_frame
+
+        if self.pool is None:
+            self.write_frame(function(*arguments))
+        else:
+            self.pending_frames.append(self.pool.apply_async(function, arguments))
+            while len(self.pending_frames) > 2 * self.workers:
+                self.write_frame(self.pending_frames.popleft().get())
+
+    def write_frame(self, frame):
+        """
+        Adds an encoded frame to the animated GIF, PNG images have already been written by then.
+        :param frame: The encoded frame, None for PNG images
+        :type frame: bytes
+        :return: None
+        """
+        if self.is_gif:
+            self.file.write(frame)
+        self.frames_written += 1
+
+    def close(self):
+        """
+        Waits for the frames still being encoded and finishes the animated GIF.
+        :return: None
+        """
+        while self.pending_frames:
+            self.write_frame(self.pending_frames.popleft().get())
+
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
+        if self.file is not None:
+            self.file.write(b"\x3b")
+            self.file.close()
+            self.file = None
+
+
+def export_generations(engine, generations, frame_exporter, stride=1, cycle_detector=None, stop_when_stable=False,
+                       first_generation=0):
+    """
+    Advances an engine by a number of generations, exporting the generation it starts at and every stride-th one.
+    Like advance_engine_until_stable it can stop early, once the cycle detector finds a period.
+    :param engine: The simulation engine
+    :type engine: PythonEngine, NumpyEngine, SparseEngine, BitBoard, ParallelEngine or HashLife
+    :param generations: The amount of generations
+    :type generations: int
+    :param frame_exporter: Where the generations are written
+    :type frame_exporter: FrameExporter
+    :param stride: Export every this many generations
+    :type stride: int
+    :param cycle_detector: Checks whether the board has become periodic, None to not check
+    :type cycle_detector: CycleDetector
+    :param stop_when_stable: Whether or not to stop once the board has become periodic
+    :type stop_when_stable: bool
+    :param first_generation: The number of the generation the engine starts at
+    :type first_generation: int
+    :return: generations_advanced (int)
+    """
+    if stride < 1:
+        raise ValueError("The export stride must be at least 1")
+
+    frame_exporter.export(engine, first_generation)
+    generations_advanced = 0
+    while generations_advanced < generations:
+        generations_to_advance = min(stride - generations_advanced % stride, generations - generations_advanced)
+        if isinstance(engine, HashLife):
+            engine.advance(generations_to_advance)
+        elif cycle_detector is not None and cycle_detector.period is None:
+            generations_to_advance = advance_engine_until_stable(engine, generations_to_advance, cycle_detector)
+        else:
+            advance_engine(engine, generations_to_advance)
+        generations_advanced += generations_to_advance
+
+        # The last generation is exported when stopping early, even if it is not on the stride
+        is_stopping = stop_when_stable and cycle_detector is not None and cycle_detector.period is not None
+        if generations_advanced % stride == 0 or is_stopping:
+            frame_exporter.export(engine, first_generation + generations_advanced)
+        if is_stopping:
+            break
+
+    return generations_advanced
+
+
+def encode_varints(numbers):
+    """
+    Encodes non-negative integers as varints, 7 bits per byte with the high bit set on all but the last byte.
+    :param numbers: The integers
+    :type numbers: iterable of ints
+    :return: encoded (bytearray)
+    """
+    encoded = bytearray()
+    for number in numbers:
+        while number >= 128:
+            encoded.append(number & 127 | 128)
+            number >>= 7
+        encoded.append(number)
+
+    return encoded
+
+
+def decode_varints(data, offset, count):
+    """
+    :param data: Varints, as encode_varints makes them
+    :type data: bytes
+    :param offset: Where in data the first varint starts
+    :type offset: int
+    :param count: The amount of varints to decode
+    :type count: int
+    :return: numbers (list of ints), offset (int) after the last varint
+    """
+    numbers = []
+    for _ in range(count):
+        number = 0
+        shift = 0
+        while True:
+            byte = data[offset]
+            offset += 1
+            number |= (byte & 127) << shift
+            if byte < 128:
+                break
+            shift += 7
+        numbers.append(number)
+
+    return numbers, offset
+
+
+def encode_cell_indices(indices):
+    """
+    Encodes cells as their amount, then the gaps between their indices y * canvas_width + x in order, as varints.
+    The cells of a generation lie close together, so most gaps take a single byte.
+    :param indices: The indices of the cells, in any order
+    :type indices: iterable of ints
+    :return: encoded (bytearray)
+    """
+    indices = sorted(indices)
+    return encode_varints([len(indices)] + [index - previous for previous, index in zip([0] + indices, indices)])
+
+
+def decode_cell_indices(data, offset):
+    """
+    :param data: Cells, as encode_cell_indices makes them
+    :type data: bytes
+    :param offset: Where in data the cells start
+    :type offset: int
+    :return: indices (list of ints) in order, offset (int) after the cells
+    """
+    (count,), offset = decode_varints(data, offset, 1)
+    gaps, offset = decode_varints(data, offset, count)
+    indices = list(itertools.accumulate(gaps))
+
+    return indices, offset
+
+
+def encode_stream_cells(cells, canvas_width):
+    """
+    Encodes cells the way encode_cell_indices does.
+    :param cells: A list of lists containing y and x coordinates
+    :type cells: list of lists
+    :param canvas_width: The width of the board
+    :type canvas_width: int
+    :return: encoded (bytearray)
+    """
+    return encode_cell_indices(y * canvas_width + x for y, x in cells)
+
+
+def decode_stream_cells(data, offset, canvas_width):
+    """
+    :param data: Cells, as encode_stream_cells makes them
+    :type data: bytes
+    :param offset: Where in data the cells start
+    :type offset: int
+    :param canvas_width: The width of the board
+    :type canvas_width: int
+    :return: cells (list of lists), offset (int) after the cells
+    """
+    indices, offset = decode_cell_indices(data, offset)
+
+    return [list(divmod(index, canvas_width)) for index in indices], offset
+
+
+def encode_stream_message(body):
+    """
+    Compresses a message for the stream and puts its length in front of it, as 4 bytes big-endian.
+    :param body: The message type, one of STREAM_KEYFRAME, STREAM_DELTA and STREAM_END, then its varints
+    :type body: bytes
+    :return: message (bytes)
+    """
+    compressed = zlib.compress(bytes(body), EXPORT_COMPRESSION_LEVEL)
+    return struct.pack(">I", len(compressed)) + compressed
+
+
+def receive_stream_messages(connection):
+    """
+    Reads the messages of a DeltaStream from a socket connected to it, until the run ends or the connection closes.
+    A keyframe is yielded as ("keyframe", generation_number, canvas_height, canvas_width, living_cells),
+    a delta as ("delta", generation_number, cells_to_be_killed, cells_to_be_revived)
+    and the end of the run as ("end", generation_number).
+    :param connection: The socket
+    :type connection: socket.socket
+    :return: messages (generator of tuples)
+    """
+    stream = connection.makefile("rb")
+    canvas_width = 0
+    while True:
+        length = stream.read(4)
+        if len(length) < 4:
+            return
+        body = zlib.decompress(stream.read(struct.unpack(">I", length)[0]))
+        message_type = body[:1]
+        if message_type == STREAM_KEYFRAME:
+            (generation_number, canvas_height, canvas_width), offset = decode_varints(body, 1, 3)
+            living_cells = decode_stream_cells(body, offset, canvas_width)[0]
+            yield "keyframe", generation_number, canvas_height, canvas_width, living_cells
+        elif message_type == STREAM_DELTA:
+            (generation_number,), offset = decode_varints(body, 1, 1)
+            cells_to_be_killed, offset = decode_stream_cells(body, offset, canvas_width)
+            cells_to_be_revived = decode_stream_cells(body, offset, canvas_width)[0]
+            yield "delta", generation_number, cells_to_be_killed, cells_to_be_revived
+        elif message_type == STREAM_END:
+            yield "end", decode_varints(body, 1, 1)[0][0]
+            return
+        else:
+            raise ValueError("Unknown stream message type: " + repr(message_type))
+
+
+class StreamClient:
+    """
+    A viewer connected to a DeltaStream, with the messages waiting to be sent to it.
+    A viewer that can not keep up has its waiting messages dropped and starts over from the next keyframe,
+    rather than holding up the simulation.
+    """
+    def __init__(self, queue_size=STREAM_QUEUE_SIZE):
+        """
+        :param queue_size: The amount of messages that can wait to be sent before they are dropped
+        :type queue_size: int
+        """
+        self.messages = queue.Queue(maxsize=queue_size)
+        self.needs_keyframe = True
+
+    def send(self, message, is_keyframe=False):
+        """
+        Queues a message without waiting. A delta is only of use after the keyframe before it,
+        so deltas are skipped while the viewer is waiting for a keyframe.
+        :param message: The message, as encode_stream_message makes it
+        :type message: bytes
+        :param is_keyframe: Whether or not the message is a keyframe
+        :type is_keyframe: bool
+        :return: None
+        """
+        if self.needs_keyframe and not is_keyframe:
+            return
+
+        try:
+            self.messages.put_nowait(message)
+            self.needs_keyframe = False
+        except queue.Full:
+            self.drop_messages()
+            self.needs_keyframe = True
+
+    def drop_messages(self):
+        """
+        Empties the queue of messages waiting to be sent.
+        :return: None
+        """
+        while True:
+            try:
+                self.messages.get_nowait()
+            except queue.Empty:
+                break
+
+
+class DeltaStreamHandler(socketserver.BaseRequestHandler):
+    """
+    Sends the messages of a DeltaStream to one viewer, from a thread of its own.
+    """
+    def handle(self):
+        """
+        Sends messages until the run ends or the viewer goes away.
+        :return: None
+        """
+        delta_stream = self.server.delta_stream
+        client = StreamClient(delta_stream.queue_size)
+        self.request.settimeout(STREAM_SEND_TIMEOUT)
+        delta_stream.add_client(client)
+        if VERBOSE:
+            print("Viewer connected: " + str(self.client_address))
+
+        try:
+            while True:
+                message = client.messages.get()
+                if message is None:
+                    break
+                self.request.sendall(message)
+        except OSError:
+            pass
+        finally:
+            delta_stream.remove_client(client)
+            if VERBOSE:
+                print("Viewer disconnected: " + str(self.client_address))
+
+
+class DeltaStreamServer(socketserver.ThreadingTCPServer):
+    """
+    The TCP server of a DeltaStream, which can listen on the port of a run that just ended.
+    Its threads do not keep the program running, DeltaStream.close waits for them instead.
+    """
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class DeltaStream:
+    """
+    Serves the generations of a run over TCP, so it can be watched from elsewhere while it runs.
+    A viewer that connects gets a keyframe holding all the living cells of the next generation, then a delta with
+    the cells that died and came alive for every generation after it, each compressed on its own.
+    Nothing is encoded while no viewer is connected, and viewers that fall behind drop messages instead of
+    slowing the simulation down.
+    """
+    def __init__(self, host, port, canvas_height, canvas_width, queue_size=STREAM_QUEUE_SIZE):
+        """
+        :param host: The address to listen on
+        :type host: str
+        :param port: The port to listen on, 0 for any free one
+        :type port: int
+        :param canvas_height: The height of the board
+        :type canvas_height: int
+        :param canvas_width: The width of the board
+        :type canvas_width: int
+        :param queue_size: The amount of messages that can wait to be sent to a viewer before they are dropped
+        :type queue_size: int
+        """
+        self.canvas_height = canvas_height
+        self.canvas_width = canvas_width
+        self.queue_size = queue_size
+        self.clients = []
+        self.generation_number = None
+        self.end = None
+        self.lock = threading.Condition()
+        self.server = DeltaStreamServer((host, port), DeltaStreamHandler)
+        self.server.delta_stream = self
+        self.address = self.server.server_address
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def add_client(self, client):
+        """
+        :param client: The viewer to start sending messages to
+        :type client: StreamClient
+        :return: None
+        """
+        with self.lock:
+            # A viewer that joins as the run ends is only told it is over
+            if self.end is not None:
+                client.messages.put_nowait(self.end)
+                client.messages.put_nowait(None)
+            else:
+                self.clients.append(client)
+
+    def remove_client(self, client):
+        """
+        :param client: The viewer to stop sending messages to
+        :type client: StreamClient
+        :return: None
+        """
+        with self.lock:
+            if client in self.clients:
+                self.clients.remove(client)
+                self.lock.notify_all()
+
+    def publish(self, engine, generation_number, cells_to_be_killed=None, cells_to_be_revived=None):
+        """
+        Sends a generation to every viewer, as a keyframe to the ones that need one and as a delta to the others.
+        :param engine: The simulation engine, the living cells of keyframes are taken from
+        :type engine: PythonEngine, NumpyEngine, SparseEngine, BitBoard, ParallelEngine or HashLife
+        :param generation_number: The number of the generation the engine is at
+        :type generation_number: int
+        :param cells_to_be_killed: The cells that died on the way to the generation, None to only send keyframes
+        :type cells_to_be_killed: list of lists
+        :param cells_to_be_revived: The cells that came alive on the way to the generation
+        :type cells_to_be_revived: list of lists
+        :return: None
+        """
+        with self.lock:
+            clients = list(self.clients)
+            self.generation_number = generation_number
+
+        # Every message is encoded once at most, whatever the amount of viewers
+        keyframe = None
+        delta = None
+        for client in clients:
+            if client.needs_keyframe or cells_to_be_killed is None:
+                if keyframe is None:
+                    living_cells = get_engine_cells(engine, self.canvas_height, self.canvas_width)
+                    keyframe = encode_stream_message(
+                        STREAM_KEYFRAME + encode_varints((generation_number, self.canvas_height, self.canvas_width)) +
+                        encode_stream_cells(living_cells, self.canvas_width))
+                client.send(keyframe, is_keyframe=True)
+            else:
+                if delta is None:
+                    delta = encode_stream_message(STREAM_DELTA + encode_varints((generation_number,)) +
+                                                  encode_stream_cells(cells_to_be_killed, self.canvas_width) +
+                                                  encode_stream_cells(cells_to_be_revived, self.canvas_width))
+                client.send(delta)
+
+    def close(self, generation_number=None):
+        """
+        Tells every viewer the run has ended at a generation, waits at most STREAM_SEND_TIMEOUT seconds for the
+        messages to be sent, then stops serving.
+        :param generation_number: The number of the last generation, the last one published by default
+        :type generation_number: int
+        :return: None
+        """
+        if generation_number is None:
+            generation_number = self.generation_number or 0
+
+        with self.lock:
+            self.end = encode_stream_message(STREAM_END + encode_varints((generation_number,)))
+            clients = list(self.clients)
+        for client in clients:
+            # A viewer that is behind does not need the rest of the run, just to know it is over
+            for message in (self.end, None):
+                try:
+                    client.messages.put_nowait(message)
+                except queue.Full:
+                    client.drop_messages()
+                    client.messages.put_nowait(message)
+
+        with self.lock:
+            self.lock.wait_for(lambda: not self.clients, STREAM_SEND_TIMEOUT)
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def stream_generations(engine, generations, delta_stream, cycle_detector=None, stop_when_stable=False,
+                       framerate=0, first_generation=0):
+    """
+    Advances an engine by a number of generations one at a time, publishing every generation to a DeltaStream.
+    Like advance_engine_until_stable it can stop early, once the cycle detector finds a period.
+    :param engine: The simulation engine
+    :type engine: PythonEngine, NumpyEngine, SparseEngine, BitBoard, ParallelEngine or HashLife
+    :param generations: The amount of generations
+    :type generations: int
+    :param delta_stream: Where the generations are published
+    :type delta_stream: DeltaStream
+    :param cycle_detector: Checks whether the board has become periodic, None to not check
+    :type cycle_detector: CycleDetector
+    :param stop_when_stable: Whether or not to stop once the board has become periodic
+    :type stop_when_stable: bool
+    :param framerate: The most generations to advance per second, 0 to advance as fast as possible
+    :type framerate: int
+    :param first_generation: The number of the generation the engine starts at
+    :type first_generation: int
+    :return: generations_advanced (int)
+    """
+    delta_stream.publish(engine, first_generation)
+    generations_advanced = 0
+    start = timer()
+    while generations_advanced < generations:
+        # HashLife does not know which cells changed, so its viewers get a keyframe every generation
+        if isinstance(engine, HashLife):
+            engine.advance(1)
+            cells_to_be_killed = cells_to_be_revived = None
+        else:
+            cells_to_be_killed, cells_to_be_revived = engine.step()[:2]
+        generations_advanced += 1
+        delta_stream.publish(engine, first_generation + generations_advanced, cells_to_be_killed,
+                             cells_to_be_revived)
+
+        if cycle_detector is not None and cycle_detector.period is None and cells_to_be_killed is not None:
+            if cycle_detector.update(cells_to_be_killed, cells_to_be_revived) and stop_when_stable:
+                break
+
+        if framerate > 0:
+            delay = start + generations_advanced / framerate - timer()
+            if delay > 0:
+                time.sleep(delay)
+
+    return generations_advanced
+
+
+def parse_arguments(arguments=None):
+    """
+    Parses the command line arguments.
+    :param arguments: The arguments to parse, defaults to sys.argv
+    :type arguments: list of str
+    :return: parsed_arguments (argparse.Namespace)
+    """
+    parser = argparse.ArgumentParser(description="Conway's Game of Life")
+    parser.add_argument("--headless", action="store_true",
+                        help="run a batch simulation in the terminal instead of opening the window")
+    parser.add_argument("--seed-file", help="the .seed or " + BINARY_SEED_EXTENSION + " file to simulate, "
+                                            "a checkpoint to resume, or an .rle, .lif or .cells pattern file to place "
+                                            "on a canvas of --canvas-height by --canvas-width, "
+                                            "a random seed is generated if left out")
+    parser.add_argument("--pattern-offset", type=int, nargs=2, metavar=("TOP", "LEFT"),
+                        help="where on the canvas the top left corner of a pattern file goes, "
+                             "the pattern is centred if left out")
+    parser.add_argument("--canvas-height", type=int, default=DEFAULT_CANVAS_HEIGHT,
+                        help="the height of a random seed")
+    parser.add_argument("--canvas-width", type=int, default=DEFAULT_CANVAS_WIDTH,
+                        help="the width of a random seed")
+    parser.add_argument("--min-seed-percent", type=int, default=DEFAULT_MIN_SEED_PERCENT,
+                        help="the minimum percentage of living cells in a random seed")
+    parser.add_argument("--max-seed-percent", type=int, default=DEFAULT_MAX_SEED_PERCENT,
+                        help="the maximum percentage of living cells in a random seed")
+    parser.add_argument("--random-seed", type=int, help="makes the random seed reproducible")
+    parser.add_argument("--save-seed", action="store_true", help="save a random seed to seeds/")
+    parser.add_argument("--generations", type=int, default=1000, help="the amount of generations to simulate")
+    parser.add_argument("--engine", default=SIMULATION_ENGINE,
+                        choices=["python", "numpy", "sparse", "bitpacked", "parallel", "hashlife"],
+                        help="the simulation engine, hashlife simulating an unbounded plane")
+    parser.add_argument("--boundary", choices=BOUNDARY_MODES,
+                        help="what lies beyond the edges, defaults to the one saved with the seed file")
+    parser.add_argument("--rule", help="the rule in B/S notation, like B36/S23 for HighLife, defaults to the one "
+                                       "saved with the seed file or " + DEFAULT_RULE)
+    parser.add_argument("--cycle-window", type=int, default=CYCLE_DETECTION_WINDOW,
+                        help="the longest period to look for when detecting that the board has become periodic, "
+                             "0 turns detection off")
+    parser.add_argument("--stop-when-stable", action="store_true",
+                        help="stop once the board has become periodic instead of skipping ahead to the last generation")
+    parser.add_argument("--output", help="write the last generation to this .seed file, to a binary one when the "
+                                         "path ends with " + BINARY_SEED_EXTENSION + ", or to a pattern file when "
+                                         "it ends with .rle, .lif or .cells")
+    parser.add_argument("--checkpoint", help="save checkpoints of the run to this file, every --checkpoint-interval "
+                                             "generations, on SIGUSR1 and at the end, to resume the run from by "
+                                             "passing it as --seed-file")
+    parser.add_argument("--checkpoint-interval", type=int, default=0,
+                        help="the generations between checkpoints, 0 to only save them on SIGUSR1 and at the end")
+    parser.add_argument("--catalog", action="store_true",
+                        help="index the seed file in " + SEED_CATALOG_PATH + " and record how it turned out")
+    parser.add_argument("--skip-known", action="store_true",
+                        help="with --catalog, do not simulate a seed again once it is known to settle, "
+                             "or to still be changing after --generations")
+    parser.add_argument("--update-catalog", nargs="?", const="seeds/", metavar="DIRECTORY",
+                        help="index the new and changed seed files in this directory, seeds/ by default, then exit")
+    parser.add_argument("--find-seeds", action="store_true",
+                        help="list the catalogued seeds that match the --find options, the longest lived first, "
+                             "then exit")
+    parser.add_argument("--find-size", type=int, nargs=2, metavar=("HEIGHT", "WIDTH"),
+                        help="only find seeds of this canvas size")
+    parser.add_argument("--find-rule", help="only find seeds of this rule")
+    parser.add_argument("--find-min-lifespan", type=int,
+                        help="only find seeds that lived at least this many generations")
+    parser.add_argument("--find-max-lifespan", type=int,
+                        help="only find seeds that settled within this many generations")
+    parser.add_argument("--find-period", type=int, help="only find seeds that settled into this period")
+    parser.add_argument("--find-limit", type=int, help="find at most this many seeds")
+    parser.add_argument("--find-duplicates", action="store_true",
+                        help="list the catalogued seed files that hold the same seed, then exit")
+    parser.add_argument("--convert-seed", nargs="+", metavar="SEED_FILE",
+                        help="convert these .seed files to binary " + BINARY_SEED_EXTENSION + " files next to them, "
+                             "then exit")
+    parser.add_argument("--export", help="write the generations to this animated .gif file, "
+                                         "or as PNG images to this directory")
+    parser.add_argument("--export-scale", type=int, default=1,
+                        help="the width and height of a cell in the exported frames, in pixels")
+    parser.add_argument("--export-stride", type=int, default=1, help="export every this many generations")
+    parser.add_argument("--export-crop", type=int, nargs=4, metavar=("TOP", "LEFT", "HEIGHT", "WIDTH"),
+                        help="only export this part of the board, in cells")
+    parser.add_argument("--export-framerate", type=int, default=DEFAULT_MAX_FRAMERATE,
+                        help="the frames per second of an exported .gif file")
+    parser.add_argument("--export-workers", type=int, default=0,
+                        help="the amount of processes encoding the exported frames, 0 encodes them in this one")
+    parser.add_argument("--stream", type=int, metavar="PORT",
+                        help="serve the generations on this TCP port while simulating, so they can be watched")
+    parser.add_argument("--stream-host", default=DEFAULT_STREAM_HOST,
+                        help="the address to serve the generations on, 0.0.0.0 for every network interface")
+    parser.add_argument("--stream-framerate", type=int, default=0,
+                        help="the most generations per second to simulate while streaming, 0 for no limit")
+
+    return parser.parse_args(arguments)
+
+
+class HeadlessSeed(namedtuple("HeadlessSeed", ("cells", "canvas_height", "canvas_width", "boundary_mode", "rule",
+                                               "binary_seed", "grid", "first_generation", "file_path"))):
+    """
+    The seed a headless run simulates, read from a file or generated.
+    :param cells: The living cells of the seed, empty for a binary seed and for a pattern placed into grid
+    :type cells: list of lists
+    :param canvas_height: The height of the canvas in pixels
+    :type canvas_height: int
+    :param canvas_width: The width of the canvas in pixels
+    :type canvas_width: int
+    :param boundary_mode: What lies beyond the edges of the grid, one of BOUNDARY_MODES
+    :type boundary_mode: str
+    :param rule: The rule in B/S notation
+    :type rule: str
+    :param binary_seed: The binary seed or checkpoint the cells are still packed in, None for other seeds
+    :type binary_seed: BinarySeed
+    :param grid: The board a pattern file was placed into, already the cells the engine steps, None for other seeds
+    :type grid: list of lists or numpy.ndarray
+    :param first_generation: The generation number of the seed, other than 0 when resuming from a checkpoint
+    :type first_generation: int
+    :param file_path: The file the seed was read from or saved to, None for a generated seed that was not saved
+    :type file_path: str or pathlib.Path
+    """
+    __slots__ = ()
+
+
+def read_headless_seed(arguments):
+    """
+    Reads the seed file of a headless run, or generates a random seed and saves it if asked to.
+    :param arguments: The parsed command line arguments
+    :type arguments: argparse.Namespace
+    :return: seed (HeadlessSeed)
+    """
+    current_seed = []
+    binary_seed = None
+    pattern_grid = None
+    first_generation = 0
+    if arguments.seed_file and get_pattern_format(arguments.seed_file) is not None:
+        canvas_height = arguments.canvas_height
+        canvas_width = arguments.canvas_width
+        boundary_mode = DEFAULT_BOUNDARY_MODE
+        top, left = arguments.pattern_offset or (None, None)
+
+        # The pattern is read straight into the cells the engine steps
+        if arguments.engine == "hashlife":
+            rule = read_pattern_file(arguments.seed_file, current_seed, canvas_height, canvas_width, top, left)
+        else:
+            if arguments.engine in ("numpy", "bitpacked", "parallel"):
+                pattern_grid = numpy.zeros((canvas_height, canvas_width), dtype=numpy.uint8)
+            else:
+                pattern_grid = [[0] * canvas_width for _ in range(canvas_height)]
+            rule = place_pattern(pattern_grid, arguments.seed_file, top, left)
+        rule = rule or DEFAULT_RULE
+    elif arguments.seed_file and (is_binary_seed_file(arguments.seed_file) or
+                                  is_checkpoint_file(arguments.seed_file)):
+        # The cells are only unpacked once it is known which engine they go to
+        if is_checkpoint_file(arguments.seed_file):
+            binary_seed, first_generation = read_checkpoint_file(arguments.seed_file)
+        else:
+            binary_seed = BinarySeed(arguments.seed_file)
+        canvas_height = binary_seed.canvas_height
+        canvas_width = binary_seed.canvas_width
+        boundary_mode = binary_seed.boundary_mode
+        rule = binary_seed.rule
+    elif arguments.seed_file:
+        canvas_height, canvas_width, boundary_mode, rule = read_seed_file(arguments.seed_file, current_seed)
+    else:
+        canvas_height = arguments.canvas_height
+        canvas_width = arguments.canvas_width
+        boundary_mode = DEFAULT_BOUNDARY_MODE
+        rule = DEFAULT_RULE
+        random.seed(arguments.random_seed)
+        generate_random_seed(canvas_height, canvas_width, arguments.min_seed_percent, arguments.max_seed_percent,
+                             current_seed)
+    if arguments.boundary:
+        boundary_mode = arguments.boundary
+    if arguments.rule:
+        rule = format_rule(compile_rule(arguments.rule))
+
+    seed_file_path = arguments.seed_file
+    if arguments.save_seed and not arguments.seed_file:
+        seed_file_path = save_seed_to_file(current_seed, canvas_height, canvas_width, boundary_mode, rule)
+        print("Seed saved to: " + str(seed_file_path))
+
+    return HeadlessSeed(current_seed, canvas_height, canvas_width, boundary_mode, rule, binary_seed, pattern_grid,
+                        first_generation, seed_file_path)
+
+
+def create_headless_engine(arguments, seed):
+    """
+    Creates the engine of a headless run, HashLife being one of the choices there.
+    :param arguments: The parsed command line arguments
+    :type arguments: argparse.Namespace
+    :param seed: The seed to simulate
+    :type seed: HeadlessSeed
+    :return: engine (PythonEngine, NumpyEngine, SparseEngine, BitBoard, ParallelEngine or HashLife)
+    """
+    binary_seed = seed.binary_seed
+    if arguments.engine == "hashlife":
+        return HashLife(binary_seed.to_seed() if binary_seed is not None else seed.cells, rule=seed.rule)
+
+    if binary_seed is not None:
+        # The engines that step NumPy arrays take the cells unpacked straight from the file
+        if arguments.engine in ("numpy", "bitpacked", "parallel"):
+            grid = binary_seed.get_cells()
+        else:
+            grid = binary_seed.to_grid()
+    elif seed.grid is not None:
+        grid = seed.grid
+    else:
+        grid = []
+        apply_seed(grid, seed.cells, seed.canvas_height, seed.canvas_width)
+    return create_engine(grid, arguments.engine, seed.boundary_mode, seed.rule)
+
+
+def create_headless_cycle_detector(arguments, seed):
+    """
+    Creates the cycle detector of a headless run, unless detection is turned off or HashLife is used,
+    which has no edges for the board to settle against.
+    :param arguments: The parsed command line arguments
+    :type arguments: argparse.Namespace
+    :param seed: The seed to simulate
+    :type seed: HeadlessSeed
+    :return: cycle_detector (CycleDetector or None)
+    """
+    if arguments.cycle_window <= 0 or arguments.engine == "hashlife":
+        return None
+
+    seed_indices = None
+    if seed.binary_seed is not None:
+        seed_indices = seed.binary_seed.get_indices()
+    elif seed.grid is not None:
+        seed_indices = get_grid_indices(seed.grid)
+    return CycleDetector(seed.canvas_width, seed.cells, arguments.cycle_window, seed.first_generation, seed_indices)
+
+
+def advance_headless(engine, arguments, cycle_detector=None, first_generation=0, checkpointer=None):
+    """
+    Advances the engine of a headless run by the requested generations. Once the board is found to be periodic,
+    it is skipped ahead to the last generation, or left where it became periodic with --stop-when-stable.
+    :param engine: The simulation engine
+    :type engine: PythonEngine, NumpyEngine, SparseEngine, BitBoard, ParallelEngine or HashLife
+    :param arguments: The parsed command line arguments
+    :type arguments: argparse.Namespace
+    :param cycle_detector: The cycle detector following the engine
+    :type cycle_detector: CycleDetector
+    :param first_generation: The number of the generation the engine starts at
+    :type first_generation: int
+    :param checkpointer: Saves checkpoints on the way, None to not save any
+    :type checkpointer: Checkpointer
+    :return: generations_advanced (int), generation_reached (int)
+    """
+    if checkpointer is not None:
+        generations_advanced = advance_engine_with_checkpoints(engine, arguments.generations, checkpointer,
+                                                               first_generation, cycle_detector)
+    elif cycle_detector is not None:
+        generations_advanced = advance_engine_until_stable(engine, arguments.generations, cycle_detector)
+    else:
+        advance_engine(engine, arguments.generations)
+        generations_advanced = arguments.generations
+
+    if cycle_detector is None:
+        return generations_advanced, first_generation + generations_advanced
+    if cycle_detector.period is None or arguments.stop_when_stable:
+        return generations_advanced, cycle_detector.generation
+
+    # A periodic board only needs to be advanced by what is left of the last period
+    generations_left = (arguments.generations - generations_advanced) % cycle_detector.period
+    advance_engine(engine, generations_left)
+
+    return generations_advanced + generations_left, first_generation + arguments.generations
+
+
+def checkpoint_headless(engine, arguments, seed, cycle_detector=None):
+    """
+    Advances the engine of a headless run by the requested generations like advance_headless, saving checkpoints
+    every --checkpoint-interval generations, whenever the process is sent SIGUSR1 and once the run has ended.
+    :param engine: The simulation engine
+    :type engine: PythonEngine, NumpyEngine, SparseEngine, BitBoard, ParallelEngine or HashLife
+    :param arguments: The parsed command line arguments
+    :type arguments: argparse.Namespace
+    :param seed: The seed being simulated
+    :type seed: HeadlessSeed
+    :param cycle_detector: The cycle detector following the engine
+    :type cycle_detector: CycleDetector
+    :return: generations_advanced (int), generation_reached (int)
+    """
+    checkpointer = Checkpointer(arguments.checkpoint, seed.canvas_height, seed.canvas_width, seed.boundary_mode,
+                                seed.rule, arguments.checkpoint_interval)
+
+    # Not every platform has SIGUSR1, those only save checkpoints every interval
+    previous_handler = None
+    if hasattr(signal, "SIGUSR1"):
+        previous_handler = signal.signal(signal.SIGUSR1, checkpointer.request)
+    try:
+        generations_advanced, generation_reached = advance_headless(engine, arguments, cycle_detector,
+                                                                    seed.first_generation, checkpointer)
+    finally:
+        if previous_handler is not None:
+            signal.signal(signal.SIGUSR1, previous_handler)
+
+    # The run can be carried on from where it ended
+    if checkpointer.generation_saved != generation_reached:
+        checkpointer.save(engine, generation_reached)
+
+    return generations_advanced, generation_reached
+
+
+def export_headless(engine, arguments, seed, cycle_detector=None):
+    """
+    Advances the engine of a headless run by the requested generations like advance_headless, exporting the
+    generations on the way. Every exported generation has to be simulated, so a periodic board is not skipped ahead.
+    :param engine: The simulation engine
+    :type engine: PythonEngine, NumpyEngine, SparseEngine, BitBoard, ParallelEngine or HashLife
+    :param arguments: The parsed command line arguments
+    :type arguments: argparse.Namespace
+    :param seed: The seed being simulated
+    :type seed: HeadlessSeed
+    :param cycle_detector: The cycle detector following the engine
+    :type cycle_detector: CycleDetector
+    :return: generations_advanced (int), generation_reached (int), frames_written (int)
+    """
+    frame_exporter = FrameExporter(arguments.export, seed.canvas_height, seed.canvas_width, arguments.export_scale,
+                                   arguments.export_crop, arguments.export_framerate, arguments.export_workers)
+    try:
+        generations_advanced = export_generations(engine, arguments.generations, frame_exporter,
+                                                  arguments.export_stride, cycle_detector, arguments.stop_when_stable,
+                                                  seed.first_generation)
+    finally:
+        frame_exporter.close()
+
+    return generations_advanced, seed.first_generation + generations_advanced, frame_exporter.frames_written
+
+
+def stream_headless(engine, arguments, seed, cycle_detector=None):
+    """
+    Advances the engine of a headless run by the requested generations like advance_headless, streaming the
+    generations to the viewers on the way. Every streamed generation has to be simulated, so a periodic board is not
+    skipped ahead.
+    :param engine: The simulation engine
+    :type engine: PythonEngine, NumpyEngine, SparseEngine, BitBoard, ParallelEngine or HashLife
+    :param arguments: The parsed command line arguments
+    :type arguments: argparse.Namespace
+    :param seed: The seed being simulated
+    :type seed: HeadlessSeed
+    :param cycle_detector: The cycle detector following the engine
+    :type cycle_detector: CycleDetector
+    :return: generations_advanced (int), generation_reached (int)
+    """
+    delta_stream = DeltaStream(arguments.stream_host, arguments.stream, seed.canvas_height, seed.canvas_width)
+    print("Streaming on " + str(delta_stream.address[0]) + ":" + str(delta_stream.address[1]))
+    try:
+        generations_advanced = stream_generations(engine, arguments.generations, delta_stream, cycle_detector,
+                                                  arguments.stop_when_stable, arguments.stream_framerate,
+                                                  seed.first_generation)
+    finally:
+        delta_stream.close()
+
+    return generations_advanced, seed.first_generation + generations_advanced
+
+
+def print_headless_results(seed, generations_advanced, generation_reached, elapsed, population, cycle_detector=None):
+    """
+    Prints the throughput, what the board settled into and the final population of a headless run.
+    :param seed: The seed that was simulated
+    :type seed: HeadlessSeed
+    :param generations_advanced: The amount of generations simulated
+    :type generations_advanced: int
+    :param generation_reached: The generation number of the last generation
+    :type generation_reached: int
+    :param elapsed: The time the simulation took in seconds
+    :type elapsed: float
+    :param population: The amount of living cells in the last generation
+    :type population: int
+    :param cycle_detector: The cycle detector that followed the simulation
+    :type cycle_detector: CycleDetector
+    :return: None
+    """
+    print("Time: " + str(round(elapsed, 3)) + " s")
+    print("Generations per second: " + str(round(generations_advanced / elapsed, 1)))
+    print("Cells per second: " + str(round(generations_advanced * seed.canvas_height * seed.canvas_width / elapsed)))
+    if cycle_detector is not None:
+        print(describe_stability(cycle_detector))
+    print("Final generation: " + str(generation_reached))
+    print("Final population: " + str(population))
+
+
+def open_headless_catalog(arguments, seed):
+    """
+    Indexes the seed file of a headless run in the seed catalog when --catalog asks for it. Only seed files are
+    catalogued, and a seed run with another boundary mode or rule than its file has is another seed.
+    :param arguments: The parsed command line arguments
+    :type arguments: argparse.Namespace
+    :param seed: The seed to simulate
+    :type seed: HeadlessSeed
+    :return: catalog (SeedCatalog or None), content_hash (str or None)
+    """
+    if not arguments.catalog:
+        return None, None
+
+    # HashLife ignores the boundary mode and does not look for a period, so what it finds is not the seed's outcome
+    if arguments.engine == "hashlife":
+        print("Runs using the hashlife engine are not catalogued")
+        return None, None
+
+    if seed.file_path is None or pathlib.Path(seed.file_path).suffix not in SEED_EXTENSIONS or\
+            seed.first_generation or arguments.boundary or arguments.rule:
+        return None, None
+
+    catalog = SeedCatalog()
+    return catalog, catalog.index_file(seed.file_path)
+
+
+def is_outcome_known(outcome, generations):
+    """
+    :param outcome: The catalogued outcome of a seed, None if it has not been simulated yet
+    :type outcome: sqlite3.Row
+    :param generations: The amount of generations the seed is about to be simulated for
+    :type generations: int
+    :return: Whether or not simulating the seed again would not find out anything new (bool)
+    """
+    return outcome is not None and (outcome["settled"] or outcome["lifespan"] >= generations)
+
+
+def record_headless_outcome(catalog, content_hash, generation_reached, population, cycle_detector=None):
+    """
+    Records in the seed catalog how the seed of a headless run turned out.
+    :param catalog: The seed catalog
+    :type catalog: SeedCatalog
+    :param content_hash: The hash of the seed's cells, as SeedCatalog.index_file gives it
+    :type content_hash: str
+    :param generation_reached: The generation number of the last generation
+    :type generation_reached: int
+    :param population: The amount of living cells in the last generation
+    :type population: int
+    :param cycle_detector: The cycle detector that followed the simulation
+    :type cycle_detector: CycleDetector
+    :return: None
+    """
+    if cycle_detector is not None and cycle_detector.period is not None:
+        catalog.record_outcome(content_hash, cycle_detector.stable_generation, True, population, cycle_detector.period)
+    else:
+        catalog.record_outcome(content_hash, generation_reached, False, population)
+    print("Outcome recorded in: " + SEED_CATALOG_PATH)
+
+
+def write_headless_output(file_path, final_cells, seed):
+    """
+    Writes the last generation of a headless run in the format the extension of the file asks for,
+    a binary seed, a pattern or a text seed.
+    :param file_path: The path of the file
+    :type file_path: str
+    :param final_cells: The living cells of the last generation
+    :type final_cells: list of lists
+    :param seed: The seed that was simulated, for the canvas size, boundary mode and rule
+    :type seed: HeadlessSeed
+    :return: None
+    """
+    if file_path.endswith(BINARY_SEED_EXTENSION):
+        write_binary_seed_file(file_path, final_cells, seed.canvas_height, seed.canvas_width, seed.boundary_mode,
+                               seed.rule)
+    elif get_pattern_format(file_path) is not None:
+        final_grid = []
+        apply_seed(final_grid, final_cells, seed.canvas_height, seed.canvas_width)
+        write_pattern_file(file_path, final_grid, seed.rule)
+    else:
+        write_seed_file(file_path, final_cells, seed.canvas_height, seed.canvas_width, seed.boundary_mode, seed.rule)
+
+
+def run_headless(arguments):
+    """
+    Simulates a seed for a number of generations without any graphical user interface,
+    then prints the throughput and the final population.
+    :param arguments: The parsed command line arguments
+    :type arguments: argparse.Namespace
+    :return: None
+    """
+    if arguments.stream is not None and arguments.export:
+        raise ValueError("A run can not be streamed and exported at the same time")
+    if arguments.checkpoint and (arguments.stream is not None or arguments.export):
+        raise ValueError("A run can not be checkpointed while it is streamed or exported")
+
+    seed = read_headless_seed(arguments)
+    catalog, content_hash = open_headless_catalog(arguments, seed)
+    if catalog is not None and arguments.skip_known and is_outcome_known(catalog.get_outcome(content_hash),
+                                                                         arguments.generations):
+        print("Already known: " + describe_catalogued_seed(catalog.find_by_hash(content_hash)))
+        catalog.close()
+        if seed.binary_seed is not None:
+            seed.binary_seed.close()
+        return
+
+    print("Simulating " + str(arguments.generations) + " generations of a " + str(seed.canvas_height) + "x" +
+          str(seed.canvas_width) + " seed using the " + arguments.engine + " engine, the " + seed.boundary_mode +
+          " boundary and the " + seed.rule + " rule")
+    if seed.first_generation:
+        print("Resuming from generation " + str(seed.first_generation))
+
+    engine = create_headless_engine(arguments, seed)
+    try:
+        cycle_detector = create_headless_cycle_detector(arguments, seed)
+        if seed.binary_seed is not None:
+            seed.binary_seed.close()
+
+        start = timer()
+        if arguments.export:
+            # The frames still being encoded count towards the time taken
+            generations_advanced, generation_reached, frames_exported = export_headless(engine, arguments, seed,
+                                                                                        cycle_detector)
+        elif arguments.stream is not None:
+            generations_advanced, generation_reached = stream_headless(engine, arguments, seed, cycle_detector)
+        elif arguments.checkpoint:
+            generations_advanced, generation_reached = checkpoint_headless(engine, arguments, seed, cycle_detector)
+        else:
+            generations_advanced, generation_reached = advance_headless(engine, arguments, cycle_detector,
+                                                                        seed.first_generation)
+        end = timer()
+        population = engine.population
+        final_cells = get_engine_cells(engine, seed.canvas_height, seed.canvas_width) if arguments.output else []
+    finally:
+        close_engine(engine)
+
+    print_headless_results(seed, generations_advanced, generation_reached, max(end - start, 1e-9), population,
+                           cycle_detector)
+    if arguments.output:
+        write_headless_output(arguments.output, final_cells, seed)
+        print("Last generation written to: " + arguments.output)
+
+    if arguments.export:
+        print(str(frames_exported) + " frames exported to: " + arguments.export)
+
+    if catalog is not None:
+        try:
+            record_headless_outcome(catalog, content_hash, generation_reached, population, cycle_detector)
+        finally:
+            catalog.close()
+
+
+def run_catalog(arguments):
+    """
+    Updates the seed catalog, or lists the seeds in it that match the --find options or that are duplicates.
+    :param arguments: The parsed command line arguments
+    :type arguments: argparse.Namespace
+    :return: None
+    """
+    catalog = SeedCatalog()
+    try:
+        if arguments.update_catalog:
+            files_indexed, files_removed = catalog.update(arguments.update_catalog)
+            print("Seed files indexed: " + str(files_indexed) + ", removed: " + str(files_removed))
+
+        if arguments.find_seeds:
+            canvas_height, canvas_width = arguments.find_size or (None, None)
+            seeds = catalog.find(canvas_height, canvas_width, arguments.find_rule, arguments.find_min_lifespan,
+                                 arguments.find_max_lifespan, period=arguments.find_period,
+                                 limit=arguments.find_limit)
+            for row in seeds:
+                print(describe_catalogued_seed(row))
+            print("Seeds found: " + str(len(seeds)))
+
+        if arguments.find_duplicates:
+            for paths in catalog.find_duplicates():
+                print(" = ".join(paths))
+    finally:
+        catalog.close()
+
+
 if __name__ == '__main__':
-    main()
+    parsed_arguments = parse_arguments()
+    if parsed_arguments.convert_seed:
+        for seed_file_path in parsed_arguments.convert_seed:
+            print("Converted to: " + str(convert_seed_file(seed_file_path)))
+    elif parsed_arguments.update_catalog or parsed_arguments.find_seeds or parsed_arguments.find_duplicates:
+        run_catalog(parsed_arguments)
+    elif parsed_arguments.headless:
+        run_headless(parsed_arguments)
+    else:
+        main()
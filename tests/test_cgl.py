@@ -0,0 +1,1332 @@
+"""
+Tests for the simulation engines.
+Run them with python -m pytest from the root of the repository.
+"""
+import pathlib
+import random
+import socket
+import struct
+import sys
+import threading
+import time
+import tracemalloc
+import zlib
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+import CGL  # noqa: E402
+
+ENGINE_NAMES = ("python", "numpy", "sparse", "bitpacked", "parallel")
+NUMPY_ENGINE_NAMES = ("numpy", "bitpacked", "parallel")
+RULES = ("B3/S23", "B36/S23", "B2/S", "B0/S8", "B1357/S1357")
+GLIDER = [[0, 1], [1, 2], [2, 0], [2, 1], [2, 2]]
+BLOCK = [[1, 1], [1, 2], [2, 1], [2, 2]]
+BLINKER = [[2, 1], [2, 2], [2, 3]]
+
+
+def create_random_grid(canvas_height, canvas_width, density=0.35, random_seed=1):
+    """
+    :return: grid (list of lists) with about density of its cells alive
+    """
+    generator = random.Random(random_seed)
+    return [[int(generator.random() < density) for x in range(canvas_width)] for y in range(canvas_height)]
+
+
+def create_grid(cells, canvas_height, canvas_width):
+    """
+    :return: grid (list of lists) with the cells alive
+    """
+    grid = []
+    CGL.apply_seed(grid, cells, canvas_height, canvas_width)
+    return grid
+
+
+def get_cells(cells):
+    """
+    :return: cells (list of tuples) in order, whatever the engine returned them as
+    """
+    return sorted(tuple(cell) for cell in cells)
+
+
+def get_grid_cells(grid):
+    """
+    :return: cells (list of tuples) alive in the grid, in order
+    """
+    return [(y, x) for y, row in enumerate(grid) for x, cell in enumerate(row) if cell]
+
+
+def step_grid(grid, generations, boundary_mode=CGL.DEFAULT_BOUNDARY_MODE, rule=CGL.DEFAULT_RULE):
+    """
+    Steps a copy of the grid with the python engine.
+    :return: grid (list of lists)
+    """
+    grid = [row[:] for row in grid]
+    engine = CGL.create_engine(grid, "python", boundary_mode, rule)
+    for generation in range(generations):
+        CGL.create_next_generation(grid, *engine.step()[:2])
+    return grid
+
+
+@pytest.mark.parametrize("engine_name", ENGINE_NAMES[1:])
+@pytest.mark.parametrize("boundary_mode", CGL.BOUNDARY_MODES)
+@pytest.mark.parametrize("rule", RULES)
+def test_engine_matches_python_engine(engine_name, boundary_mode, rule):
+    if engine_name in NUMPY_ENGINE_NAMES and CGL.numpy is None:
+        pytest.skip("The " + engine_name + " engine requires NumPy")
+    if engine_name == "sparse" and rule.startswith("B0"):
+        pytest.skip("The sparse engine does not support B0 rules")
+
+    grid = create_random_grid(20, 24)
+    reference = CGL.create_engine([row[:] for row in grid], "python", boundary_mode, rule)
+    engine = CGL.create_engine([row[:] for row in grid], engine_name, boundary_mode, rule)
+    try:
+        for generation in range(20):
+            expected_killed, expected_revived, expected_population = reference.step()
+            killed, revived, population = engine.step()
+            assert get_cells(killed) == get_cells(expected_killed)
+            assert get_cells(revived) == get_cells(expected_revived)
+            assert population == expected_population
+    finally:
+        CGL.close_engine(engine)
+
+
+def test_sparse_engine_only_evaluates_cells_near_changes():
+    # A blinker and a block, the block never changing after the first generation
+    grid = create_grid([[5, 4], [5, 5], [5, 6], [20, 20], [20, 21], [21, 20], [21, 21]], 30, 30)
+    engine = CGL.create_engine(grid, "sparse")
+
+    engine.step()
+    assert engine.active_cells == 15 + 16
+    for generation in range(4):
+        engine.step()
+        assert engine.active_cells == 21
+
+
+def test_numpy_engine_step_buffered_reports_the_changes():
+    if CGL.numpy is None:
+        pytest.skip("The numpy engine requires NumPy")
+
+    grid = create_random_grid(20, 24)
+    reference = CGL.create_engine([row[:] for row in grid], "numpy")
+    engine = CGL.create_engine([row[:] for row in grid], "numpy")
+    for generation in range(20):
+        expected_killed, expected_revived, expected_population = reference.step()
+        cells_killed, cells_revived, population, killed_indices, revived_indices =\
+            engine.step_buffered(report_indices=True)
+        assert (cells_killed, cells_revived, population) ==\
+            (len(expected_killed), len(expected_revived), expected_population)
+        assert [divmod(int(index), 24) for index in killed_indices] == get_cells(expected_killed)
+        assert [divmod(int(index), 24) for index in revived_indices] == get_cells(expected_revived)
+    assert (engine.cells == reference.cells).all()
+
+
+def test_numpy_engine_step_buffered_allocates_next_to_nothing():
+    if CGL.numpy is None:
+        pytest.skip("The numpy engine requires NumPy")
+
+    # NumPy may still allocate a small buffer of its own, but nothing that grows with the board
+    engine = CGL.create_engine(create_random_grid(800, 800), "numpy")
+    engine.step_buffered()
+    tracemalloc.start()
+    try:
+        for generation in range(10):
+            engine.step_buffered()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert peak < 800 * 800 // 4
+
+
+def test_bit_board_steps_without_unpacking():
+    if CGL.numpy is None:
+        pytest.skip("The bitpacked engine requires NumPy")
+
+    # Wider than a word, so that cells cross from one word to the next
+    grid = create_random_grid(20, 150)
+    reference = CGL.create_engine([row[:] for row in grid], "python")
+    bit_board = CGL.BitBoard.from_grid(grid)
+    for generation in range(20):
+        expected_killed, expected_revived, expected_population = reference.step()
+        assert bit_board.step_buffered() == (len(expected_killed), len(expected_revived), expected_population)
+    assert bit_board.population == sum(map(sum, reference.grid))
+    assert get_cells(bit_board.to_seed()) == get_grid_cells(reference.grid)
+
+
+def test_bit_board_seed_round_trip():
+    if CGL.numpy is None:
+        pytest.skip("The bitpacked engine requires NumPy")
+
+    seed = [list(cell) for cell in get_grid_cells(create_random_grid(9, 130))]
+    bit_board = CGL.BitBoard(9, 130, seed)
+    assert bit_board.to_seed() == seed
+    assert bit_board.population == len(seed)
+
+
+@pytest.mark.parametrize("workers", (2, 3, 7))
+@pytest.mark.parametrize("boundary_mode", ("torus", "klein"))
+def test_parallel_engine_bands_match_python_engine(workers, boundary_mode):
+    if CGL.numpy is None:
+        pytest.skip("The parallel engine requires NumPy")
+
+    # The halo rows of the first and last bands come from the other end of the board
+    grid = create_random_grid(23, 17)
+    reference = CGL.create_engine([row[:] for row in grid], "python", boundary_mode)
+    engine = CGL.ParallelEngine(grid, boundary_mode, workers=workers)
+    try:
+        for generation in range(10):
+            reference.step()
+        engine.advance(10)
+        assert get_grid_cells(engine.cells) == get_grid_cells(reference.grid)
+        assert engine.population == sum(map(sum, reference.grid))
+    finally:
+        engine.close()
+
+
+def test_hashlife_moves_glider():
+    hashlife = CGL.HashLife(GLIDER)
+    hashlife.advance(4 * 1000)
+    assert get_cells(hashlife.get_cells()) == [(y + 1000, x + 1000) for y, x in get_cells(GLIDER)]
+    assert hashlife.population == 5
+
+
+@pytest.mark.parametrize("rule", ("B3/S23", "B36/S23"))
+def test_hashlife_matches_python_engine_away_from_the_edges(rule):
+    # Living cells spread at most one cell per generation, so the edges are never reached
+    generations = 30
+    soup = create_random_grid(12, 12, 0.4)
+    cells = [[y + generations + 1, x + generations + 1] for y, x in get_grid_cells(soup)]
+    canvas_size = 12 + 2 * (generations + 1)
+
+    hashlife = CGL.HashLife(cells, rule=rule)
+    hashlife.advance(generations)
+
+    expected_grid = step_grid(create_grid(cells, canvas_size, canvas_size), generations, "dead", rule)
+    assert get_cells(hashlife.get_cells(canvas_size, canvas_size)) == get_grid_cells(expected_grid)
+
+
+@pytest.mark.parametrize("canvas_size", (10, 50))
+@pytest.mark.parametrize("boundary_mode", CGL.BOUNDARY_MODES)
+def test_jump_matches_stepping(canvas_size, boundary_mode):
+    # The glider reaches the edges of the small canvas, where HashLife can not be used
+    offset = canvas_size // 2 - 2
+    grid = create_grid([[y + offset, x + offset] for y, x in GLIDER], canvas_size, canvas_size)
+    expected_grid = step_grid(grid, 20, boundary_mode)
+
+    assert CGL.is_jump_within_canvas(grid, 20) == (canvas_size == 50)
+    assert CGL.jump_to_generation(grid, 20, boundary_mode) == 20
+    assert grid == expected_grid
+
+
+def test_jump_steps_rules_where_cells_come_alive_without_neighbours():
+    # Far from the edges, but HashLife can not simulate a plane that comes alive everywhere at once
+    grid = create_grid([[y + 20, x + 20] for y, x in GLIDER], 45, 45)
+    expected_grid = step_grid(grid, 5, "torus", "B0/S8")
+
+    assert CGL.jump_to_generation(grid, 5, "torus", "B0/S8") == 5
+    assert grid == expected_grid
+
+
+def test_jump_can_be_cancelled():
+    grid = create_grid(GLIDER, 10, 10)
+    expected_grid = step_grid(grid, 7)
+    calls = []
+
+    assert CGL.jump_to_generation(grid, 1000000, is_cancelled=lambda: calls.append(None) or len(calls) > 7) == 7
+    assert grid == expected_grid
+
+
+def write_seed(file_path, grid):
+    """
+    Writes the grid to a .seed file.
+    :return: None
+    """
+    CGL.write_seed_file(str(file_path), [list(cell) for cell in get_grid_cells(grid)], len(grid), len(grid[0]))
+
+
+def read_seed(file_path):
+    """
+    :return: grid (list of lists) of a .seed file
+    """
+    seed = []
+    canvas_height, canvas_width = CGL.read_seed_file(str(file_path), seed)[:2]
+    return create_grid(seed, canvas_height, canvas_width)
+
+
+@pytest.mark.parametrize("engine_name", ENGINE_NAMES)
+def test_headless_run_writes_the_last_generation(engine_name, tmp_path):
+    if engine_name in NUMPY_ENGINE_NAMES and CGL.numpy is None:
+        pytest.skip("The " + engine_name + " engine requires NumPy")
+
+    grid = create_random_grid(16, 70)
+    write_seed(tmp_path / "start.seed", grid)
+    CGL.run_headless(CGL.parse_arguments(["--headless", "--seed-file", str(tmp_path / "start.seed"),
+                                          "--generations", "15", "--engine", engine_name,
+                                          "--output", str(tmp_path / "end.seed")]))
+    assert read_seed(tmp_path / "end.seed") == step_grid(grid, 15)
+
+
+def test_headless_hashlife_run_keeps_the_cells_on_the_canvas(tmp_path):
+    # The glider flies off the bottom right corner of the canvas, where HashLife has no edge to stop it
+    write_seed(tmp_path / "start.seed", create_grid(GLIDER, 10, 10))
+    CGL.run_headless(CGL.parse_arguments(["--headless", "--seed-file", str(tmp_path / "start.seed"),
+                                          "--generations", "16", "--engine", "hashlife",
+                                          "--output", str(tmp_path / "end.seed")]))
+    assert get_grid_cells(read_seed(tmp_path / "end.seed")) == [(y + 4, x + 4) for y, x in get_cells(GLIDER)]
+
+    CGL.run_headless(CGL.parse_arguments(["--headless", "--seed-file", str(tmp_path / "start.seed"),
+                                          "--generations", "40", "--engine", "hashlife",
+                                          "--output", str(tmp_path / "gone.seed")]))
+    assert get_grid_cells(read_seed(tmp_path / "gone.seed")) == []
+
+
+@pytest.mark.parametrize("boundary_mode", CGL.BOUNDARY_MODES)
+def test_headless_run_uses_the_boundary_of_the_seed_file(tmp_path, boundary_mode):
+    # The glider crosses the bottom right corner within the run
+    grid = create_grid([[y + 5, x + 5] for y, x in GLIDER], 9, 11)
+    CGL.write_seed_file(str(tmp_path / "start.seed"), [[y + 5, x + 5] for y, x in GLIDER], 9, 11, boundary_mode)
+    CGL.run_headless(CGL.parse_arguments(["--headless", "--seed-file", str(tmp_path / "start.seed"),
+                                          "--generations", "12",
+                                          "--engine", "numpy" if CGL.numpy is not None else "python",
+                                          "--output", str(tmp_path / "end.seed")]))
+
+    seed = []
+    assert CGL.read_seed_file(str(tmp_path / "end.seed"), seed)[:3] == (9, 11, boundary_mode)
+    assert create_grid(seed, 9, 11) == step_grid(grid, 12, boundary_mode)
+
+
+def test_seed_file_without_a_boundary_loads_as_legacy(tmp_path):
+    (tmp_path / "old.seed").write_text("4,5\n1,2\n")
+    seed = []
+    assert CGL.read_seed_file(str(tmp_path / "old.seed"), seed)[:3] == (4, 5, "legacy")
+
+
+def test_headless_random_seed_is_reproducible(tmp_path, capsys):
+    arguments = ["--headless", "--canvas-height", "12", "--canvas-width", "15", "--random-seed", "3",
+                 "--generations", "5", "--engine", "python"]
+    CGL.run_headless(CGL.parse_arguments(arguments + ["--output", str(tmp_path / "first.seed")]))
+    CGL.run_headless(CGL.parse_arguments(arguments + ["--output", str(tmp_path / "second.seed")]))
+    assert read_seed(tmp_path / "first.seed") == read_seed(tmp_path / "second.seed")
+    assert "Simulating 5 generations of a 12x15 seed using the python engine" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("engine_name", ("bitpacked", "parallel"))
+def test_step_buffered_reports_the_changed_indices(engine_name):
+    if CGL.numpy is None:
+        pytest.skip("The " + engine_name + " engine requires NumPy")
+
+    grid = create_random_grid(20, 70)
+    reference = CGL.create_engine([row[:] for row in grid], "python", "torus")
+    engine = CGL.create_engine([row[:] for row in grid], engine_name, "torus")
+    try:
+        for generation in range(10):
+            expected_killed, expected_revived, expected_population = reference.step()
+            cells_killed, cells_revived, population, killed_indices, revived_indices =\
+                engine.step_buffered(report_indices=True)
+            assert (cells_killed, cells_revived, population) ==\
+                (len(expected_killed), len(expected_revived), expected_population)
+            assert [divmod(int(index), 70) for index in killed_indices] == get_cells(expected_killed)
+            assert [divmod(int(index), 70) for index in revived_indices] == get_cells(expected_revived)
+
+            # And the same counts without them
+            expected_killed, expected_revived, expected_population = reference.step()
+            assert engine.step_buffered() == (len(expected_killed), len(expected_revived), expected_population)
+    finally:
+        CGL.close_engine(engine)
+
+
+def follow_until_stable(engine_name, seed, canvas_size, boundary_mode, generations, window=CGL.CYCLE_DETECTION_WINDOW):
+    """
+    Steps a seed with an engine and a cycle detector until the detector finds a period.
+    :return: cycle_detector (CGL.CycleDetector)
+    """
+    engine = CGL.create_engine(create_grid(seed, canvas_size, canvas_size), engine_name, boundary_mode)
+    cycle_detector = CGL.CycleDetector(canvas_size, seed, window)
+    try:
+        CGL.advance_engine_until_stable(engine, generations, cycle_detector)
+    finally:
+        CGL.close_engine(engine)
+    return cycle_detector
+
+
+@pytest.mark.parametrize("engine_name", ENGINE_NAMES)
+@pytest.mark.parametrize("seed, boundary_mode, period, description", (
+    (BLOCK, "dead", 1, "Still since generation 0"),
+    (BLINKER, "dead", 2, "Period 2 since generation 0"),
+    # A glider on a torus comes back to where it started after crossing the board once, 4 generations per cell
+    (GLIDER, "torus", 4 * 8, "Period 32 since generation 0")))
+def test_cycle_detector_finds_the_period(engine_name, seed, boundary_mode, period, description):
+    if engine_name in NUMPY_ENGINE_NAMES and CGL.numpy is None:
+        pytest.skip("The " + engine_name + " engine requires NumPy")
+
+    cycle_detector = follow_until_stable(engine_name, seed, 8, boundary_mode, 100)
+    assert (cycle_detector.period, cycle_detector.stable_generation) == (period, 0)
+    assert cycle_detector.generation == period
+    assert CGL.describe_stability(cycle_detector) == description
+
+
+def test_cycle_detector_finds_where_the_board_settles():
+    # A glider that crashes into a block in a dead corner and leaves a still life behind
+    cycle_detector = follow_until_stable("python", GLIDER + [[5, 6], [5, 7], [6, 6], [6, 7]], 8, "dead", 100)
+    assert cycle_detector.period == 1
+    assert cycle_detector.stable_generation > 0
+    assert CGL.describe_stability(cycle_detector) == "Still since generation " + str(cycle_detector.stable_generation)
+
+
+def test_cycle_detector_only_finds_periods_within_the_window():
+    cycle_detector = follow_until_stable("python", GLIDER, 8, "torus", 100, window=31)
+    assert cycle_detector.period is None and cycle_detector.generation == 100
+    assert CGL.describe_stability(cycle_detector) == "No cycle found within 31 generations"
+
+
+def test_cycle_detector_keeps_the_generation_number():
+    cycle_detector = CGL.CycleDetector(8, BLINKER, generation=10)
+    cycle_detector.update([[2, 1], [2, 3]], [[1, 2], [3, 2]])
+    assert cycle_detector.update([[1, 2], [3, 2]], [[2, 1], [2, 3]]) == 2
+    assert (cycle_detector.generation, cycle_detector.stable_generation) == (12, 10)
+
+
+@pytest.mark.parametrize("stop_when_stable", (False, True))
+def test_headless_run_skips_ahead_once_periodic(tmp_path, capsys, stop_when_stable):
+    grid = create_grid([[y + 3, x + 3] for y, x in BLINKER], 10, 10)
+    write_seed(tmp_path / "start.seed", grid)
+    CGL.run_headless(CGL.parse_arguments(["--headless", "--seed-file", str(tmp_path / "start.seed"),
+                                          "--generations", "1001", "--engine", "python",
+                                          "--output", str(tmp_path / "end.seed")] +
+                                         ["--stop-when-stable"] * stop_when_stable))
+    output = capsys.readouterr().out
+    assert "Period 2 since generation 0" in output
+    assert "Generations per second" in output
+    if stop_when_stable:
+        assert "Final generation: 2\n" in output
+        assert read_seed(tmp_path / "end.seed") == grid
+    else:
+        assert "Final generation: 1001\n" in output
+        assert read_seed(tmp_path / "end.seed") == step_grid(grid, 1)
+
+
+@pytest.mark.parametrize("boundary_mode", CGL.BOUNDARY_MODES)
+def test_worker_jump_puts_the_board_in_one_frame(boundary_mode):
+    worker = CGL.SimulationWorker(create_grid(GLIDER, 10, 10), boundary_mode, CGL.DEFAULT_RULE, 5, 40)
+    CGL.close_engine(worker.jump())
+
+    generation_number, cells_to_be_killed, living_cells = worker.frames.get_nowait()[:3]
+    assert generation_number == 45 and cells_to_be_killed is None
+    assert get_cells(living_cells) == get_grid_cells(step_grid(create_grid(GLIDER, 10, 10), 40, boundary_mode))
+
+
+def test_worker_stops_during_a_long_jump():
+    # The glider reaches the edges, so the jump is stepped a generation at a time
+    worker = CGL.SimulationWorker(create_grid(GLIDER, 10, 10), "torus", CGL.DEFAULT_RULE, 0, 10 ** 9)
+    worker.start()
+    time.sleep(0.1)
+
+    start = time.monotonic()
+    worker.stop(wait=True)
+    assert time.monotonic() - start < 5
+    assert not worker.is_alive()
+    assert worker.frames.empty()
+    assert 0 < worker.generation_number < 10 ** 9
+
+
+def test_worker_in_turbo_mode_hands_over_the_whole_board_and_the_period():
+    worker = CGL.SimulationWorker(create_grid(BLINKER, 8, 8), "torus")
+    worker.turbo.set()
+    worker.start()
+    try:
+        stability = None
+        while stability is None:
+            cells_to_be_killed, living_cells, cells_alive, stability = worker.frames.get(timeout=5)[1:]
+            assert cells_to_be_killed is None and len(living_cells) == cells_alive == 3
+    finally:
+        worker.stop()
+
+    assert stability == "Period 2 since generation 0"
+
+
+@pytest.mark.parametrize("rule", ("B3/S23", "B36/S23", "B3678/S34678", "B/S", "B012345678/S012345678"))
+def test_rule_round_trip(rule):
+    assert CGL.format_rule(CGL.compile_rule(rule)) == rule
+
+
+def test_compile_rule():
+    rule_table = CGL.compile_rule("s23/b3")
+    assert rule_table == CGL.compile_rule("B3/S23")
+    assert [living_neighbours for living_neighbours in range(9) if rule_table[living_neighbours]] == [3]
+    assert [living_neighbours for living_neighbours in range(9) if rule_table[9 + living_neighbours]] == [2, 3]
+    assert CGL.format_rule(CGL.compile_rule(" B63 / S32 ")) == "B36/S23"
+
+
+@pytest.mark.parametrize("rule", ("", "B3", "B3/S23/S1", "B3/B23", "S23/S3", "B39/S23", "B3/Sx", "3/23", "Life"))
+def test_compile_rule_rejects_bad_rules(rule):
+    with pytest.raises(ValueError):
+        CGL.compile_rule(rule)
+
+
+def test_headless_run_uses_the_rule(tmp_path):
+    grid = create_random_grid(12, 12)
+    write_seed(tmp_path / "start.seed", grid)
+    CGL.run_headless(CGL.parse_arguments(["--headless", "--seed-file", str(tmp_path / "start.seed"),
+                                          "--generations", "8", "--engine", "python", "--rule", "b36/s23",
+                                          "--output", str(tmp_path / "end.seed")]))
+
+    seed = []
+    assert CGL.read_seed_file(str(tmp_path / "end.seed"), seed)[3] == "B36/S23"
+    assert create_grid(seed, 12, 12) == step_grid(grid, 8, CGL.DEFAULT_BOUNDARY_MODE, "B36/S23")
+
+
+class CanvasWithoutDisplay:
+    """
+    Stands in for the canvas of a Viewport, which needs a display, keeping the size it is given.
+    """
+    def __init__(self):
+        self.interpreter = CGL.tkinter.Tcl()
+        self.tk = self.interpreter.tk
+        self.height = None
+        self.width = None
+
+    def _root(self):
+        return self.interpreter
+
+    def config(self, height, width):
+        self.height = height
+        self.width = width
+
+
+def create_viewport(canvas_height, canvas_width):
+    """
+    :return: viewport (CGL.Viewport) showing a board of the given size
+    """
+    if CGL.tkinter is None:
+        pytest.skip("The viewport requires tkinter")
+    return CGL.Viewport(CanvasWithoutDisplay(), canvas_height, canvas_width)
+
+
+@pytest.mark.parametrize("canvas_size, zoom, view_size", ((100, 2, 400), (600, 0, 600), (3000, -3, 375)))
+def test_viewport_zooms_a_new_board_to_fit(canvas_size, zoom, view_size):
+    viewport = create_viewport(canvas_size, canvas_size)
+    assert viewport.zoom == zoom
+    assert (viewport.canvas.height, viewport.canvas.width) == (view_size, view_size)
+    assert (viewport.rows, viewport.columns) == (canvas_size, canvas_size)
+
+
+def test_viewport_zooms_around_a_pixel():
+    viewport = create_viewport(100, 100)
+    assert viewport.get_cell(192, 192) == [48, 48]
+
+    viewport.set_zoom(4, 192, 192)
+    assert viewport.get_view() == (4, 36, 36, 38, 50)
+    assert viewport.get_cell(192, 192) == [48, 48]
+    assert viewport.get_pixel(48, 48) == (192, 192)
+    assert CGL.get_cell_rectangle(48, 48, viewport) == (192, 192, 207, 207)
+
+    # Zooming out stops once the whole board fits
+    viewport.set_zoom(CGL.MIN_ZOOM)
+    assert viewport.get_view() == (0, 0, 0, 100, 100)
+
+
+def test_viewport_pans_by_whole_cells_and_stays_on_the_board():
+    viewport = create_viewport(100, 100)
+    viewport.set_zoom(4, 0, 0)
+    changed = viewport.changed.get()
+
+    assert viewport.pan(40, 7) == (32, 0)
+    assert (viewport.top, viewport.left) == (2, 0)
+    assert viewport.changed.get() == changed + 1
+
+    viewport.pan(10 ** 6, -10 ** 6)
+    assert (viewport.top, viewport.left) == (100 - viewport.rows, 0)
+
+
+def test_zoomed_out_viewport_starts_on_a_whole_pixel():
+    viewport = create_viewport(3000, 3000)
+    viewport.set_zoom(-2)
+    viewport.pan(3, 5)
+    assert viewport.top % 4 == viewport.left % 4 == 0
+
+
+def test_viewport_only_finds_cells_in_view():
+    viewport = create_viewport(100, 100)
+    assert viewport.get_cell(-1, 0) is None
+    assert viewport.get_cell(0, 400) is None
+    assert viewport.get_cell(399, 399) == [99, 99]
+
+
+def test_zoomed_out_pixels_are_alive_if_any_of_their_cells_are():
+    grid = create_grid([[1, 5], [3, 0]], 4, 7)
+    assert CGL.get_visible_row(grid, 1, 0, 7) == bytes(grid[1])
+    assert CGL.get_visible_row(grid, 0, 0, 7, 2) == b"\x00\x00\x01\x00"
+    assert CGL.get_visible_row(grid, 2, 0, 7, 2) == b"\x01\x00\x00\x00"
+    assert CGL.get_visible_row(grid, 0, 0, 7, 4) == b"\x01\x01"
+    assert CGL.get_visible_row(grid, 0, 6, 7, 4) == b"\x00"
+
+
+@pytest.mark.parametrize("y1, x1, y2, x2", ((3, 3, 3, 3), (0, 0, 0, 7), (5, 2, 0, 2), (1, 1, 6, 6), (0, 0, 2, 9),
+                                            (9, 4, -3, 0), (4, 7, 6, -5)))
+def test_line_cells_join_the_ends_without_gaps(y1, x1, y2, x2):
+    cells = CGL.get_line_cells(y1, x1, y2, x2)
+    assert cells[0] == [y1, x1] and cells[-1] == [y2, x2]
+    assert len(cells) == max(abs(y2 - y1), abs(x2 - x1)) + 1
+    for (y, x), (next_y, next_x) in zip(cells, cells[1:]):
+        assert max(abs(next_y - y), abs(next_x - x)) == 1
+
+    # The line keeps as close to the straight one as whole cells can
+    if y1 != y2 or x1 != x2:
+        for y, x in cells:
+            assert abs((y - y1) * (x2 - x1) - (x - x1) * (y2 - y1)) / max(abs(y2 - y1), abs(x2 - x1)) <= 0.5
+
+
+def test_line_cells_follow_the_longer_direction():
+    assert CGL.get_line_cells(0, 0, 3, 6) == [[0, 0], [0, 1], [1, 2], [1, 3], [2, 4], [2, 5], [3, 6]]
+    assert CGL.get_line_cells(6, 0, 0, 3) == [[6, 0], [5, 0], [4, 1], [3, 1], [2, 2], [1, 2], [0, 3]]
+
+
+@pytest.mark.parametrize("brush_size", CGL.BRUSH_SIZES)
+def test_brush_covers_a_square_centred_on_the_cell(brush_size):
+    cells = CGL.get_brush_cells(CGL.get_brush_name(brush_size), 20, 30)
+    assert len(cells) == brush_size ** 2
+    assert sorted(map(tuple, cells)) == [(y, x) for y in range(20 - brush_size // 2, 20 + brush_size // 2 + 1)
+                                         for x in range(30 - brush_size // 2, 30 + brush_size // 2 + 1)]
+
+
+def test_stamp_places_its_pattern_centred_on_the_cell():
+    assert get_cells(CGL.get_brush_cells("Glider", 10, 10)) == [(y + 9, x + 9) for y, x in get_cells(GLIDER)]
+    for stamp_name, stamp in CGL.STAMPS.items():
+        top = 50 - max(y for y, x in stamp) // 2
+        left = 50 - max(x for y, x in stamp) // 2
+        assert get_cells(CGL.get_brush_cells(stamp_name, 50, 50)) == get_cells((top + y, left + x) for y, x in stamp)
+
+
+def test_viewport_finds_board_positions_off_the_canvas():
+    viewport = create_viewport(100, 100)
+    viewport.set_zoom(4, 0, 0)
+    assert viewport.get_board_position(40, 8) == (2, 0)
+    assert viewport.get_board_position(-16, -17) == (-1, -2)
+    assert viewport.get_cell(-16, -17) is None
+
+
+def get_recency(history, y, x):
+    """
+    :return: recency (int) of a cell, HISTORY_LIMIT when it has just changed down to 0 once it is that old
+    """
+    return history.get_recency_table()[history.changed_at[y * history.canvas_width + x]]
+
+
+def test_cell_history_starts_with_the_living_cells_just_born():
+    history = CGL.CellHistory(create_grid(GLIDER, 6, 6), 300)
+    for y in range(6):
+        for x in range(6):
+            assert get_recency(history, y, x) == (CGL.HISTORY_LIMIT if [y, x] in GLIDER else 0)
+
+
+def test_cell_history_counts_the_generations_since_a_cell_changed():
+    grid = create_grid(BLINKER, 6, 6)
+    history = CGL.CellHistory(grid)
+    engine = CGL.create_engine(grid, "python")
+    for generation in range(1, 11):
+        history.update(generation, *engine.step()[:2])
+
+    # The ends of the blinker change every generation, its middle never does
+    assert get_recency(history, 2, 1) == get_recency(history, 1, 2) == CGL.HISTORY_LIMIT
+    assert get_recency(history, 2, 2) == CGL.HISTORY_LIMIT - 10
+    assert get_recency(history, 4, 4) == 0
+
+    history.update(15, [[2, 2]], [])
+    assert get_recency(history, 2, 2) == CGL.HISTORY_LIMIT
+    assert get_recency(history, 2, 1) == CGL.HISTORY_LIMIT - 5
+
+
+def test_cell_history_does_not_wrap_around():
+    history = CGL.CellHistory(create_grid([[1, 1]], 3, 3))
+    history.update(1, [[1, 1]], [])
+    for generation in range(2, 1000):
+        history.update(generation, [], [])
+        if generation == CGL.HISTORY_LIMIT + 1 or generation % 256 == 1:
+            assert get_recency(history, 1, 1) == 0
+    assert get_recency(history, 0, 0) == 0
+
+    # A refresh leaves cells that changed recently as they were
+    history.update(1000, [], [[0, 0]])
+    history.refresh(1000 + CGL.HISTORY_REFRESH_INTERVAL)
+    assert get_recency(history, 0, 0) == CGL.HISTORY_LIMIT - CGL.HISTORY_REFRESH_INTERVAL
+
+
+def test_grid_changes_are_found_from_the_living_cells():
+    grid = create_grid(BLINKER, 6, 6)
+    previous_rows = [bytes(row) for row in grid]
+    killed, revived = CGL.create_engine(grid, "python").step()[:2]
+    CGL.create_next_generation(grid, killed, revived)
+    assert [get_cells(cells) for cells in CGL.get_grid_changes(previous_rows, grid)] ==\
+        [get_cells(killed), get_cells(revived)]
+
+
+def test_unknown_render_mode():
+    with pytest.raises(ValueError):
+        CGL.create_render_palette("rainbow")
+
+
+def decode_png(image):
+    """
+    Reads back a palette PNG image as written by the exporter.
+    :return: height (int), width (int), palette (bytes), pixels (bytes) one palette index per pixel
+    """
+    assert image[:8] == b"\x89PNG\r\n\x1a\n"
+    chunks = {}
+    position = 8
+    while position < len(image):
+        length = int.from_bytes(image[position:position + 4], "big")
+        chunk_type = image[position + 4:position + 8]
+        data = image[position + 8:position + 8 + length]
+        assert int.from_bytes(image[position + 8 + length:position + 12 + length], "big") ==\
+            zlib.crc32(chunk_type + data)
+        chunks[chunk_type] = chunks.get(chunk_type, b"") + data
+        position += 12 + length
+
+    width, height, bit_depth, colour_type = struct.unpack(">IIBB", chunks[b"IHDR"][:10])
+    assert (bit_depth, colour_type) == (8, 3) and b"IEND" in chunks
+    rows = zlib.decompress(chunks[b"IDAT"])
+    assert all(rows[y * (width + 1)] == 0 for y in range(height))
+    pixels = b"".join(rows[y * (width + 1) + 1:(y + 1) * (width + 1)] for y in range(height))
+    return height, width, chunks[b"PLTE"], pixels
+
+
+def decode_gif_lzw(compressed_pixels, minimum_code_size):
+    """
+    Decompresses the variable length LZW codes of a GIF image.
+    :return: pixels (bytes)
+    """
+    clear_code = 1 << minimum_code_size
+    bits = int.from_bytes(compressed_pixels, "little")
+    position = 0
+    code_size = minimum_code_size + 1
+    table = []
+    previous = None
+    pixels = bytearray()
+    while position + code_size <= len(compressed_pixels) * 8:
+        code = bits >> position & (1 << code_size) - 1
+        position += code_size
+        if code == clear_code:
+            table = [bytes((pixel,)) for pixel in range(clear_code)] + [None, None]
+            code_size = minimum_code_size + 1
+            previous = None
+            continue
+        if code == clear_code + 1:
+            break
+
+        entry = table[code] if code < len(table) else previous + previous[:1]
+        if previous is not None and len(table) < 4096:
+            table.append(previous + entry[:1])
+        if len(table) == 1 << code_size and code_size < 12:
+            code_size += 1
+        pixels += entry
+        previous = entry
+
+    return bytes(pixels)
+
+
+def decode_gif(image):
+    """
+    Reads back an animated GIF as written by the exporter.
+    :return: height (int), width (int), palette (bytes), frames (list of tuples) of delay and pixels
+    """
+    assert image[:6] == b"GIF89a" and image[-1:] == b"\x3b"
+    width, height, flags = struct.unpack("<HHB", image[6:11])
+    palette = image[13:13 + 3 * 2 ** ((flags & 7) + 1)]
+    position = 13 + len(palette)
+    frames = []
+    delay = None
+    while image[position] != 0x3b:
+        if image[position] == 0x21:
+            if image[position + 1] == 0xf9:
+                delay = struct.unpack("<H", image[position + 4:position + 6])[0]
+            position += 2
+            while image[position]:
+                position += image[position] + 1
+            position += 1
+            continue
+
+        assert image[position] == 0x2c
+        assert struct.unpack("<HHHH", image[position + 1:position + 9]) == (0, 0, width, height)
+        minimum_code_size = image[position + 10]
+        position += 11
+        compressed_pixels = bytearray()
+        while image[position]:
+            compressed_pixels += image[position + 1:position + 1 + image[position]]
+            position += image[position] + 1
+        position += 1
+        frames.append((delay, decode_gif_lzw(compressed_pixels, minimum_code_size)))
+
+    return height, width, palette, frames
+
+
+def get_expected_pixels(grid, crop, scale):
+    """
+    :return: pixels (bytes) of the region of the grid, scale by scale pixels per cell, 1 where a cell is alive
+    """
+    top, left, height, width = crop
+    rows = []
+    for y in range(top, top + height):
+        row = bytes(int(0 <= y < len(grid) and 0 <= x < len(grid[0]) and grid[y][x] == 1) for x in
+                    range(left, left + width))
+        rows.append(b"".join(bytes((cell,)) * scale for cell in row) * scale)
+    return b"".join(rows)
+
+
+@pytest.mark.parametrize("engine_name", ENGINE_NAMES + ("hashlife",))
+@pytest.mark.parametrize("crop", (None, (3, 2, 10, 12), (-2, -3, 8, 30)))
+def test_png_export_matches_the_board(engine_name, crop, tmp_path):
+    if engine_name in NUMPY_ENGINE_NAMES and CGL.numpy is None:
+        pytest.skip("The " + engine_name + " engine requires NumPy")
+
+    grid = create_random_grid(16, 20)
+    write_seed(tmp_path / "start.seed", grid)
+    CGL.run_headless(CGL.parse_arguments(["--headless", "--seed-file", str(tmp_path / "start.seed"),
+                                          "--generations", "5", "--engine", engine_name, "--cycle-window", "0",
+                                          "--export", str(tmp_path / "frames"), "--export-stride", "2",
+                                          "--export-scale", "3"] +
+                                         (["--export-crop"] + [str(number) for number in crop] if crop else [])))
+
+    crop = crop or (0, 0, 16, 20)
+    assert sorted(path.name for path in (tmp_path / "frames").iterdir()) ==\
+        ["generation_0000000" + str(generation) + ".png" for generation in (0, 2, 4)]
+    for generation in (0, 2, 4):
+        height, width, palette, pixels = decode_png((tmp_path / "frames" / ("generation_0000000" + str(generation) +
+                                                                            ".png")).read_bytes())
+        assert (height, width) == (crop[2] * 3, crop[3] * 3)
+        assert palette == CGL.DEAD_CELL_PIXEL + CGL.LIVING_CELL_PIXEL
+        if engine_name != "hashlife":
+            assert pixels == get_expected_pixels(step_grid(grid, generation), crop, 3)
+
+
+@pytest.mark.parametrize("engine_name", ENGINE_NAMES)
+def test_gif_export_matches_the_board(engine_name, tmp_path):
+    if engine_name in NUMPY_ENGINE_NAMES and CGL.numpy is None:
+        pytest.skip("The " + engine_name + " engine requires NumPy")
+
+    # Stops once the blinker is found to be periodic, exporting that generation as well
+    grid = create_grid(BLINKER + [[10, 10], [10, 11], [11, 10], [11, 11]], 14, 14)
+    write_seed(tmp_path / "start.seed", grid)
+    CGL.run_headless(CGL.parse_arguments(["--headless", "--seed-file", str(tmp_path / "start.seed"),
+                                          "--generations", "100", "--engine", engine_name, "--stop-when-stable",
+                                          "--export", str(tmp_path / "life.gif"), "--export-stride", "5",
+                                          "--export-scale", "2", "--export-framerate", "20"]))
+
+    height, width, palette, frames = decode_gif((tmp_path / "life.gif").read_bytes())
+    assert (height, width) == (28, 28)
+    assert palette == CGL.DEAD_CELL_PIXEL + CGL.LIVING_CELL_PIXEL
+    assert [delay for delay, pixels in frames] == [5, 5]
+    for generation, (delay, pixels) in zip((0, 2), frames):
+        assert pixels == get_expected_pixels(step_grid(grid, generation), (0, 0, 14, 14), 2)
+
+
+@pytest.mark.parametrize("pixels", (b"", b"\x01", b"\x00\x01" * 3000, bytes(random.Random(1).getrandbits(1)
+                                                                             for pixel in range(50000))))
+def test_gif_lzw_round_trip(pixels):
+    assert decode_gif_lzw(CGL.encode_gif_lzw(pixels), CGL.GIF_MINIMUM_CODE_SIZE) == pixels
+
+
+def receive_stream(connection, messages):
+    """
+    Collects the messages of a DeltaStream in a background thread.
+    :return: thread (threading.Thread)
+    """
+    thread = threading.Thread(target=lambda: messages.extend(CGL.receive_stream_messages(connection)), daemon=True)
+    thread.start()
+    return thread
+
+
+def wait_for_clients(delta_stream, clients):
+    """
+    Waits until the delta stream has accepted an amount of viewers.
+    :return: None
+    """
+    deadline = time.time() + 5
+    while len(delta_stream.clients) < clients:
+        assert time.time() < deadline, "The viewer was not accepted"
+        time.sleep(0.01)
+
+
+def replay_stream(messages):
+    """
+    Rebuilds the last generation a viewer was sent, checking the messages came in order.
+    :return: generation_number (int), cells (list of tuples)
+    """
+    message_type, generation_number, canvas_height, canvas_width, living_cells = messages[0]
+    assert message_type == "keyframe"
+    cells = set(get_cells(living_cells))
+    for message_type, delta_generation_number, cells_to_be_killed, cells_to_be_revived in messages[1:-1]:
+        assert message_type == "delta"
+        assert delta_generation_number == generation_number + 1
+        generation_number = delta_generation_number
+        cells.difference_update(get_cells(cells_to_be_killed))
+        cells.update(get_cells(cells_to_be_revived))
+    assert messages[-1] == ("end", generation_number)
+    return generation_number, sorted(cells)
+
+
+def test_delta_stream_to_localhost_viewers():
+    grid = create_random_grid(30, 40, 0.3)
+    engine = CGL.create_engine(grid, "python")
+    delta_stream = CGL.DeltaStream("127.0.0.1", 0, 30, 40)
+    connections = []
+    try:
+        # One viewer watches from the start, another joins once the run is under way
+        connections.append(socket.create_connection(delta_stream.address))
+        first_messages = []
+        first_thread = receive_stream(connections[0], first_messages)
+        wait_for_clients(delta_stream, 1)
+
+        run = threading.Thread(target=CGL.stream_generations, args=(engine, 80, delta_stream),
+                               kwargs={"framerate": 200})
+        run.start()
+        time.sleep(0.1)
+        connections.append(socket.create_connection(delta_stream.address))
+        second_messages = []
+        second_thread = receive_stream(connections[1], second_messages)
+        wait_for_clients(delta_stream, 2)
+        run.join()
+        delta_stream.close(80)
+        first_thread.join(5)
+        second_thread.join(5)
+    finally:
+        for connection in connections:
+            connection.close()
+
+    assert first_messages[0][1] == 0
+    assert second_messages[0][1] > 0
+    final_cells = get_cells(engine.to_seed())
+    assert replay_stream(first_messages) == (80, final_cells)
+    assert replay_stream(second_messages) == (80, final_cells)
+
+
+def test_delta_stream_starts_at_the_generation_given():
+    engine = CGL.create_engine(create_grid(GLIDER, 10, 10), "python")
+    delta_stream = CGL.DeltaStream("127.0.0.1", 0, 10, 10)
+    connection = socket.create_connection(delta_stream.address)
+    try:
+        messages = []
+        thread = receive_stream(connection, messages)
+        wait_for_clients(delta_stream, 1)
+        assert CGL.stream_generations(engine, 3, delta_stream, first_generation=40) == 3
+        delta_stream.close()
+        thread.join(5)
+    finally:
+        connection.close()
+
+    assert messages[0][:4] == ("keyframe", 40, 10, 10)
+    assert replay_stream(messages) == (43, get_cells(engine.to_seed()))
+
+
+def test_late_viewer_is_told_the_run_has_ended():
+    delta_stream = CGL.DeltaStream("127.0.0.1", 0, 10, 10)
+    delta_stream.close(25)
+
+    client = CGL.StreamClient()
+    delta_stream.add_client(client)
+    assert client.messages.get_nowait() == CGL.encode_stream_message(CGL.STREAM_END + CGL.encode_varints((25,)))
+    assert client.messages.get_nowait() is None
+    assert not delta_stream.clients
+
+
+def test_headless_run_can_not_be_streamed_and_exported(tmp_path):
+    with pytest.raises(ValueError):
+        CGL.run_headless(CGL.parse_arguments(["--headless", "--stream", "0", "--export", str(tmp_path / "run.gif")]))
+    assert not (tmp_path / "run.gif").exists()
+
+
+@pytest.mark.parametrize("density", (0.01, 0.5))
+def test_binary_seed_round_trip(tmp_path, density):
+    grid = create_random_grid(30, 50, density)
+    seed = [list(cell) for cell in get_grid_cells(grid)]
+    file_path = tmp_path / ("seed" + CGL.BINARY_SEED_EXTENSION)
+    CGL.write_binary_seed_file(file_path, seed, 30, 50, "torus", "B36/S23")
+
+    assert CGL.is_binary_seed_file(file_path)
+    with CGL.BinarySeed(file_path) as binary_seed:
+        assert (binary_seed.canvas_height, binary_seed.canvas_width) == (30, 50)
+        assert (binary_seed.boundary_mode, binary_seed.rule) == ("torus", "B36/S23")
+        assert get_cells(binary_seed.to_seed()) == get_cells(seed)
+        assert binary_seed.to_grid() == grid
+        assert list(binary_seed.get_indices()) == [y * 50 + x for y, x in get_cells(seed)]
+
+
+def test_convert_seed_file(tmp_path):
+    seed = [list(cell) for cell in get_grid_cells(create_random_grid(12, 16))]
+    file_path = tmp_path / "seed.seed"
+    CGL.write_seed_file(file_path, seed, 12, 16, "klein", "B3/S23")
+
+    binary_file_path = CGL.convert_seed_file(file_path)
+    text_seed = []
+    binary_seed = []
+    assert CGL.read_seed_file(file_path, text_seed) == CGL.read_seed_file(binary_file_path, binary_seed)
+    assert get_cells(text_seed) == get_cells(binary_seed)
+
+
+def test_binary_seed_loads_into_the_seed_grid(tmp_path):
+    grid = create_random_grid(12, 16)
+    file_path = tmp_path / ("seed" + CGL.BINARY_SEED_EXTENSION)
+    CGL.write_binary_seed_file(file_path, [list(cell) for cell in get_grid_cells(grid)], 12, 16)
+
+    seed = [[0, 0]]
+    seed_grid = []
+    assert CGL.read_seed_file(file_path, seed, seed_grid)[:2] == (12, 16)
+    assert seed == [] and seed_grid == grid
+
+    # A text seed empties the seed grid, so it is seeded from again
+    CGL.write_seed_file(tmp_path / "seed.seed", [[1, 1]], 4, 4)
+    CGL.read_seed_file(tmp_path / "seed.seed", seed, seed_grid)
+    assert seed == [[1, 1]] and seed_grid == []
+
+
+@pytest.mark.parametrize("engine_name", ENGINE_NAMES + ("hashlife",))
+def test_headless_run_reads_and_writes_binary_seeds(engine_name, tmp_path):
+    if engine_name in NUMPY_ENGINE_NAMES and CGL.numpy is None:
+        pytest.skip("The " + engine_name + " engine requires NumPy")
+
+    grid = create_grid([[y + 20, x + 20] for y, x in GLIDER], 60, 60)
+    CGL.write_binary_seed_file(tmp_path / ("start" + CGL.BINARY_SEED_EXTENSION),
+                               [list(cell) for cell in get_grid_cells(grid)], 60, 60)
+    CGL.run_headless(CGL.parse_arguments(["--headless", "--seed-file",
+                                          str(tmp_path / ("start" + CGL.BINARY_SEED_EXTENSION)),
+                                          "--generations", "12", "--engine", engine_name,
+                                          "--output", str(tmp_path / ("end" + CGL.BINARY_SEED_EXTENSION))]))
+
+    with CGL.BinarySeed(tmp_path / ("end" + CGL.BINARY_SEED_EXTENSION)) as binary_seed:
+        assert binary_seed.to_grid() == step_grid(grid, 12)
+
+
+def test_cycle_detector_hashes_seed_indices_like_the_seed(tmp_path):
+    seed = [list(cell) for cell in get_grid_cells(create_random_grid(12, 16))]
+    file_path = tmp_path / ("seed" + CGL.BINARY_SEED_EXTENSION)
+    CGL.write_binary_seed_file(file_path, seed, 12, 16)
+
+    with CGL.BinarySeed(file_path) as binary_seed:
+        cycle_detector = CGL.CycleDetector(16, seed_indices=binary_seed.get_indices())
+    assert cycle_detector.hash == CGL.CycleDetector(16, seed).hash
+
+
+@pytest.mark.parametrize("extension", sorted(CGL.PATTERN_FORMATS))
+def test_pattern_round_trip(tmp_path, extension):
+    grid = create_random_grid(17, 23)
+    file_path = tmp_path / ("pattern" + extension)
+    CGL.write_pattern_file(file_path, grid, "B36/S23")
+
+    seed = []
+    rule = CGL.read_pattern_file(file_path, seed, 17, 23, 0, 0)
+    assert get_cells(seed) == get_grid_cells(grid)
+    if CGL.get_pattern_format(file_path) == "rle":
+        assert rule == "B36/S23"
+
+
+def test_pattern_runs_split_across_chunks(tmp_path, monkeypatch):
+    grid = create_random_grid(17, 23)
+    file_path = tmp_path / "pattern.rle"
+    CGL.write_pattern_file(file_path, grid)
+
+    monkeypatch.setattr(CGL, "PATTERN_CHUNK_SIZE", 7)
+    seed = []
+    CGL.read_pattern_file(file_path, seed, 17, 23, 0, 0)
+    assert get_cells(seed) == get_grid_cells(grid)
+
+
+@pytest.mark.parametrize("file_name, text", (
+    ("glider.rle", "#N Glider\nx = 3, y = 3, rule = B3/S23\nbo$2bo$3o!\n"),
+    ("glider.lif", "#Life 1.06\n0 -1\n1 0\n-1 1\n0 1\n1 1\n"),
+    ("glider.cells", "!Name: Glider\n.O.\n..O\nOOO\n")))
+def test_pattern_is_centred_on_the_canvas(tmp_path, file_name, text):
+    (tmp_path / file_name).write_text(text)
+
+    seed = []
+    CGL.read_pattern_file(tmp_path / file_name, seed, 9, 9)
+    assert get_cells(seed) == [(3, 4), (4, 5), (5, 3), (5, 4), (5, 5)]
+
+
+def test_pattern_is_cut_off_at_the_edges_of_the_canvas(tmp_path):
+    (tmp_path / "glider.rle").write_text("x = 3, y = 3\nbo$2bo$3o!\n")
+
+    seed = []
+    assert CGL.read_pattern_file(tmp_path / "glider.rle", seed, 9, 9, -1, 7) is None
+    assert get_cells(seed) == [(1, 7), (1, 8)]
+
+    grid = create_grid([], 9, 9)
+    CGL.place_pattern(grid, tmp_path / "glider.rle", -1, 7)
+    assert get_grid_cells(grid) == [(1, 7), (1, 8)]
+
+
+def test_pattern_rule_in_s_b_notation(tmp_path):
+    (tmp_path / "highlife.rle").write_text("x = 3, y = 1, rule = 23/36\n3o!\n")
+    assert CGL.read_pattern_file(tmp_path / "highlife.rle", [], 5, 5) == "B36/S23"
+
+
+@pytest.mark.parametrize("engine_name", ENGINE_NAMES + ("hashlife",))
+def test_headless_run_reads_and_writes_patterns(engine_name, tmp_path):
+    if engine_name in NUMPY_ENGINE_NAMES and CGL.numpy is None:
+        pytest.skip("The " + engine_name + " engine requires NumPy")
+
+    (tmp_path / "glider.rle").write_text("x = 3, y = 3, rule = B3/S23\nbo$2bo$3o!\n")
+    CGL.run_headless(CGL.parse_arguments(["--headless", "--seed-file", str(tmp_path / "glider.rle"),
+                                          "--canvas-height", "40", "--canvas-width", "50",
+                                          "--pattern-offset", "10", "20", "--generations", "12",
+                                          "--engine", engine_name, "--output", str(tmp_path / "end.cells")]))
+
+    seed = []
+    CGL.read_pattern_file(tmp_path / "end.cells", seed, 40, 50, 0, 0)
+    expected_grid = step_grid(create_grid([[y + 10, x + 20] for y, x in GLIDER], 40, 50), 12)
+    assert get_cells(seed) == get_grid_cells(expected_grid)
+
+
+def test_checkpoint_round_trip(tmp_path):
+    seed = [list(cell) for cell in get_grid_cells(create_random_grid(12, 16))]
+    file_path = tmp_path / ("run" + CGL.CHECKPOINT_EXTENSION)
+    random.seed(5)
+    CGL.write_checkpoint_file(file_path, seed, 1234, 12, 16, "torus", "B3/S23")
+    expected_number = random.random()
+
+    random.seed(6)
+    assert CGL.is_checkpoint_file(file_path)
+    binary_seed, generation_number = CGL.read_checkpoint_file(file_path)
+    with binary_seed:
+        assert generation_number == 1234
+        assert (binary_seed.canvas_height, binary_seed.canvas_width) == (12, 16)
+        assert (binary_seed.boundary_mode, binary_seed.rule) == ("torus", "B3/S23")
+        assert get_cells(binary_seed.to_seed()) == get_cells(seed)
+    assert random.random() == expected_number
+
+
+def test_checkpoints_are_saved_every_interval(tmp_path):
+    grid = create_random_grid(16, 16)
+    engine = CGL.create_engine([row[:] for row in grid], "python")
+    checkpointer = CGL.Checkpointer(tmp_path / ("run" + CGL.CHECKPOINT_EXTENSION), 16, 16, interval=7)
+
+    # Starting from generation 3, the checkpoints are due at generations 7 and 14
+    assert CGL.advance_engine_with_checkpoints(engine, 13, checkpointer, 3) == 13
+    assert checkpointer.generation_saved == 14
+    binary_seed, generation_number = CGL.read_checkpoint_file(tmp_path / ("run" + CGL.CHECKPOINT_EXTENSION))
+    with binary_seed:
+        assert generation_number == 14
+        assert binary_seed.to_grid() == step_grid(grid, 11)
+
+    # A requested checkpoint is saved at the next generation the run checks at
+    checkpointer.request()
+    CGL.advance_engine_with_checkpoints(engine, 5, checkpointer, 16)
+    assert checkpointer.generation_saved == 21
+
+
+@pytest.mark.parametrize("engine_name", ("python", "hashlife"))
+def test_checkpoint_resume_matches_uninterrupted_run(tmp_path, monkeypatch, engine_name):
+    # A checkpoint only holds the canvas, and HashLife simulates beyond it, so the soup is kept away from the edges
+    monkeypatch.chdir(tmp_path)
+    seed = [[y + 61, x + 61] for y, x in get_grid_cells(create_random_grid(12, 12, 0.4))]
+    CGL.write_seed_file("seed.seed", seed, 134, 134, "dead", "B3/S23")
+
+    CGL.run_headless(CGL.parse_arguments(["--headless", "--seed-file", "seed.seed", "--generations", "60",
+                                          "--engine", engine_name, "--output", "uninterrupted.seed"]))
+    CGL.run_headless(CGL.parse_arguments(["--headless", "--seed-file", "seed.seed", "--generations", "25",
+                                          "--engine", engine_name, "--checkpoint", "run.checkpoint"]))
+    CGL.run_headless(CGL.parse_arguments(["--headless", "--seed-file", "run.checkpoint", "--generations", "35",
+                                          "--engine", engine_name, "--output", "resumed.seed"]))
+
+    resumed_seed = []
+    uninterrupted_seed = []
+    assert CGL.read_seed_file("resumed.seed", resumed_seed) == CGL.read_seed_file("uninterrupted.seed",
+                                                                                  uninterrupted_seed)
+    assert get_cells(resumed_seed) == get_cells(uninterrupted_seed)
+
+
+@pytest.mark.parametrize("checkpoint", (False, True))
+def test_resumed_run_is_numbered_from_the_checkpoint(tmp_path, capsys, checkpoint):
+    # A blinker and a block, periodic from the generation the checkpoint was saved at
+    seed = [[1, 1], [1, 2], [2, 1], [2, 2], [5, 4], [5, 5], [5, 6]]
+    CGL.write_checkpoint_file(tmp_path / "start.checkpoint", seed, 100, 8, 8)
+    arguments = ["--headless", "--seed-file", str(tmp_path / "start.checkpoint"), "--generations", "11",
+                 "--engine", "python", "--output", str(tmp_path / "end.seed")]
+    if checkpoint:
+        arguments += ["--checkpoint", str(tmp_path / "end.checkpoint")]
+    CGL.run_headless(CGL.parse_arguments(arguments))
+
+    out = capsys.readouterr().out
+    assert "Resuming from generation 100" in out
+    assert "Period 2 since generation 100" in out
+    assert "Final generation: 111" in out
+    assert get_grid_cells(read_seed(tmp_path / "end.seed")) == get_grid_cells(step_grid(create_grid(seed, 8, 8), 11))
+    if checkpoint:
+        binary_seed, generation_number = CGL.read_checkpoint_file(tmp_path / "end.checkpoint")
+        binary_seed.close()
+        assert generation_number == 111
+
+
+def test_exported_frames_are_numbered_from_the_checkpoint(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    seed = [list(cell) for cell in get_grid_cells(create_random_grid(20, 20, 0.3))]
+    CGL.write_checkpoint_file("run.checkpoint", seed, 30, 20, 20)
+
+    CGL.run_headless(CGL.parse_arguments(["--headless", "--seed-file", "run.checkpoint", "--generations", "20",
+                                          "--export", "frames", "--export-stride", "10"]))
+
+    assert sorted(path.name for path in pathlib.Path("frames").iterdir()) ==\
+        ["generation_00000030.png", "generation_00000040.png", "generation_00000050.png"]
+
+
+def test_headless_run_can_not_be_checkpointed_and_exported(tmp_path):
+    write_seed(tmp_path / "start.seed", create_random_grid(8, 8))
+    with pytest.raises(ValueError):
+        CGL.run_headless(CGL.parse_arguments(["--headless", "--seed-file", str(tmp_path / "start.seed"),
+                                              "--checkpoint", str(tmp_path / "run.checkpoint"),
+                                              "--export", str(tmp_path / "frames")]))
+
+
+def test_seed_catalog(tmp_path):
+    seed_dir = tmp_path / "seeds"
+    seed_dir.mkdir()
+    seed = [list(cell) for cell in get_grid_cells(create_random_grid(12, 16))]
+    CGL.write_seed_file(seed_dir / "first.seed", seed, 12, 16)
+    CGL.write_binary_seed_file(seed_dir / ("copy" + CGL.BINARY_SEED_EXTENSION), seed, 12, 16)
+    CGL.write_seed_file(seed_dir / "other.seed", seed[1:], 12, 16)
+    CGL.write_seed_file(seed_dir / "wide.seed", seed, 12, 32)
+
+    catalog = CGL.SeedCatalog(tmp_path / "catalog.sqlite3")
+    try:
+        assert catalog.update(seed_dir) == (4, 0)
+        assert catalog.update(seed_dir) == (0, 0)
+
+        assert [sorted(pathlib.Path(path).name for path in paths) for paths in catalog.find_duplicates()] ==\
+            [["copy" + CGL.BINARY_SEED_EXTENSION, "first.seed"]]
+        assert len(catalog.find(12, 16)) == 3
+        assert [pathlib.Path(row["path"]).name for row in catalog.find(12, 32)] == ["wide.seed"]
+
+        # The outcome is shared by the duplicates, and found by the lifespan
+        content_hash = catalog.index_file(seed_dir / "first.seed")
+        catalog.record_outcome(content_hash, 120, True, 10, 2)
+        assert catalog.get_outcome(catalog.index_file(seed_dir / ("copy" + CGL.BINARY_SEED_EXTENSION)))["period"] == 2
+        assert sorted(pathlib.Path(row["path"]).name for row in catalog.find(min_lifespan=100)) ==\
+            ["copy" + CGL.BINARY_SEED_EXTENSION, "first.seed"]
+        assert catalog.find(max_lifespan=100) == []
+
+        (seed_dir / "other.seed").unlink()
+        assert catalog.update(seed_dir) == (0, 1)
+    finally:
+        catalog.close()
+
+
+def test_hashlife_runs_are_not_catalogued(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    pathlib.Path("seeds").mkdir()
+    # A block and a blinker, which settle with period 2
+    seed = [[1, 1], [1, 2], [2, 1], [2, 2], [5, 4], [5, 5], [5, 6]]
+    CGL.write_seed_file("seeds/block_and_blinker.seed", seed, 8, 8)
+    arguments = ["--headless", "--seed-file", "seeds/block_and_blinker.seed", "--generations", "100", "--catalog",
+                 "--skip-known"]
+
+    CGL.run_headless(CGL.parse_arguments(arguments + ["--engine", "hashlife"]))
+    CGL.run_headless(CGL.parse_arguments(arguments + ["--engine", "python"]))
+    assert "Already known" not in capsys.readouterr().out
+
+    CGL.run_headless(CGL.parse_arguments(arguments + ["--engine", "python"]))
+    assert "with period 2" in capsys.readouterr().out
+
+
+def test_skip_known_seed_that_was_still_changing(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    pathlib.Path("seeds").mkdir()
+    CGL.write_seed_file("seeds/glider.seed", GLIDER, 8, 8, "torus")
+    arguments = ["--headless", "--seed-file", "seeds/glider.seed", "--engine", "python", "--cycle-window", "0",
+                 "--catalog", "--skip-known", "--generations"]
+
+    CGL.run_headless(CGL.parse_arguments(arguments + ["30"]))
+    assert "Outcome recorded in" in capsys.readouterr().out
+
+    # Not knowing how the seed turned out after more generations, it is only skipped for as many or fewer
+    CGL.run_headless(CGL.parse_arguments(arguments + ["30"]))
+    assert "Already known" in capsys.readouterr().out
+    CGL.run_headless(CGL.parse_arguments(arguments + ["50"]))
+    assert "Already known" not in capsys.readouterr().out
+
+    # With another rule it is another seed
+    CGL.run_headless(CGL.parse_arguments(arguments + ["10", "--rule", "B36/S23"]))
+    assert "Outcome recorded in" not in capsys.readouterr().out
+
+
+def record_random_generations(generation_history, canvas_height, canvas_width, generations):
+    """
+    Records random generations one after the other.
+    :return: generations (dict) of the cells alive by generation number
+    """
+    generator = random.Random(2)
+    grid = [[0] * canvas_width for y in range(canvas_height)]
+    generations_recorded = {}
+    for generation_number in range(1, generations + 1):
+        next_grid = [[int(generator.random() < 0.3) for x in range(canvas_width)] for y in range(canvas_height)]
+        cells_to_be_killed = [[y, x] for y, x in get_grid_cells(grid) if not next_grid[y][x]]
+        cells_to_be_revived = [[y, x] for y, x in get_grid_cells(next_grid) if not grid[y][x]]
+        grid = next_grid
+        generation_history.record(generation_number, grid, cells_to_be_killed, cells_to_be_revived)
+        generations_recorded[generation_number] = [list(cell) for cell in get_grid_cells(grid)]
+    return generations_recorded
+
+
+def test_generation_history_get():
+    generation_history = CGL.GenerationHistory(20, keyframe_interval=8)
+    generations_recorded = record_random_generations(generation_history, 15, 20, 60)
+
+    assert (generation_history.oldest_generation, generation_history.newest_generation) == (1, 60)
+    for generation_number, cells in generations_recorded.items():
+        assert generation_history.get(generation_number) == (generation_number, cells)
+    assert generation_history.get(0) == (None, None)
+    assert generation_history.get(100) == (60, generations_recorded[60])
+
+    generation_history.truncate(30)
+    assert generation_history.newest_generation == 30
+    assert generation_history.get(45) == (30, generations_recorded[30])
+
+
+def test_generation_history_get_between_keyframes():
+    generation_history = CGL.GenerationHistory(4)
+    generation_history.record_keyframe(10, create_grid([[0, 0]], 4, 4))
+    generation_history.record_keyframe(50, create_grid([[0, 1]], 4, 4))
+
+    assert generation_history.get(30) == (10, [[0, 0]])
+    assert generation_history.get(50) == (50, [[0, 1]])
+
+
+def test_generation_history_evicts_oldest_first():
+    generation_history = CGL.GenerationHistory(20, keyframe_interval=8)
+    generations_recorded = record_random_generations(generation_history, 15, 20, 60)
+    size = generation_history.size
+
+    generation_history.memory_budget = size // 2
+    generation_history.evict()
+    assert generation_history.size <= size // 2
+    assert generation_history.oldest_generation > 1 and generation_history.newest_generation == 60
+    assert generation_history.get(1) == (None, None)
+    for generation_number in range(generation_history.oldest_generation, 61):
+        assert generation_history.get(generation_number) == (generation_number, generations_recorded[generation_number])
+
+    # The newest segment is kept whatever the budget
+    generation_history.memory_budget = 0
+    generation_history.evict()
+    assert generation_history.newest_generation == 60
+    assert generation_history.get(60) == (60, generations_recorded[60])
+
+
+@pytest.mark.parametrize("indices", ([], [0], [5, 3, 1000, 130000, 129]))
+def test_cell_indices_round_trip(indices):
+    data = b"\x07" + bytes(CGL.encode_cell_indices(indices)) + b"\x07"
+    assert CGL.decode_cell_indices(data, 1) == (sorted(indices), len(data) - 1)
+
+
+def test_cell_history_reset_starts_over_from_the_generation_gone_back_to():
+    grid = create_grid(BLINKER, 6, 6)
+    history = CGL.CellHistory(grid)
+    for generation in range(1, 11):
+        history.update(generation, [], [])
+
+    history.reset(create_grid(GLIDER, 6, 6), 4)
+    assert history.generation == 4
+    for y in range(6):
+        for x in range(6):
+            assert get_recency(history, y, x) == (CGL.HISTORY_LIMIT if [y, x] in GLIDER else 0)
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        CGL.create_engine([[0]], "quantum")